@@ -16,12 +16,17 @@ Usage:
 """
 
 import argparse
+import fnmatch
+import importlib.util
+import json
+import shutil
 import subprocess
 import sys
+import urllib.error
+import urllib.request
 from pathlib import Path
 import tomllib
-import re
-from typing import Optional, Tuple
+from typing import Optional
 
 
 def run_command(
@@ -63,52 +68,21 @@ def get_project_version() -> str:
 
 def get_pypi_version(package_name: str, test_pypi: bool = False) -> Optional[str]:
     """Get latest version from PyPI."""
-    index_url = (
-        "https://test.pypi.org/simple/" if test_pypi else "https://pypi.org/simple/"
-    )
-
-    output = run_command(
-        ["pip", "index", "versions", package_name, "--index-url", index_url],
-        capture=True,
-        check=False,
-    )
+    base_url = "https://test.pypi.org" if test_pypi else "https://pypi.org"
+    url = f"{base_url}/pypi/{package_name}/json"
+    print(f"→ Fetching: {url}")
 
-    if not output or "ERROR" in output:
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            return json.load(response)["info"]["version"]
+    except urllib.error.HTTPError as e:
+        if e.code != 404:
+            print(f"⚠️  Could not query {url}: {e}")
+        # 404: package not published yet (first release)
+        return None
+    except (urllib.error.URLError, TimeoutError, ValueError, KeyError) as e:
+        print(f"⚠️  Could not query {url}: {e}")
         return None
-
-    # Parse version from pip output
-    match = re.search(r"Available versions: ([0-9]+\.[0-9]+\.[0-9]+)", output)
-    if match:
-        return match.group(1)
-
-    # Try alternate format
-    match = re.search(r"([0-9]+\.[0-9]+\.[0-9]+)", output)
-    if match:
-        return match.group(1)
-
-    return None
-
-
-def parse_version(version: str) -> Tuple[int, int, int]:
-    """Parse semantic version string."""
-    parts = version.split(".")
-    return (
-        int(parts[0]) if len(parts) > 0 else 0,
-        int(parts[1]) if len(parts) > 1 else 0,
-        int(parts[2]) if len(parts) > 2 else 0,
-    )
-
-
-def compare_versions(v1: str, v2: str) -> int:
-    """Compare two versions. Returns: -1 if v1<v2, 0 if equal, 1 if v1>v2."""
-    p1 = parse_version(v1)
-    p2 = parse_version(v2)
-
-    if p1 < p2:
-        return -1
-    elif p1 > p2:
-        return 1
-    return 0
 
 
 def check_git_status():
@@ -161,12 +135,17 @@ def clean_build_artifacts():
     """Remove old build artifacts."""
     print("\n🧹 Cleaning build artifacts...")
 
-    dirs_to_clean = ["dist", "build", "*.egg-info"]
-    for pattern in dirs_to_clean:
-        for path in Path(".").glob(pattern):
-            if path.is_dir():
-                run_command(["rm", "-rf", str(path)])
-                print(f"  Removed {path}")
+    dirs_to_clean = ("dist", "build", "*.egg-info")
+    for path in Path(".").iterdir():
+        if any(fnmatch.fnmatch(path.name, p) for p in dirs_to_clean) and path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+            print(f"  Removed {path}")
+
+
+def ensure_module(name: str):
+    """Install a tool with pip only if it is not already importable."""
+    if importlib.util.find_spec(name) is None:
+        run_command([sys.executable, "-m", "pip", "install", "--quiet", name])
 
 
 def build_package():
@@ -174,7 +153,7 @@ def build_package():
     print("\n📦 Building distribution packages...")
 
     # Ensure build tool is installed
-    run_command([sys.executable, "-m", "pip", "install", "--quiet", "build"])
+    ensure_module("build")
 
     # Build the package
     run_command([sys.executable, "-m", "build"])
@@ -194,7 +173,7 @@ def publish_package(test_pypi: bool = False):
     print(f"\n📤 Publishing to {repo_name}...")
 
     # Ensure twine is installed
-    run_command([sys.executable, "-m", "pip", "install", "--quiet", "twine"])
+    ensure_module("twine")
 
     # Upload
     cmd = [sys.executable, "-m", "twine", "upload"]
@@ -260,8 +239,11 @@ def main():
             f"📦 Latest {'TestPyPI' if args.test else 'PyPI'} version: {pypi_version}"
         )
 
-        comparison = compare_versions(current_version, pypi_version)
-        if comparison <= 0:
+        # PEP 440 ordering: 1.2 == 1.2.0, and pre/post releases like 1.0.0rc1
+        ensure_module("packaging")
+        from packaging.version import Version
+
+        if Version(current_version) <= Version(pypi_version):
             print(
                 f"✗ Current version ({current_version}) is not greater than PyPI version ({pypi_version})"
             )
@@ -1,16 +1,14 @@
 """Administrative commands for TASAK."""
 
 import argparse
-import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
 
+from .json_io import read_json, write_json
 from .python_plugins import discover_python_plugins, get_plugin_search_dirs
-from .mcp_real_client import MCPRealClient
-from .schema_manager import SchemaManager
-from .create_command import handle_create_command
 
 
 def setup_admin_subparsers(subparsers):
@@ -125,6 +123,8 @@ def handle_admin_command(args: argparse.Namespace, config: Dict[str, Any]):
         sys.exit(1)
 
     if args.admin_command == "create_command":
+        from .create_command import handle_create_command
+
         handle_create_command(args, config)
     elif args.admin_command == "auth":
         handle_auth(args, config)
@@ -143,9 +143,6 @@ def handle_admin_command(args: argparse.Namespace, config: Dict[str, Any]):
         sys.exit(1)
 
 
-# handle_create_command is now imported from create_command.py
-
-
 def handle_plugins(args: argparse.Namespace, config: Dict[str, Any]):
     """Handle plugin-related admin commands."""
     if not getattr(args, "plugins_command", None):
@@ -220,6 +217,28 @@ def handle_plugins(args: argparse.Namespace, config: Dict[str, Any]):
     sys.exit(1)
 
 
+def _auth_file() -> Path:
+    return Path.home() / ".tasak" / "auth.json"
+
+
+def _load_auth_data() -> Dict[str, Any]:
+    """Read auth.json once; a missing file means no stored tokens."""
+    auth_file = _auth_file()
+    if not auth_file.exists():
+        return {}
+    return read_json(auth_file)
+
+
+def _remove_auth_entry(app_name: str) -> bool:
+    """Drop one app's tokens, rewriting auth.json only if it changed."""
+    auth_data = _load_auth_data()
+    if app_name not in auth_data:
+        return False
+    del auth_data[app_name]
+    write_json(_auth_file(), auth_data)
+    return True
+
+
 def handle_auth(args: argparse.Namespace, config: Dict[str, Any]):
     """Handle authentication management."""
     app_name = args.app
@@ -235,46 +254,45 @@ def handle_auth(args: argparse.Namespace, config: Dict[str, Any]):
 
     if args.check:
         # Check authentication status
-        auth_file = Path.home() / ".tasak" / "auth.json"
-        if auth_file.exists():
-            with open(auth_file, "r") as f:
-                auth_data = json.load(f)
-                if app_name in auth_data:
-                    token_data = auth_data[app_name]
-                    expires_at = token_data.get("expires_at", 0)
-                    if expires_at > 0:
-                        expiry_time = datetime.fromtimestamp(expires_at)
-                        print(f"Authenticated for '{app_name}'")
-                        print(f"Token expires at: {expiry_time}")
-                    else:
-                        print(f"Authenticated for '{app_name}' (no expiry information)")
-                else:
-                    print(f"Not authenticated for '{app_name}'")
+        auth_data = _load_auth_data()
+        if app_name in auth_data:
+            token_data = auth_data[app_name]
+            expires_at = token_data.get("expires_at", 0)
+            if expires_at > 0:
+                expiry_time = datetime.fromtimestamp(expires_at)
+                print(f"Authenticated for '{app_name}'")
+                print(f"Token expires at: {expiry_time}")
+            else:
+                print(f"Authenticated for '{app_name}' (no expiry information)")
         else:
             print(f"Not authenticated for '{app_name}'")
 
     elif args.clear:
         # Clear authentication data
-        auth_file = Path.home() / ".tasak" / "auth.json"
-        if auth_file.exists():
-            with open(auth_file, "r") as f:
-                auth_data = json.load(f)
-
-            if app_name in auth_data:
-                del auth_data[app_name]
-                with open(auth_file, "w") as f:
-                    json.dump(auth_data, f, indent=2)
-                print(f"Authentication data cleared for '{app_name}'")
-            else:
-                print(f"No authentication data found for '{app_name}'")
+        if _remove_auth_entry(app_name):
+            print(f"Authentication data cleared for '{app_name}'")
         else:
             print(f"No authentication data found for '{app_name}'")
 
     elif args.refresh:
-        # Refresh authentication token
+        # Refresh the saved token now, regardless of its expiry
+        from .auth import _load_saved_token, _refresh_access_token
+
         print(f"Refreshing authentication for '{app_name}'...")
-        # This would call the refresh logic from auth.py
-        print("Token refresh not yet implemented")
+        token_data = _load_saved_token(app_name)
+        if not token_data or not token_data.get("refresh_token"):
+            print(
+                f"Error: No refresh token saved for '{app_name}'. "
+                f"Run 'tasak admin auth {app_name}' first.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        if _refresh_access_token(app_name, token_data) is None:
+            print(
+                f"Error: Token refresh failed. Run 'tasak admin auth {app_name}' to sign in again.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
 
     else:
         # Perform authentication
@@ -346,18 +364,20 @@ def handle_refresh(args: argparse.Namespace, config: Dict[str, Any]):
 
 def refresh_app_schema(app_name: str, app_config: Dict[str, Any], force: bool = False):
     """Refresh schema for a specific app."""
+    from .mcp_real_client import MCPRealClient
+    from .schema_manager import SchemaManager
+
     print(f"Refreshing schema for '{app_name}'...")
 
     app_type = app_config.get("type")
 
     if app_type == "mcp":
+        client = MCPRealClient(app_name, app_config)
         # Clear cache if forcing refresh
         if force:
-            client = MCPRealClient(app_name, app_config)
             client.clear_cache()
 
         # Fetch fresh tool definitions
-        client = MCPRealClient(app_name, app_config)
         tools = client.get_tool_definitions()
     elif app_type == "mcp-remote":
         # Use MCPRemoteClient for mcp-remote apps
@@ -402,18 +422,10 @@ def handle_clear(args: argparse.Namespace, config: Dict[str, Any]):
 
     if clear_all or args.auth:
         # Clear authentication
-        auth_file = Path.home() / ".tasak" / "auth.json"
-        if auth_file.exists():
-            with open(auth_file, "r") as f:
-                auth_data = json.load(f)
-
-            if app_name in auth_data:
-                del auth_data[app_name]
-                with open(auth_file, "w") as f:
-                    json.dump(auth_data, f, indent=2)
-                print(f"Authentication cleared for '{app_name}'")
-            else:
-                print(f"No authentication data found for '{app_name}'")
+        if _remove_auth_entry(app_name):
+            print(f"Authentication cleared for '{app_name}'")
+        else:
+            print(f"No authentication data found for '{app_name}'")
 
     if clear_all or args.schema:
         # Clear schema
@@ -439,14 +451,8 @@ def handle_info(args: argparse.Namespace, config: Dict[str, Any]):
     print(f"Name: {app_config.get('name', 'No description')}")
 
     # Check authentication status
-    auth_file = Path.home() / ".tasak" / "auth.json"
-    if auth_file.exists():
-        with open(auth_file, "r") as f:
-            auth_data = json.load(f)
-            if app_name in auth_data:
-                print("Authentication: Yes")
-            else:
-                print("Authentication: No")
+    if app_name in _load_auth_data():
+        print("Authentication: Yes")
     else:
         print("Authentication: No")
 
@@ -459,12 +465,14 @@ def handle_info(args: argparse.Namespace, config: Dict[str, Any]):
         print("Cache: Not cached")
 
     # Check schema status using SchemaManager
+    from .schema_manager import SchemaManager
+
     schema_manager = SchemaManager()
     schema_data = schema_manager.load_schema(app_name)
     if schema_data:
         last_updated = schema_data.get("last_updated", "Unknown")
         tool_count = len(schema_data.get("tools", {}))
-        age_days = schema_manager.get_schema_age_days(app_name)
+        age_days = schema_manager.get_schema_age_days(app_name, schema_data)
         if age_days is not None:
             print(f"Schema: {tool_count} tools ({age_days} days old)")
         else:
@@ -473,6 +481,15 @@ def handle_info(args: argparse.Namespace, config: Dict[str, Any]):
         print("Schema: Not available")
 
 
+def _list_dir_names(directory: Path) -> set:
+    """Return the names of entries in a directory, or an empty set if missing."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
 def handle_list(args: argparse.Namespace, config: Dict[str, Any]):
     """List all configured applications."""
     apps_config = config.get("apps_config", {})
@@ -485,6 +502,12 @@ def handle_list(args: argparse.Namespace, config: Dict[str, Any]):
     print("\nConfigured Applications:")
     print("-" * 60)
 
+    # Gather auth, cache and schema state once instead of per app
+    tasak_dir = Path.home() / ".tasak"
+    auth_data = _load_auth_data()
+    cached_files = _list_dir_names(tasak_dir / "cache")
+    schema_files = _list_dir_names(tasak_dir / "schemas")
+
     for app_name in sorted(enabled_apps):
         app_config = config.get(app_name, {})
         app_type = app_config.get("type", "unknown")
@@ -492,22 +515,11 @@ def handle_list(args: argparse.Namespace, config: Dict[str, Any]):
 
         status_parts = []
 
-        # Check authentication
-        auth_file = Path.home() / ".tasak" / "auth.json"
-        if auth_file.exists():
-            with open(auth_file, "r") as f:
-                auth_data = json.load(f)
-                if app_name in auth_data:
-                    status_parts.append("auth")
-
-        # Check cache
-        cache_file = Path.home() / ".tasak" / "cache" / f"{app_name}.json"
-        if cache_file.exists():
+        if app_name in auth_data:
+            status_parts.append("auth")
+        if f"{app_name}.json" in cached_files:
             status_parts.append("cached")
-
-        # Check schema
-        schema_file = Path.home() / ".tasak" / "schemas" / f"{app_name}.json"
-        if schema_file.exists():
+        if f"{app_name}.json" in schema_files:
             status_parts.append("schema")
 
         status = f"[{', '.join(status_parts)}]" if status_parts else "[no data]"
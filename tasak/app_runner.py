@@ -1,7 +1,10 @@
+import os
 import subprocess
 import sys
 from typing import Any, Dict, List
 
+_READ_CHUNK_SIZE = 65536
+
 
 def run_cmd_app(app_config: Dict[str, Any], app_args: List[str]):
     """Runs a 'cmd' type application in proxy mode."""
@@ -29,9 +32,45 @@ def _run_proxy_mode(app_config: Dict[str, Any], app_args: List[str]):
         command_list = list(base_command)
 
     full_command = command_list + app_args
+    if _can_exec():
+        # Nothing to post-process: hand the terminal straight to the command
+        _exec_command(full_command)
+        return
     _execute_command(full_command)
 
 
+def _can_exec() -> bool:
+    """True when the command may replace this process instead of being piped.
+
+    On Windows exec spawns a child and exits, so the caller's wait on tasak
+    would return early; keep the piped path there.
+    """
+    return os.name != "nt" and _stdout_is_tty()
+
+
+def _stdout_is_tty() -> bool:
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def _exec_command(command: List[str]):
+    """Replaces the current process with the command (no pipe, native TTY)."""
+    print(f"Running command: {' '.join(command)}", file=sys.stderr)
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    try:
+        os.execvp(command[0], command)
+    except FileNotFoundError:
+        print(f"Error: Command not found: {command[0]}", file=sys.stderr)
+        sys.exit(1)
+    except OSError as e:
+        print(f"An error occurred: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
 def _execute_command(command: List[str]):
     """Executes a command and streams its output."""
     print(f"Running command: {' '.join(command)}", file=sys.stderr)
@@ -41,13 +80,9 @@ def _execute_command(command: List[str]):
             command,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True,
         )
 
-        for line in process.stdout:
-            print(line, end="")
+        _stream_output(process.stdout)
 
         process.wait()
         if process.returncode != 0:
@@ -63,3 +98,22 @@ def _execute_command(command: List[str]):
     except Exception as e:
         print(f"An error occurred: {e}", file=sys.stderr)
         sys.exit(1)
+
+
+def _stream_output(pipe):
+    """Copies raw bytes from the child's pipe to stdout in large chunks."""
+    fd = pipe.fileno()
+    os.set_blocking(fd, True)
+    sys.stdout.flush()
+    out = getattr(sys.stdout, "buffer", None)
+
+    while True:
+        chunk = os.read(fd, _READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        if out is not None:
+            out.write(chunk)
+            out.flush()
+        else:
+            sys.stdout.write(chunk.decode(errors="replace"))
+            sys.stdout.flush()
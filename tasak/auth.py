@@ -1,24 +1,41 @@
-import http.server
-import socketserver
-import webbrowser
-import requests
-import json
+import socket
 from pathlib import Path
 import os
 import sys
 import argparse
+import random
+import re
 import time
-from urllib.parse import urlparse, parse_qs, unquote
+from urllib.parse import unquote, unquote_plus
 from .oauth_discovery import get_oauth_config_for_service
 from .dynamic_registration import register_oauth_client, get_saved_registration
 from .pkce import generate_pkce_pair
+from .json_io import read_json, write_json
 
 # --- Constants ---
 AUTH_FILE_PATH = Path.home() / ".tasak" / "auth.json"
+# Treat tokens this close to expiry as already expired
+TOKEN_EXPIRY_MARGIN = 60
+# Random extra margin so concurrent invocations don't all refresh at once
+TOKEN_EXPIRY_JITTER = 30
+DEFAULT_ATLASSIAN_CLIENT_ID = "5Dzgchq9CCu2EIgv"
+_CODE_RE = re.compile(r"[?&]code=([^&#\s]*)")
 
-# --- Global variables for OAuth flow ---
-authorization_code = None
-code_verifier = None  # For PKCE
+# --- Module state ---
+_token_http_session = None  # Shared keep-alive session for token endpoints
+# ((path, mtime_ns, size), tokens) of the last auth.json read or written
+_auth_file_cache = None
+
+
+def _token_session():
+    """Returns a requests.Session reused across token endpoint calls."""
+    global _token_http_session
+    if _token_http_session is None:
+        import requests
+
+        _token_http_session = requests.Session()
+        _token_http_session.headers["User-Agent"] = "TASAK/1.0"
+    return _token_http_session
 
 
 def _is_verbose() -> bool:
@@ -31,63 +48,123 @@ def _is_verbose() -> bool:
     )
 
 
-class OAuthCallbackHandler(http.server.SimpleHTTPRequestHandler):
-    """HTTP handler to capture the OAuth 2.1 authorization code."""
+def _http_response(status: str, body: bytes) -> bytes:
+    return (
+        f"HTTP/1.1 {status}\r\n"
+        "Content-Type: text/html\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    ).encode("ascii") + body
+
+
+_CALLBACK_OK = _http_response(
+    "200 OK",
+    b"<h1>Authentication successful!</h1><p>You can close this window.</p>",
+)
+_CALLBACK_FAILED = _http_response(
+    "400 Bad Request",
+    b"<h1>Authentication failed.</h1><p>No authorization code found.</p>",
+)
+# Browsers often fetch the favicon alongside the redirect; answer it cheaply
+_CALLBACK_NO_CONTENT = _http_response("204 No Content", b"")
+
+
+def _open_callback_socket(port: int = 0) -> socket.socket:
+    """Listens on localhost for the OAuth redirect (port 0 picks a free one)."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("127.0.0.1", port))
+        sock.listen(1)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _read_http_request(conn: socket.socket) -> bytes:
+    """Reads one request head from a connection."""
+    data = b""
+    while b"\r\n\r\n" not in data and len(data) < 65536:
+        chunk = conn.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def _request_path(request: bytes) -> str:
+    """Returns the target of an HTTP request line ("" if malformed)."""
+    parts = request.split(b"\r\n", 1)[0].decode("latin-1").split(" ")
+    return parts[1] if len(parts) > 1 else ""
 
-    def do_GET(self):
-        global authorization_code
 
-        # Log the full request only in verbose mode
+def _extract_authorization_code(request: bytes) -> str | None:
+    """Returns the decoded ``code`` query parameter of an HTTP request head."""
+    path = _request_path(request)
+
+    # Log the full request only in verbose mode
+    if _is_verbose():
+        print(f"DEBUG: Received callback request: {path[:100]}...", file=sys.stderr)
+
+    match = _CODE_RE.search(path)
+    if not match or not match.group(1):
+        return None
+
+    # Get the raw code first (form-decoded once, as a query parser would)
+    raw_code = unquote_plus(match.group(1))
+    if _is_verbose():
+        print(f"DEBUG: Raw authorization code: {raw_code[:50]}...", file=sys.stderr)
+
+    # Decode the authorization code (it might be URL-encoded multiple times)
+    code = raw_code
+    decode_count = 0
+    while "%" in code and decode_count < 5:  # Limit decoding attempts
+        decoded = unquote(code)
+        if decoded == code:
+            break
+        code = decoded
+        decode_count += 1
         if _is_verbose():
             print(
-                f"DEBUG: Received callback request: {self.path[:100]}...",
+                f"DEBUG: After decode #{decode_count}: {code[:50]}...",
                 file=sys.stderr,
             )
 
-        query_components = parse_qs(urlparse(self.path).query)
-        if "code" in query_components:
-            # Get the raw code first
-            raw_code = query_components["code"][0]
-            if _is_verbose():
-                print(
-                    f"DEBUG: Raw authorization code: {raw_code[:50]}...",
-                    file=sys.stderr,
-                )
-
-            # Decode the authorization code (it might be URL-encoded multiple times)
-            code = raw_code
-            decode_count = 0
-            while "%" in code and decode_count < 5:  # Limit decoding attempts
-                decoded = unquote(code)
-                if decoded == code:
-                    break
-                code = decoded
-                decode_count += 1
-                if _is_verbose():
-                    print(
-                        f"DEBUG: After decode #{decode_count}: {code[:50]}...",
-                        file=sys.stderr,
-                    )
-
-            authorization_code = code
-            if _is_verbose():
-                print(
-                    f"DEBUG: Final authorization code format: {code[:50]}...",
-                    file=sys.stderr,
-                )
-            self.send_response(200)
-            self.send_header("Content-type", "text/html")
-            self.end_headers()
-            self.wfile.write(
-                b"<h1>Authentication successful!</h1><p>You can close this window.</p>"
-            )
-        else:
-            self.send_response(400)
-            self.send_header("Content-type", "text/html")
-            self.end_headers()
-            self.wfile.write(
-                b"<h1>Authentication failed.</h1><p>No authorization code found.</p>"
-            )
+    if _is_verbose():
+        print(
+            f"DEBUG: Final authorization code format: {code[:50]}...",
+            file=sys.stderr,
+        )
+    return code
+
+
+def _wait_for_authorization_code(sock: socket.socket) -> str:
+    """Accepts redirect requests until one carries an authorization code."""
+    while True:
+        conn, _ = sock.accept()
+        with conn:
+            request = _read_http_request(conn)
+            if _request_path(request).startswith("/favicon.ico"):
+                conn.sendall(_CALLBACK_NO_CONTENT)
+                continue
+            code = _extract_authorization_code(request)
+            conn.sendall(_CALLBACK_OK if code else _CALLBACK_FAILED)
+        if code:
+            return code
+
+
+def _open_browser_for_login(auth_url: str, port: int):
+    """Prints the login instructions in one flushed write, then opens the URL."""
+    import webbrowser
+
+    print(
+        "\nYour browser should open for authentication.\n"
+        f"If it doesn't, please open this URL manually:\n{auth_url}\n"
+        f"\nWaiting for authentication... (Listening on port {port})",
+        flush=True,
+    )
+    webbrowser.open(auth_url)
 
 
 def run_auth_app(app_name: str, server_url: str = None, client_id: str = None):
@@ -132,53 +209,160 @@ def _do_generic_oauth_auth(app_name: str, server_url: str, client_id: str):
         # For demo, we'll request some basic scopes
         scopes = metadata["scopes_supported"][:3]
 
-    # Find a free port for the redirect URI
-    with socketserver.TCPServer(("localhost", 0), None) as s:
-        free_port = s.server_address[1]
+    # Listen on a free port for the redirect URI
+    try:
+        callback_sock = _open_callback_socket()
+    except OSError as e:
+        print(f"An error occurred: {e}", file=sys.stderr)
+        return
+    # The listener is closed on every exit path, including Ctrl-C
+    try:
+        with callback_sock:
+            free_port = callback_sock.getsockname()[1]
 
-    redirect_uri = f"http://localhost:{free_port}"
-    scope_str = "%20".join(scopes) if scopes else ""
+            redirect_uri = f"http://localhost:{free_port}"
+            scope_str = "%20".join(scopes) if scopes else ""
 
-    auth_url = (
-        f"{auth_endpoint}?"
-        f"client_id={client_id}&"
-        f"redirect_uri={redirect_uri}&"
-        f"response_type=code&"
-    )
-    if scope_str:
-        auth_url += f"scope={scope_str}&"
-    auth_url += "state=tasak-auth-state"
-
-    print("\nYour browser should open for authentication.")
-    sys.stdout.flush()
-    print(f"If it doesn't, please open this URL manually:\n{auth_url}")
-    sys.stdout.flush()
-    webbrowser.open(auth_url)
+            auth_url = (
+                f"{auth_endpoint}?"
+                f"client_id={client_id}&"
+                f"redirect_uri={redirect_uri}&"
+                f"response_type=code&"
+            )
+            if scope_str:
+                auth_url += f"scope={scope_str}&"
+            auth_url += "state=tasak-auth-state"
 
-    global authorization_code
-    authorization_code = None
-    httpd = None
-    try:
-        socketserver.TCPServer.allow_reuse_address = True
-        with socketserver.TCPServer(("", free_port), OAuthCallbackHandler) as httpd:
-            print(f"\nWaiting for authentication... (Listening on port {free_port})")
-            sys.stdout.flush()
-            while authorization_code is None:
-                httpd.handle_request()
+            _open_browser_for_login(auth_url, free_port)
+
+            authorization_code = _wait_for_authorization_code(callback_sock)
 
         print("Authorization code received. Exchanging for access token...")
         _exchange_code_for_token(
-            authorization_code, redirect_uri, token_endpoint, client_id, code_verifier
+            authorization_code, redirect_uri, token_endpoint, client_id
         )
 
     except Exception as e:
         print(f"An error occurred: {e}", file=sys.stderr)
-        if httpd:
-            httpd.server_close()
+
+
+def _auth_file_key(st: os.stat_result) -> tuple:
+    return (AUTH_FILE_PATH, st.st_mtime_ns, st.st_size)
+
+
+def _load_all_tokens() -> dict:
+    """Returns every saved token, re-parsing auth.json only if it changed."""
+    global _auth_file_cache
+    try:
+        key = _auth_file_key(AUTH_FILE_PATH.stat())
+    except FileNotFoundError:
+        return {}
+    if _auth_file_cache is None or _auth_file_cache[0] != key:
+        _auth_file_cache = (key, read_json(AUTH_FILE_PATH))
+    return _auth_file_cache[1]
+
+
+def _load_saved_token(app_name: str) -> dict | None:
+    """Returns the raw saved token entry for app_name, if any."""
+    try:
+        return _load_all_tokens().get(app_name)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _token_expires_at(token_data: dict) -> float | None:
+    expires_at = token_data.get("expires_at")
+    if expires_at is None and "obtained_at" in token_data:
+        # Tokens saved before expires_at was stamped
+        expires_at = token_data["obtained_at"] + token_data.get("expires_in", 3600)
+    return expires_at
+
+
+def _load_valid_token(app_name: str) -> dict | None:
+    """Returns a usable token for app_name, silently refreshing it if needed.
+
+    Tokens within TOKEN_EXPIRY_MARGIN (plus up to TOKEN_EXPIRY_JITTER) of
+    expiry are refreshed with the saved refresh token; None means the
+    interactive flow is required.
+    """
+    token_data = _load_saved_token(app_name)
+    if not token_data or not token_data.get("access_token"):
+        return None
+
+    expires_at = _token_expires_at(token_data)
+    margin = TOKEN_EXPIRY_MARGIN + random.uniform(0, TOKEN_EXPIRY_JITTER)
+    if expires_at is not None and expires_at - time.time() > margin:
+        return token_data
+
+    if token_data.get("refresh_token"):
+        return _refresh_access_token(app_name, token_data)
+    return None
+
+
+def _refresh_access_token(app_name: str, token_data: dict) -> dict | None:
+    """Exchanges the saved refresh token for a new access token."""
+    import requests
+
+    token_url = token_data.get("token_url")
+    client_id = token_data.get("client_id")
+    if not token_url:
+        token_url = get_oauth_config_for_service(app_name).get("token_url")
+    if not client_id:
+        saved_reg = get_saved_registration(app_name) or {}
+        client_id = saved_reg.get("client_id", DEFAULT_ATLASSIAN_CLIENT_ID)
+    if not token_url:
+        return None
+
+    # The expired access token is deliberately not sent
+    payload = {
+        "grant_type": "refresh_token",
+        "client_id": client_id,
+        "refresh_token": token_data["refresh_token"],
+    }
+    headers = {"Accept": "application/json", "User-Agent": "TASAK/1.0"}
+    try:
+        response = _token_session().post(
+            token_url, data=payload, headers=headers, timeout=30
+        )
+    except requests.RequestException as e:
+        if _is_verbose():
+            print(f"DEBUG: Token refresh failed: {e}", file=sys.stderr)
+        return None
+
+    if response.status_code != 200:
+        if _is_verbose():
+            print(
+                f"DEBUG: Token refresh rejected with status {response.status_code}",
+                file=sys.stderr,
+            )
+        return None
+
+    try:
+        new_token_data = response.json()
+    except ValueError:
+        # e.g. a proxy or captive-portal HTML page served with 200
+        new_token_data = None
+    if not isinstance(new_token_data, dict) or not new_token_data.get("access_token"):
+        if _is_verbose():
+            print("DEBUG: Token refresh returned no access token", file=sys.stderr)
+        return None
+
+    # Refresh tokens may be single-use; keep the old one if none was issued
+    new_token_data.setdefault("refresh_token", token_data["refresh_token"])
+    new_token_data["token_url"] = token_url
+    new_token_data["client_id"] = client_id
+    new_token_data["obtained_at"] = int(time.time())
+    _save_token(app_name, new_token_data)
+    print("Access token refreshed.", file=sys.stderr)
+    return new_token_data
 
 
 def _do_atlassian_auth():
     """Handles the full OAuth 2.1 flow for Atlassian."""
+    if _load_valid_token("atlassian"):
+        print("Already authenticated with Atlassian; saved token is still valid.")
+        return
+
     # Get OAuth configuration (with dynamic discovery)
     config = get_oauth_config_for_service("atlassian")
 
@@ -217,11 +401,11 @@ def _do_atlassian_auth():
         if not client_id:
             # Fall back to hardcoded client ID if dynamic registration fails
             print("Dynamic registration failed, using default client ID")
-            client_id = config.get("client_id", "5Dzgchq9CCu2EIgv")
+            client_id = config.get("client_id", DEFAULT_ATLASSIAN_CLIENT_ID)
 
     # Use static client ID as last resort
     if not client_id:
-        client_id = config.get("client_id", "5Dzgchq9CCu2EIgv")
+        client_id = config.get("client_id", DEFAULT_ATLASSIAN_CLIENT_ID)
 
     auth_endpoint = config.get("auth_url")
     token_endpoint = config.get("token_url")
@@ -236,47 +420,40 @@ def _do_atlassian_auth():
         print(f"  Available scopes: {', '.join(config['available_scopes'][:5])}...")
 
     # Use required port for Atlassian (5598) or find a free port
-    free_port = config.get("required_port", None)
-    if free_port:
-        print(f"Using Atlassian-required port {free_port} for OAuth callback")
-    else:
-        with socketserver.TCPServer(("localhost", 0), None) as s:
-            free_port = s.server_address[1]
-
-    redirect_uri = f"http://localhost:{free_port}"
-    scope_str = "%20".join(scopes)
-
-    # Generate PKCE challenge for Atlassian
-    global code_verifier, authorization_code
-    authorization_code = None
-    code_verifier, code_challenge = generate_pkce_pair()
-    print("Using PKCE with challenge method S256")
-
-    auth_url = (
-        f"{auth_endpoint}?"
-        f"client_id={client_id}&"
-        f"redirect_uri={redirect_uri}&"
-        f"response_type=code&"
-        f"scope={scope_str}&"
-        f"state=tasak-auth-state&"
-        f"code_challenge={code_challenge}&"
-        f"code_challenge_method=S256"
-    )
+    required_port = config.get("required_port", None)
+    if required_port:
+        print(f"Using Atlassian-required port {required_port} for OAuth callback")
+    try:
+        callback_sock = _open_callback_socket(required_port or 0)
+    except OSError as e:
+        print(f"An error occurred: {e}", file=sys.stderr)
+        return
+    # The listener is closed on every exit path, including Ctrl-C
+    try:
+        with callback_sock:
+            free_port = callback_sock.getsockname()[1]
+
+            redirect_uri = f"http://localhost:{free_port}"
+            scope_str = "%20".join(scopes)
+
+            # Generate PKCE challenge for Atlassian (kept local to this flow)
+            code_verifier, code_challenge = generate_pkce_pair()
+            print("Using PKCE with challenge method S256")
+
+            auth_url = (
+                f"{auth_endpoint}?"
+                f"client_id={client_id}&"
+                f"redirect_uri={redirect_uri}&"
+                f"response_type=code&"
+                f"scope={scope_str}&"
+                f"state=tasak-auth-state&"
+                f"code_challenge={code_challenge}&"
+                f"code_challenge_method=S256"
+            )
 
-    print("\nYour browser should open for authentication.")
-    sys.stdout.flush()
-    print(f"If it doesn't, please open this URL manually:\n{auth_url}")
-    sys.stdout.flush()
-    webbrowser.open(auth_url)
+            _open_browser_for_login(auth_url, free_port)
 
-    httpd = None
-    try:
-        socketserver.TCPServer.allow_reuse_address = True
-        with socketserver.TCPServer(("", free_port), OAuthCallbackHandler) as httpd:
-            print(f"\nWaiting for authentication... (Listening on port {free_port})")
-            sys.stdout.flush()
-            while authorization_code is None:
-                httpd.handle_request()
+            authorization_code = _wait_for_authorization_code(callback_sock)
 
         print("Authorization code received. Exchanging for access token...")
         _exchange_code_for_token(
@@ -285,8 +462,6 @@ def _do_atlassian_auth():
 
     except Exception as e:
         print(f"An error occurred: {e}", file=sys.stderr)
-        if httpd:
-            httpd.server_close()
 
 
 def _exchange_code_for_token(
@@ -335,7 +510,10 @@ def _exchange_code_for_token(
     if _is_verbose():
         print(f"DEBUG: Encoded payload: {encoded_payload[:100]}...")
 
-    response = requests.post(token_url, data=encoded_payload, headers=headers)
+    session = _token_session()
+    response = session.post(
+        token_url, data=encoded_payload, headers=headers, timeout=30
+    )
 
     if response.status_code != 200:
         print(f"ERROR: Token exchange failed with status {response.status_code}")
@@ -352,12 +530,17 @@ def _exchange_code_for_token(
                         f"DEBUG: Trying with just the token part: {alternate_code[:20]}..."
                     )
                 payload["code"] = alternate_code
-                response = requests.post(token_url, data=payload, headers=headers)
+                response = session.post(
+                    token_url, data=payload, headers=headers, timeout=30
+                )
 
     if response.status_code == 200:
         token_data = response.json()
         # Add timestamp for token expiry calculation
         token_data["obtained_at"] = int(time.time())
+        # Remember where to refresh this token without rediscovery
+        token_data["token_url"] = token_url
+        token_data["client_id"] = client_id
         _save_token("atlassian", token_data)
         print("Successfully authenticated and saved tokens.")
         print(
@@ -374,24 +557,22 @@ def _exchange_code_for_token(
 
 def _save_token(app_name: str, token_data: dict):
     """Saves the token data to the auth file."""
+    global _auth_file_cache
     AUTH_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-    all_tokens = {}
-    if AUTH_FILE_PATH.exists():
-        with open(AUTH_FILE_PATH, "r") as f:
-            all_tokens = json.load(f)
+    # Copy so a failed write never leaves the cached tokens modified
+    all_tokens = dict(_load_all_tokens())
 
-    all_tokens[app_name] = token_data
+    # Stamp an absolute expiry so validity checks don't need obtained_at math
+    if "access_token" in token_data and "expires_at" not in token_data:
+        token_data["expires_at"] = int(time.time() + token_data.get("expires_in", 3600))
 
-    with open(AUTH_FILE_PATH, "w") as f:
-        json.dump(all_tokens, f, indent=2)
+    all_tokens[app_name] = token_data
 
-    # Set file permissions (Unix-like systems only)
-    try:
-        os.chmod(AUTH_FILE_PATH, 0o600)
-    except (OSError, AttributeError):
-        # Windows doesn't support chmod the same way
-        pass
+    # Atomic replace with a 0600 file, so a crash never truncates the saved
+    # tokens and the secrets are never readable at umask perms
+    st = write_json(AUTH_FILE_PATH, all_tokens, mode=0o600)
+    _auth_file_cache = (_auth_file_key(st), all_tokens)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,41 @@
+import functools
+import hashlib
+import logging
 import os
+import pickle
+import tempfile
 from pathlib import Path
-import yaml
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_safe_loader():
+    """Return libyaml's CSafeLoader when PyYAML was built with it.
+
+    yaml is imported lazily so a config-cache hit never pays for it.
+    """
+    import yaml
+
+    try:
+        return yaml.CSafeLoader
+    except AttributeError:
+        logger.warning(
+            "PyYAML was built without libyaml; config parsing will be slower."
+        )
+        return yaml.SafeLoader
+
+
+def _load_yaml(f):
+    """Parse YAML with the libyaml-backed loader when available."""
+    import yaml
+
+    return yaml.load(f, Loader=_yaml_safe_loader())
+
+
+def _read_config_file(path: Path):
+    """Read a config file in one call and parse it from the in-memory buffer."""
+    return _load_yaml(path.read_bytes())
 
 
 def get_config_filename() -> str:
@@ -10,74 +45,221 @@ def get_config_filename() -> str:
 
 def get_global_config_path() -> Path | None:
     """Returns the path to the global config file, if it exists."""
-    home_dir = Path.home()
-    config_name = get_config_filename()
-    config_path = home_dir / ".tasak" / config_name
+    return _global_config_path_for(str(Path.home()), get_config_filename())
+
+
+@functools.lru_cache(maxsize=16)
+def _global_config_path_for(home_dir: str, config_name: str) -> Path | None:
+    config_path = Path(home_dir) / ".tasak" / config_name
     return config_path if config_path.exists() else None
 
 
-def find_local_config_paths() -> list[Path]:
-    """Finds all local config files by traversing up the directory tree."""
-    search_paths = []
-    current_dir = Path.cwd()
-    config_name = get_config_filename()
+def _scan_dir_for_configs(directory: Path, config_name: str) -> list[Path]:
+    """Return config files found in one directory (.tasak/ first).
 
-    while True:
-        # Support both direct file and in .tasak directory
-        direct_config = current_dir / config_name
-        dot_tasak_config = current_dir / ".tasak" / config_name
+    Lists the directory once instead of stat-ing each candidate path; falls
+    back to per-path checks for directories that are traversable but not
+    readable.
+    """
+    found = []
+    try:
+        with os.scandir(directory) as it:
+            entries = {e.name: e for e in it}
+    except OSError:
+        dot_tasak_config = directory / ".tasak" / config_name
+        direct_config = directory / config_name
+        return [p for p in (dot_tasak_config, direct_config) if p.exists()]
 
+    dot_tasak = entries.get(".tasak")
+    if dot_tasak is not None and dot_tasak.is_dir():
+        dot_tasak_config = directory / ".tasak" / config_name
         if dot_tasak_config.exists():
-            search_paths.append(dot_tasak_config)
+            found.append(dot_tasak_config)
+
+    direct = entries.get(config_name)
+    if direct is not None and direct.is_file():
+        found.append(directory / config_name)
+
+    return found
+
+
+def find_local_config_paths(start_dir: Path | None = None) -> list[Path]:
+    """Finds all local config files by traversing up from start_dir (default: cwd)."""
+    start = Path(start_dir) if start_dir is not None else Path.cwd()
+    return list(_find_local_config_paths_for(str(start), get_config_filename()))
 
-        if direct_config.exists():
-            search_paths.append(direct_config)
+
+@functools.lru_cache(maxsize=16)
+def _find_local_config_paths_for(cwd: str, config_name: str) -> tuple[Path, ...]:
+    """Memoized directory walk; returns an immutable tuple for the cache."""
+    search_paths = []
+    current_dir = Path(cwd)
+
+    while True:
+        # Support both direct file and in .tasak directory
+        search_paths.extend(_scan_dir_for_configs(current_dir, config_name))
 
         if current_dir.parent == current_dir:  # Reached the root
             break
 
         current_dir = current_dir.parent
 
-    return list(reversed(search_paths))  # Return in order from root to cwd
+    return tuple(reversed(search_paths))  # Return in order from root to cwd
+
 
+def _config_cache_dir() -> Path:
+    return Path.home() / ".tasak" / "cache"
 
-def load_and_merge_configs() -> dict:
+
+def _config_signature(paths: list[Path]) -> tuple:
+    """Identify a set of config files by (path, mtime_ns, size)."""
+    signature = []
+    for path in paths:
+        st = os.stat(path)
+        signature.append((str(path), st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
+def _config_cache_path(sources: list[Path]) -> Path:
+    """One cache file per set of source paths.
+
+    Edits only change the signature stored inside the file, so rewriting it
+    replaces the old entry instead of adding a new file per edit.
+    """
+    key = repr([str(p) for p in sources])
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return _config_cache_dir() / f"config.{digest}.pkl"
+
+
+def _read_config_cache(cache_path: Path, signature: tuple) -> dict | None:
+    try:
+        with open(cache_path, "rb") as f:
+            cached_signature, merged = pickle.load(f)
+    except Exception:
+        # A missing, truncated or incompatible cache is simply a miss
+        return None
+    if cached_signature != signature:
+        return None
+    return merged
+
+
+def _write_config_cache(cache_path: Path, signature: tuple, merged: dict) -> None:
+    """Atomically persist the merged config; failures are non-fatal."""
+    tmp_name = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=cache_path.parent, prefix=".config-", delete=False
+        ) as f:
+            tmp_name = f.name
+            pickle.dump((signature, merged), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_path)
+    except OSError as e:
+        logger.debug("Could not write config cache %s: %s", cache_path, e)
+        if tmp_name:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+def load_and_merge_configs(start_dir: Path | None = None) -> dict:
     """
     Loads all configs and merges them.
     The loading priority is as follows:
     1. If TASAK_CONFIG environment variable is set, load only that file.
     2. Otherwise, load global config (~/.tasak/tasak.yaml).
-    3. Then, load local configs (tasak.yaml or .tasak/tasak.yaml) from the
-       current directory up to the root, merging them in order.
+    3. Then, load local configs (tasak.yaml or .tasak/tasak.yaml) from
+       start_dir (the current directory by default) up to the root, merging
+       them in order.
+
+    The merged result is cached in ~/.tasak/cache keyed by the path, mtime and
+    size of every input file, so YAML is only parsed when a config changes.
     """
     # 1. Check for TASAK_CONFIG environment variable
+    env_config_path = None
     if config_path_str := os.environ.get("TASAK_CONFIG"):
         config_path = Path(config_path_str)
         if config_path.exists():
-            with open(config_path, "r") as f:
-                return yaml.safe_load(f) or {}
+            env_config_path = config_path
         # If the env var points to a non-existent file, fall back to standard search
         # instead of returning an empty config (more resilient in CI environments).
 
-    # If no env var, proceed with the original logic
+    if env_config_path is not None:
+        global_config_path = None
+        local_config_paths = []
+        sources = [env_config_path]
+    else:
+        global_config_path = get_global_config_path()
+        # ordered from root -> start_dir
+        local_config_paths = find_local_config_paths(start_dir)
+        sources = ([global_config_path] if global_config_path else []) + list(
+            local_config_paths
+        )
+
+    if not sources:
+        return {}
+
+    try:
+        signature = _config_signature(sources)
+    except OSError:
+        signature = None
+
+    if signature is not None:
+        cache_path = _config_cache_path(sources)
+        cached = _read_config_cache(cache_path, signature)
+        if cached is not None:
+            return cached
+
+    if env_config_path is not None:
+        merged_config = _read_config_file(env_config_path) or {}
+    else:
+        merged_config = _merge_config_files(global_config_path, local_config_paths)
+
+    if signature is not None:
+        _write_config_cache(cache_path, signature, merged_config)
+    return merged_config
+
+
+def _deep_merge(dst: dict, src: dict) -> dict:
+    """Merge src into dst in place; nested dicts merge, anything else is replaced.
+
+    Uses an explicit stack rather than recursion. Dicts from src are copied
+    into dst rather than shared, so a YAML alias (several keys pointing at one
+    mapping) can't carry a later override over to its other keys.
+    """
+    stack = [(dst, src)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, dict):
+                existing = target.get(key)
+                if not isinstance(existing, dict):
+                    existing = target[key] = {}
+                stack.append((existing, value))
+            else:
+                target[key] = value
+    return dst
+
+
+def _merge_config_files(
+    global_config_path: Path | None, local_config_paths: list[Path]
+) -> dict:
+    """Parse and merge the global and local configs, honouring isolation."""
     merged_config = {}
 
-    # 2. Load global config (may be ignored later if isolation applies)
-    global_config_path = get_global_config_path()
+    # Load global config (may be ignored later if isolation applies)
     global_config = None
     if global_config_path:
-        with open(global_config_path, "r") as f:
-            global_config = yaml.safe_load(f)
+        global_config = _read_config_file(global_config_path)
 
-    # 3. Discover local configs and apply isolation semantics
-    local_config_paths = find_local_config_paths()  # ordered from root -> cwd
+    # Each local file is parsed once and reused for isolation and merging
+    local_configs = [_read_config_file(p) for p in local_config_paths]
 
     # Detect nearest isolation flag scanning from cwd backwards
     isolate_index: int | None = None
-    for idx in range(len(local_config_paths) - 1, -1, -1):
-        p = local_config_paths[idx]
-        with open(p, "r") as f:
-            data = yaml.safe_load(f) or {}
+    for idx in range(len(local_configs) - 1, -1, -1):
+        data = local_configs[idx] or {}
         apps_cfg = data.get("apps_config", {}) or {}
         if bool(apps_cfg.get("isolate", False)):
             isolate_index = idx
@@ -87,18 +269,14 @@ def load_and_merge_configs() -> dict:
     if isolate_index is None:
         # No isolation: include global then local (root -> cwd)
         if global_config:
-            merged_config.update(global_config)
-        for path in local_config_paths:
-            with open(path, "r") as f:
-                local_config = yaml.safe_load(f)
-                if local_config:
-                    merged_config.update(local_config)
+            _deep_merge(merged_config, global_config)
+        for local_config in local_configs:
+            if local_config:
+                _deep_merge(merged_config, local_config)
     else:
         # Isolation found at local_config_paths[isolate_index]: ignore global and any parents above
-        for path in local_config_paths[isolate_index:]:
-            with open(path, "r") as f:
-                local_config = yaml.safe_load(f)
-                if local_config:
-                    merged_config.update(local_config)
+        for local_config in local_configs[isolate_index:]:
+            if local_config:
+                _deep_merge(merged_config, local_config)
 
     return merged_config
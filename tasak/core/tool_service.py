@@ -1,10 +1,11 @@
-import json
+import functools
 import os
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import asyncio
+from ..json_io import loads, read_json
 from .connection_manager import ConnectionManager
 from .config import (
     CACHE_TTL as DEFAULT_CACHE_TTL,
@@ -24,6 +25,57 @@ def _env_int(name: str, default: int) -> int:
 AUTH_FILE_PATH = Path.home() / ".tasak" / "auth.json"
 
 
+def _expand_vars(value: Any) -> Any:
+    """Expand ${VAR} references in the strings of a parsed JSON value."""
+    if isinstance(value, str):
+        return os.path.expandvars(value) if "$" in value else value
+    if isinstance(value, dict):
+        return {_expand_vars(k): _expand_vars(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_expand_vars(v) for v in value]
+    return value
+
+
+@functools.lru_cache(maxsize=16)
+def _read_mcp_config(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse an MCP config file; keyed by mtime/size so edits invalidate the entry."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if b"$" not in raw:
+        return loads(raw)
+    try:
+        return _expand_vars(loads(raw))
+    except ValueError:
+        # ${VAR} used outside a JSON string, e.g. as a bare number
+        return loads(os.path.expandvars(raw.decode("utf-8")))
+
+
+@functools.lru_cache(maxsize=4)
+def _read_auth_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse auth.json; keyed by mtime/size so saved tokens invalidate the entry."""
+    return read_json(path)
+
+
+def load_mcp_config(path: str) -> Dict[str, Any]:
+    """Load an MCP config file with ${VAR} expansion, cached per process.
+
+    Returns a shallow copy so callers may replace top-level keys. Raises
+    OSError or ValueError when the file is missing or not valid JSON.
+    """
+    st = os.stat(path)
+    return dict(_read_mcp_config(path, st.st_mtime_ns, st.st_size))
+
+
+def load_auth_tokens() -> Dict[str, Any]:
+    """Load all saved tokens, re-reading auth.json only after it changes.
+
+    The result is shared between calls and must be treated as read-only.
+    """
+    path = str(AUTH_FILE_PATH)
+    st = os.stat(path)
+    return _read_auth_file(path, st.st_mtime_ns, st.st_size)
+
+
 class ToolService:
     """Facade providing list/call operations over a ConnectionManager.
 
@@ -51,9 +103,7 @@ class ToolService:
 
                 expanded = os.path.expandvars(expanduser(cfg_path))
                 try:
-                    with open(expanded, "r") as f:
-                        raw = f.read()
-                    mcp_config = json.loads(os.path.expandvars(raw))
+                    mcp_config = load_mcp_config(expanded)
                 except Exception:
                     # Fallback defaults
                     mcp_config = {
@@ -75,11 +125,8 @@ class ToolService:
         return mcp_config
 
     def _get_access_token(self, app_name: str) -> Optional[str]:
-        if not AUTH_FILE_PATH.exists():
-            return None
         try:
-            with open(AUTH_FILE_PATH, "r") as f:
-                all_tokens = json.load(f)
+            all_tokens = load_auth_tokens()
             token_data = all_tokens.get(app_name)
             if not token_data:
                 return None
@@ -8,7 +8,7 @@ with `list_tools()` and `call_tool()` coroutines and a no-op `__aexit__`.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Awaitable, Dict, List
 
 
 class MCPRemoteSessionAdapter:
@@ -42,8 +42,8 @@ class MCPRemoteSessionAdapter:
 
         return _Resp(tools)
 
-    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
-        return await self._pool.call_tool(
+    def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Awaitable[Any]:
+        return self._pool.call_tool(
             self.app_name, self.server_url, tool_name, arguments
         )
 
@@ -5,6 +5,11 @@ import platform
 import stat
 import sys
 import yaml
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper
 from pathlib import Path
 from typing import Any, Dict
 import argparse
@@ -102,7 +107,6 @@ This command uses {command_name}.yaml instead of tasak.yaml
 
 import os
 import sys
-import subprocess
 import shutil
 
 # Set environment variables to tell TASAK which config and display name to use
@@ -117,11 +121,13 @@ def _run():
         tasak_main()
         return 0
     except Exception:
-        # Fallbacks: PATH binary first, then python -m tasak.main
+        # Fallbacks: PATH binary first, then python -m tasak.main. exec
+        # replaces this process instead of keeping a waiting parent around.
+        sys.stdout.flush()
         bin_path = shutil.which("tasak")
         if bin_path:
-            return subprocess.call([bin_path] + sys.argv[1:])
-        return subprocess.call([sys.executable, "-m", "tasak.main"] + sys.argv[1:])
+            os.execv(bin_path, [bin_path] + sys.argv[1:])
+        os.execv(sys.executable, [sys.executable, "-m", "tasak.main"] + sys.argv[1:])
 
 if __name__ == "__main__":
     sys.exit(_run())
@@ -167,44 +173,53 @@ if __name__ == "__main__":
             print(f"   ./{command_name}")
 
 
+def _write_new_yaml(path: Path, data: Dict[str, Any]) -> bool:
+    """Write data to path only if it does not exist yet; return True if written.
+
+    O_EXCL makes the existence check and the create a single atomic open.
+    """
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return False
+    with os.fdopen(fd, "w") as f:
+        yaml.dump(
+            data, f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False
+        )
+    return True
+
+
 def _create_example_configs(command_name: str) -> list[str]:
     """Create example configuration files for the custom command."""
     config_locations = []
 
-    # Check local directory
+    # Local directory: keep an existing config untouched
     local_config = Path.cwd() / f"{command_name}.yaml"
-    if not local_config.exists():
-        example_config = {
-            "header": f"{command_name.upper()} Command Suite",
-            "apps_config": {"enabled_apps": ["hello", "status"]},
-            "hello": {
-                "name": "Hello World",
-                "type": "cmd",
-                "meta": {"command": f"echo 'Hello from {command_name}!'"},
-            },
-            "status": {
-                "name": "Status Check",
-                "type": "cmd",
-                "meta": {"command": "echo 'All systems operational'"},
-            },
-        }
-
-        with open(local_config, "w") as f:
-            yaml.safe_dump(example_config, f, default_flow_style=False, sort_keys=False)
+    example_config = {
+        "header": f"{command_name.upper()} Command Suite",
+        "apps_config": {"enabled_apps": ["hello", "status"]},
+        "hello": {
+            "name": "Hello World",
+            "type": "cmd",
+            "meta": {"command": f"echo 'Hello from {command_name}!'"},
+        },
+        "status": {
+            "name": "Status Check",
+            "type": "cmd",
+            "meta": {"command": "echo 'All systems operational'"},
+        },
+    }
+    if _write_new_yaml(local_config, example_config):
         config_locations.append(str(local_config))
 
-    # Check global directory
+    # Global directory: create a minimal config if none exists
     global_config = Path.home() / ".tasak" / f"{command_name}.yaml"
-    if not global_config.exists():
-        global_config.parent.mkdir(parents=True, exist_ok=True)
-        # Create minimal global config
-        global_example = {
-            "header": f"Global {command_name} configuration",
-            "apps_config": {"enabled_apps": []},
-        }
-
-        with open(global_config, "w") as f:
-            yaml.safe_dump(global_example, f, default_flow_style=False, sort_keys=False)
+    global_config.parent.mkdir(parents=True, exist_ok=True)
+    global_example = {
+        "header": f"Global {command_name} configuration",
+        "apps_config": {"enabled_apps": []},
+    }
+    if _write_new_yaml(global_config, global_example):
         config_locations.append(str(global_config))
 
     return config_locations
@@ -6,7 +6,6 @@ Supports CMD commands, MCP tools, and composite workflows.
 """
 
 import argparse
-import json
 import re
 import subprocess
 import sys
@@ -14,6 +13,7 @@ from typing import Any, Dict, List
 from dataclasses import dataclass
 
 from .config import load_and_merge_configs
+from .json_io import print_json
 from .mcp_real_client import MCPRealClient
 from .core.tool_service import ToolService
 from typing import Optional
@@ -46,6 +46,23 @@ class CuratedMCPRemoteShim:
 # Export compatibility symbol for tests; points to shim by default
 MCPRemoteClient = CuratedMCPRemoteShim
 
+_PARAM_TYPES = {"str": str, "int": int, "float": float, "bool": bool}
+
+
+def _param_kwargs(param: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate a param config into argparse kwargs without mutating it."""
+    kwargs = {key: value for key, value in param.items() if key != "name"}
+
+    # Only pass `required` when set; argparse rejects it for positionals
+    if not kwargs.get("required"):
+        kwargs.pop("required", None)
+
+    if kwargs.get("action") == "store_true":
+        kwargs.pop("type", None)  # Remove type for store_true
+    elif kwargs.get("type") in _PARAM_TYPES:
+        kwargs["type"] = _PARAM_TYPES[kwargs["type"]]
+    return kwargs
+
 
 @dataclass
 class CuratedCommand:
@@ -149,29 +166,8 @@ class CuratedApp:
                 prog=f"{self.app_name} {command.name}", description=command.description
             )
 
-            type_map = {"str": str, "int": int, "float": float, "bool": bool}
-
             for param in command.params:
-                param_copy = param.copy()
-                param_name = param_copy.pop("name")
-
-                # Handle special keys
-                required = param_copy.pop("required", False)
-                help_text = param_copy.pop("help", None)
-
-                if param_copy.get("action") == "store_true":
-                    param_copy.pop("type", None)  # Remove type for store_true
-
-                param_type_str = param_copy.get("type")
-                if param_type_str in type_map:
-                    param_copy["type"] = type_map[param_type_str]
-
-                if required:
-                    parser.add_argument(
-                        param_name, help=help_text, required=True, **param_copy
-                    )
-                else:
-                    parser.add_argument(param_name, help=help_text, **param_copy)
+                parser.add_argument(param["name"], **_param_kwargs(param))
 
             parsed_args, unknown = parser.parse_known_args(args)
             if unknown:
@@ -305,7 +301,7 @@ class CuratedApp:
             # Print result if not captured
             if not backend.get("capture") and result:
                 if isinstance(result, dict):
-                    print(json.dumps(result, indent=2))
+                    print_json(result, indent=True)
                 else:
                     print(result)
 
@@ -20,6 +20,14 @@ CLIENT_VERBOSE = (
 DISABLE_AUTOSTART_FILE = Path.home() / ".tasak" / "daemon.disabled"
 
 
+class DaemonError(RuntimeError):
+    """A daemon request failed; the message says why."""
+
+
+class DaemonUnavailable(DaemonError):
+    """The daemon could not be reached, so the request was never handled."""
+
+
 class DaemonClient:
     """Client for communicating with TASAK daemon."""
 
@@ -120,6 +128,14 @@ class DaemonClient:
 
     def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Call a tool through the daemon."""
+        try:
+            return self.request_tool_call(tool_name, arguments)
+        except DaemonError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+
+    def request_tool_call(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Call a tool through the daemon, raising DaemonError on failure."""
         try:
             # Prepare request with config in body
             request_data = {
@@ -138,31 +154,28 @@ class DaemonClient:
                 json=request_data,
                 timeout=TIMEOUT,
             )
+        except requests.exceptions.ConnectTimeout as e:
+            raise DaemonUnavailable("Could not connect to daemon") from e
+        except requests.exceptions.Timeout as e:
+            # The daemon may still be running the tool; don't retry it
+            raise DaemonError("Daemon request timed out") from e
+        except requests.exceptions.ConnectionError as e:
+            raise DaemonUnavailable("Could not connect to daemon") from e
+        except Exception as e:
+            raise DaemonError(f"Error communicating with daemon: {e}") from e
 
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("success"):
-                    return data.get("result")
-                else:
-                    error = data.get("error", "Unknown error")
-                    print(f"Tool execution failed: {error}", file=sys.stderr)
-                    sys.exit(1)
-            else:
-                print(
-                    f"Error calling tool through daemon: {response.status_code}",
-                    file=sys.stderr,
-                )
-                sys.exit(1)
-
-        except requests.exceptions.Timeout:
-            print("Daemon request timed out", file=sys.stderr)
-            sys.exit(1)
-        except requests.exceptions.ConnectionError:
-            print("Could not connect to daemon", file=sys.stderr)
-            sys.exit(1)
+        if response.status_code != 200:
+            raise DaemonError(
+                f"Error calling tool through daemon: {response.status_code}"
+            )
+        try:
+            data = response.json()
         except Exception as e:
-            print(f"Error communicating with daemon: {e}", file=sys.stderr)
-            sys.exit(1)
+            raise DaemonError(f"Error communicating with daemon: {e}") from e
+        if not data.get("success"):
+            error = data.get("error", "Unknown error")
+            raise DaemonError(f"Tool execution failed: {error}")
+        return data.get("result")
 
 
 def get_mcp_client(app_name: str, app_config: Dict[str, Any]) -> Any:
@@ -77,7 +77,7 @@ async def periodic_cleanup():
         except asyncio.CancelledError:
             break
         except Exception as e:
-            logger.error(f"Error in periodic cleanup: {e}")
+            logger.error("Error in periodic cleanup: %s", e)
 
 
 # Create FastAPI app
@@ -99,7 +99,11 @@ async def log_requests(request: Request, call_next):
     except Exception:
         status = "?"
     logger.debug(
-        f"HTTP {request.method} {request.url.path} -> {status} in {duration_ms:.1f}ms"
+        "HTTP %s %s -> %s in %.1fms",
+        request.method,
+        request.url.path,
+        status,
+        duration_ms,
     )
     return response
 
@@ -175,12 +179,12 @@ async def metrics():
 async def list_tools(app_name: str, config: Dict[str, Any] = None):
     """List available tools for an app."""
     try:
-        logger.debug(f"[tools] list requested app={app_name}")
+        logger.debug("[tools] list requested app=%s", app_name)
         tools = await TOOL_SERVICE.list_tools_with_config_async(app_name, config or {})
         return {"tools": tools}
 
     except Exception as e:
-        logger.error(f"[tools] error listing tools for {app_name}: {e}")
+        logger.error("[tools] error listing tools for %s: %s", app_name, e)
         # Metrics are tracked in the core manager; respond with HTTP 500
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -193,7 +197,11 @@ async def call_tool(app_name: str, request: ToolRequest):
     for attempt in range(1, attempts + 1):
         try:
             logger.debug(
-                f"[tools] call requested app={app_name} tool={request.tool_name} (try {attempt}/{attempts})"
+                "[tools] call requested app=%s tool=%s (try %s/%s)",
+                app_name,
+                request.tool_name,
+                attempt,
+                attempts,
             )
             result = await TOOL_SERVICE.call_tool_with_config_async(
                 app_name,
@@ -206,7 +214,12 @@ async def call_tool(app_name: str, request: ToolRequest):
         except Exception as e:
             last_error = e
             logger.warning(
-                f"[tools] call failed app={app_name} tool={request.tool_name} (try {attempt}/{attempts}): {e}"
+                "[tools] call failed app=%s tool=%s (try %s/%s): %s",
+                app_name,
+                request.tool_name,
+                attempt,
+                attempts,
+                e,
             )
             # No per-connection metrics here; core tracks within manager
 
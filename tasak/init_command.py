@@ -4,6 +4,11 @@ import sys
 from pathlib import Path
 import yaml
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper
+
 
 TEMPLATES = {
     "basic": {
@@ -230,9 +235,10 @@ def init_config(template_name: str = "basic", location: str = "local") -> None:
     # Write config
     try:
         with open(config_path, "w") as f:
-            yaml.safe_dump(
+            yaml.dump(
                 template["config"],
                 f,
+                Dumper=_SafeDumper,
                 default_flow_style=False,
                 sort_keys=False,
                 allow_unicode=True,
@@ -0,0 +1,97 @@
+"""JSON helpers that use orjson when it is installed, else the stdlib."""
+
+import json
+import mmap
+import os
+import secrets
+import sys
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install tasak[fast]
+    orjson = None
+
+# Below this size a plain read is cheaper than setting up a mapping
+_MMAP_MIN_SIZE = 64 * 1024
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, optionally indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse a JSON file in one call.
+
+    With orjson, large files are memory-mapped and parsed in place instead
+    of being copied into a bytes object first.
+    """
+    if orjson is None:
+        return json.loads(Path(path).read_bytes())
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+            return orjson.loads(f.read())
+        with (
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            memoryview(mm) as view,
+        ):
+            return orjson.loads(view)
+
+
+def write_json(
+    path: Path, obj: Any, indent: bool = False, mode: int | None = None
+) -> os.stat_result:
+    """Serialize obj and atomically replace path with it.
+
+    The data is written to a uniquely named sibling temp file and renamed over
+    path, so readers never see a torn file and concurrent writers never share
+    a temp file. The file gets mode when given (e.g. 0o600 for secrets),
+    otherwise an existing file keeps its permissions. Returns the stat of the
+    written file.
+    """
+    path = Path(path)
+    if mode is None:
+        try:
+            mode = path.stat().st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o666
+    tmp_path = path.with_name(f"{path.name}.{secrets.token_hex(6)}.tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+        with os.fdopen(fd, "wb") as f:
+            f.write(dumps(obj, indent=indent))
+            f.flush()
+            os.fsync(f.fileno())
+            st = os.fstat(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return st
+
+
+def print_json(obj: Any, indent: bool = False) -> None:
+    """Print obj as JSON, writing the encoded bytes straight to stdout."""
+    data = dumps(obj, indent=indent) + b"\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # e.g. a StringIO stand-in
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    # Keep ordering with text already written through sys.stdout
+    sys.stdout.flush()
+    buffer.write(data)
@@ -1,18 +1,13 @@
-import argparse
 import atexit
 import sys
 import os
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from tasak.admin_commands import setup_admin_subparsers, handle_admin_command
-from tasak.app_runner import run_cmd_app
 from tasak.config import load_and_merge_configs
-from tasak.python_plugins import integrate_plugins_into_config, run_python_plugin
-from tasak.curated_app import run_curated_app
-from tasak.mcp_client import run_mcp_app
-from tasak.mcp_remote_runner import run_mcp_remote_app
-from tasak.docs_app import run_docs_app
-from tasak.init_command import handle_init_command
+from tasak.python_plugins import integrate_plugins_into_config
+
+# App runners and admin/init handlers are imported inside their branches so
+# that each invocation only loads the transport it actually uses.
 
 
 def _cleanup_pool():
@@ -88,6 +83,74 @@ def _get_binary_name() -> str:
     return "tasak"
 
 
+# Top-level flags recognized anywhere before "--"; everything else is forwarded
+_MAIN_FLAGS = {
+    "-h": "help",
+    "--help": "help",
+    "-l": "list_apps",
+    "--list-apps": "list_apps",
+    "--debug": "debug",
+}
+
+
+def _parse_main_args(argv: List[str]) -> Tuple[Optional[str], Set[str], List[str]]:
+    """Split argv into the app name, top-level flags and pass-through args.
+
+    Replaces argparse's parse_known_args on the hot path: the first
+    positional is the app name, known flags are collected, and every other
+    argument is forwarded to the app in order.
+    """
+    app_name = None
+    flags = set()
+    unknown = []
+    args = iter(argv)
+    for arg in args:
+        if arg == "--":
+            rest = list(args)
+            if app_name is None and rest:
+                app_name = rest.pop(0)
+            unknown.extend(rest)
+            break
+        flag = _MAIN_FLAGS.get(arg)
+        if flag:
+            flags.add(flag)
+        elif app_name is None and (arg == "-" or not arg.startswith("-")):
+            app_name = arg
+        else:
+            unknown.append(arg)
+    return app_name, flags, unknown
+
+
+def _print_main_help(binary: str):
+    """Print top-level usage; the parser is built only when help is shown."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog=binary,
+        description="TASAK: The Agent's Swiss Army Knife. A command-line proxy for AI agents.",
+        epilog=f"Run '{binary} <app_name> --help' to see help for a specific application.",
+        add_help=False,
+    )
+    parser.add_argument(
+        "app_name",
+        nargs="?",
+        help="The name of the application to run. If not provided, lists available apps.",
+    )
+    parser.add_argument(
+        "-h", "--help", action="store_true", help="Show this help message and exit."
+    )
+    parser.add_argument(
+        "--list-apps", "-l", action="store_true", help="List available applications"
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Debug mode: bypass daemon, show detailed logs and timing",
+    )
+    parser.print_help()
+    print(f"\n💡 Quick start: Run '{binary} --init' to create a configuration")
+
+
 def main():
     """Main entry point for the TASAK application."""
     # Register cleanup on exit
@@ -98,6 +161,8 @@ def main():
     if len(sys.argv) > 1:
         # Handle --init command
         if sys.argv[1] == "--init" or sys.argv[1] == "-i":
+            import argparse
+
             parser = argparse.ArgumentParser(prog=binary)
             parser.add_argument(
                 "--init",
@@ -113,6 +178,8 @@ def main():
                 help="Create global configuration instead of local",
             )
             args = parser.parse_args()
+            from tasak.init_command import handle_init_command
+
             handle_init_command(args)
             return
 
@@ -126,11 +193,10 @@ def main():
                 print("TASAK version: development")
             return
 
-    config = load_and_merge_configs()
-
-    # Check if first argument is 'daemon'
+    # Check if first argument is 'daemon' (needs no config)
     if len(sys.argv) > 1 and sys.argv[1] == "daemon":
         # Handle daemon commands
+        import argparse
         from .daemon.manager import handle_daemon_command
 
         parser = argparse.ArgumentParser(
@@ -179,6 +245,9 @@ def main():
 
     # Check if first argument is 'admin'
     if len(sys.argv) > 1 and sys.argv[1] == "admin":
+        import argparse
+        from tasak.admin_commands import setup_admin_subparsers, handle_admin_command
+
         # Handle admin commands with a dedicated parser
         parser = argparse.ArgumentParser(
             prog=f"{binary} admin", description="Administrative commands for TASAK"
@@ -190,75 +259,50 @@ def main():
         # Set up admin subcommands
         setup_admin_subparsers(subparsers)
 
-        # Parse admin args (skip 'tasak' and 'admin')
+        # Parse admin args (skip 'tasak' and 'admin'); --help exits here
         args = parser.parse_args(sys.argv[2:])
+        # create_command writes its own files and never reads the app config
+        if getattr(args, "admin_command", None) == "create_command":
+            config = {}
+        else:
+            config = load_and_merge_configs()
         handle_admin_command(args, config)
         return
 
-    # Regular app handling (backward compatible)
-    parser = argparse.ArgumentParser(
-        prog=binary,
-        description="TASAK: The Agent's Swiss Army Knife. A command-line proxy for AI agents.",
-        epilog=f"Run '{binary} <app_name> --help' to see help for a specific application.",
-        add_help=False,  # Disable default help to allow sub-app help handling
-    )
-
-    parser.add_argument(
-        "app_name",
-        nargs="?",
-        help="The name of the application to run. If not provided, lists available apps.",
-    )
-    # Add a custom help argument
-    parser.add_argument(
-        "-h", "--help", action="store_true", help="Show this help message and exit."
-    )
-    # Add --list-apps for scripting/completions
-    parser.add_argument(
-        "--list-apps", "-l", action="store_true", help="List available applications"
-    )
-    # Add --debug flag for testing
-    parser.add_argument(
-        "--debug",
-        action="store_true",
-        help="Debug mode: bypass daemon, show detailed logs and timing",
-    )
-
-    args, unknown_args = parser.parse_known_args()
+    # Regular app handling: plain argv scan, argparse is only built for help
+    app_name, flags, unknown_args = _parse_main_args(sys.argv[1:])
 
     # Set debug mode globally
-    if args.debug:
-        import os
-
+    if "debug" in flags:
         os.environ["TASAK_DEBUG"] = "1"
         print("🔍 Debug mode enabled", file=sys.stderr)
 
-    # Manual help handling
-    if args.help and not args.app_name:
-        parser.print_help()
-        print(f"\n💡 Quick start: Run '{binary} --init' to create a configuration")
+    # Manual help handling (needs no config)
+    if "help" in flags and not app_name:
+        _print_main_help(binary)
         return
 
+    config = load_and_merge_configs()
+
     # Augment with discovered python plugins (ladder-based) for regular app flow
     config = integrate_plugins_into_config(config)
 
     # Handle --list-apps
-    if args.list_apps or (not args.app_name):
-        _list_available_apps(config, simple=args.list_apps)
+    if "list_apps" in flags or not app_name:
+        _list_available_apps(config, simple="list_apps" in flags)
         return
 
     # If help is requested for a specific app, pass it on
-    if args.help:
+    if "help" in flags:
         unknown_args.append("--help")
 
-    app_name = args.app_name
     apps_config = config.get("apps_config", {})
     enabled_apps = apps_config.get("enabled_apps", [])
 
     if app_name not in enabled_apps:
         # If user requested help for a non-enabled/unknown app, show top-level help gracefully
-        if args.help:
-            parser.print_help()
-            print(f"\n💡 Quick start: Run '{binary} --init' to create a configuration")
+        if "help" in flags:
+            _print_main_help(binary)
             return
         print(
             f"❌ Error: App '{app_name}' is not enabled or does not exist.",
@@ -287,16 +331,28 @@ def main():
 
     app_type = app_config.get("type")
     if app_type == "cmd":
+        from tasak.app_runner import run_cmd_app
+
         run_cmd_app(app_config, unknown_args)
     elif app_type == "curated":
+        from tasak.curated_app import run_curated_app
+
         run_curated_app(app_name, app_config, unknown_args)
     elif app_type == "mcp":
+        from tasak.mcp_client import run_mcp_app
+
         run_mcp_app(app_name, app_config, unknown_args)
     elif app_type == "mcp-remote":
+        from tasak.mcp_remote_runner import run_mcp_remote_app
+
         run_mcp_remote_app(app_name, app_config, unknown_args)
     elif app_type == "python-plugin":
+        from tasak.python_plugins import run_python_plugin
+
         run_python_plugin(app_name, app_config, unknown_args)
     elif app_type == "docs":
+        from tasak.docs_app import run_docs_app
+
         run_docs_app(app_name, app_config, unknown_args)
     else:
         print(
@@ -306,58 +362,73 @@ def main():
         sys.exit(1)
 
 
+_EMPTY: Dict[str, Any] = {}
+
+_TYPE_ICONS = {
+    "cmd": "⚡",
+    "mcp": "🔌",
+    "mcp-remote": "☁️",
+    "curated": "🎯",
+    "python-plugin": "🐍",
+}
+
+_NO_APPS_HELP = """  (none)
+
+📭 No applications configured yet!
+
+💡 Get started:
+  1. Run 'tasak --init' to create a configuration
+  2. Or create ~/.tasak/tasak.yaml manually
+
+Example configuration:
+  apps_config:
+    enabled_apps: [hello]
+  hello:
+    type: cmd
+    meta:
+      command: 'echo Hello World'
+
+🔐 Tip: For cloud servers, authenticate first:
+   tasak admin auth atlassian
+"""
+
+
 def _list_available_apps(config: Dict[str, Any], simple: bool = False):
-    """Lists all enabled applications from the configuration."""
+    """Lists all enabled applications from the configuration.
+
+    The listing is built in memory and written with a single call.
+    """
     apps_config = config.get("apps_config", {})
     enabled_apps = apps_config.get("enabled_apps", [])
 
     if simple:
         # Simple mode for shell completions
-        for app_name in sorted(enabled_apps):
-            print(f"  {app_name}")
+        sys.stdout.write("".join(f"  {name}\n" for name in sorted(enabled_apps)))
         return
 
-    # Full display mode
-    print("🚀 TASAK - The Agent's Swiss Army Knife")
-    print("=" * 50)
-
-    # Always show the section header so helpers can rely on it
-    print("\n📦 Available apps:")
+    # Full display mode; always show the section header so helpers can rely on it
+    header = (
+        f"🚀 TASAK - The Agent's Swiss Army Knife\n{'=' * 50}\n\n📦 Available apps:\n"
+    )
 
     if not enabled_apps:
         # No apps configured: show friendly guidance and an example
-        print("  (none)")
-        print("\n📭 No applications configured yet!")
-        print("\n💡 Get started:")
-        print("  1. Run 'tasak --init' to create a configuration")
-        print("  2. Or create ~/.tasak/tasak.yaml manually")
-        print("\nExample configuration:")
-        print("  apps_config:")
-        print("    enabled_apps: [hello]")
-        print("  hello:")
-        print("    type: cmd")
-        print("    meta:")
-        print("      command: 'echo Hello World'")
-        # Helpful hint that also surfaces common real apps
-        print("\n🔐 Tip: For cloud servers, authenticate first:")
-        print("   tasak admin auth atlassian")
+        sys.stdout.write(header + _NO_APPS_HELP)
         return
+
+    lines = []
+    get = config.get
     for app_name in sorted(enabled_apps):
-        app_info = config.get(app_name, {})
+        app_info = get(app_name) or _EMPTY
         app_type = app_info.get("type", "N/A")
         app_description = app_info.get("name", "No description")
-        type_icon = {
-            "cmd": "⚡",
-            "mcp": "🔌",
-            "mcp-remote": "☁️",
-            "curated": "🎯",
-            "python-plugin": "🐍",
-        }.get(app_type, "📋")
-        print(f"  {type_icon} {app_name:<20} ({app_type}) - {app_description}")
+        type_icon = _TYPE_ICONS.get(app_type, "📋")
+        lines.append(f"  {type_icon} {app_name:<20} ({app_type}) - {app_description}")
 
     b = _get_binary_name()
-    print(f"\n💡 Usage: {b} <app_name> [arguments]")
-    print(f"   Help:  {b} <app_name> --help")
+    lines.append(f"\n💡 Usage: {b} <app_name> [arguments]")
+    lines.append(f"   Help:  {b} <app_name> --help")
+    sys.stdout.write(header + "\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -1,23 +1,21 @@
-import argparse
-import json
 import os
+import random
 import sys
 import time
 from pathlib import Path
 from typing import Any, Dict, List
-import requests
-import asyncio
-from mcp import ClientSession
-from mcp.client.stdio import stdio_client, StdioServerParameters
 
-from .mcp_real_client import MCPRealClient
+# asyncio, requests, the mcp SDK and the schema/real-client modules are
+# imported inside the branches that need them to keep cold start cheap.
 from .mcp_parser import parse_mcp_args, show_tool_help, show_simplified_app_help
-from .schema_manager import SchemaManager
+from .json_io import print_json, read_json
 
 CACHE_EXPIRATION_SECONDS = 15 * 60  # 15 minutes
 AUTH_FILE_PATH = Path.home() / ".tasak" / "auth.json"
 ATLASSIAN_TOKEN_URL = "https://mcp.atlassian.com/oauth2/token"
 ATLASSIAN_CLIENT_ID = "5Dzgchq9CCu2EIgv"
+TOKEN_EXPIRY_MARGIN = 60
+TOKEN_EXPIRY_JITTER = 30
 
 
 def run_mcp_app(app_name: str, app_config: Dict[str, Any], app_args: List[str]):
@@ -38,6 +36,8 @@ def run_mcp_app(app_name: str, app_config: Dict[str, Any], app_args: List[str]):
                 )
                 sys.exit(1)
             mcp_config = _load_mcp_config(mcp_config_path)
+            import asyncio
+
             asyncio.run(run_interactive_session_async(app_name, mcp_config))
         except KeyboardInterrupt:
             print("\nInteractive session terminated by user.", file=sys.stderr)
@@ -81,10 +81,7 @@ def run_mcp_app(app_name: str, app_config: Dict[str, Any], app_args: List[str]):
             only_tool = zero_arg_tools[0]["name"]
             try:
                 result = client.call_tool(only_tool, {})
-                if isinstance(result, (dict, list)):
-                    print(json.dumps(result, indent=2))
-                else:
-                    print(result)
+                _print_result(result)
             except Exception as e:
                 print(f"Error executing tool: {e}", file=sys.stderr)
                 sys.exit(1)
@@ -99,6 +96,7 @@ def run_mcp_app(app_name: str, app_config: Dict[str, Any], app_args: List[str]):
         # If tool defs are missing, make a best-effort direct fetch bypassing cache
         if not tool_defs:
             try:
+                import asyncio
                 from .core.tool_service import ToolService
 
                 tool_defs = asyncio.run(
@@ -147,10 +145,7 @@ def run_mcp_app(app_name: str, app_config: Dict[str, Any], app_args: List[str]):
                 client = get_mcp_client(app_name, app_config)
                 try:
                     result = client.call_tool(candidate_tool, {})
-                    if isinstance(result, (dict, list)):
-                        print(json.dumps(result, indent=2))
-                    else:
-                        print(result)
+                    _print_result(result)
                 except Exception as e:
                     print(f"Error executing tool: {e}", file=sys.stderr)
                     sys.exit(1)
@@ -181,17 +176,21 @@ def run_mcp_app(app_name: str, app_config: Dict[str, Any], app_args: List[str]):
 
     try:
         result = client.call_tool(tool_name, tool_args)
-
-        if isinstance(result, dict) or isinstance(result, list):
-            print(json.dumps(result, indent=2))
-        else:
-            print(result)
+        _print_result(result)
     except Exception as e:
         # This should rarely happen as MCPRealClient handles most errors
         print(f"Error executing tool: {e}", file=sys.stderr)
         sys.exit(1)
 
 
+def _print_result(result: Any):
+    """Prints a tool result, as indented JSON when it is a dict or list."""
+    if isinstance(result, (dict, list)):
+        print_json(result, indent=True)
+    else:
+        print(result)
+
+
 def _get_tool_defs_for_list(
     app_name: str, app_config: Dict[str, Any]
 ) -> List[Dict[str, Any]]:
@@ -199,10 +198,12 @@ def _get_tool_defs_for_list(
 
     Prefers cached schema if age < 1 day; otherwise fetches via daemon client and saves.
     """
+    from .schema_manager import SchemaManager
+
     schema_manager = SchemaManager()
     schema_data = schema_manager.load_schema(app_name)
     if schema_data:
-        age_days = schema_manager.get_schema_age_days(app_name) or 0
+        age_days = schema_manager.get_schema_age_days(app_name, schema_data) or 0
         if age_days < 1:
             return schema_manager.convert_to_tool_list(schema_data)
 
@@ -226,6 +227,11 @@ def _get_tool_defs_for_list(
 
 async def run_interactive_session_async(app_name: str, mcp_config: Dict[str, Any]):
     """Runs a persistent, asynchronous interactive session with an MCP app."""
+    import argparse
+    import asyncio
+    from mcp import ClientSession
+    from mcp.client.stdio import stdio_client, StdioServerParameters
+
     command = mcp_config.get("command")
     if not command:
         print("Error: 'command' not specified in MCP config.", file=sys.stderr)
@@ -268,21 +274,31 @@ async def run_interactive_session_async(app_name: str, mcp_config: Dict[str, Any
                         f"Warning: No tools reported by '{app_name}'.", file=sys.stderr
                     )
 
+                tools_by_name = {t["name"]: t for t in tool_defs}
+                # Per-tool argument parsers, built on first use
+                parsers: Dict[str, argparse.ArgumentParser] = {}
+
+                # On a terminal, read through input() for history and completion
+                line_editing = is_tty and _setup_line_editing(sorted(tools_by_name))
+                prompt = f"{app_name}> "
+
                 # Main interactive loop
                 loop = asyncio.get_running_loop()
                 while True:
-                    if is_tty:
-                        prompt = f"{app_name}> "
-                        print(prompt, end="", flush=True)
-
                     try:
-                        line = await loop.run_in_executor(None, sys.stdin.readline)
+                        if line_editing:
+                            line = await loop.run_in_executor(None, input, prompt)
+                        else:
+                            if is_tty:
+                                print(prompt, end="", flush=True)
+                            line = await loop.run_in_executor(None, sys.stdin.readline)
+                            if not line:  # EOF
+                                break
+                    except EOFError:  # Ctrl+D at the prompt
+                        break
                     except asyncio.CancelledError:
                         break  # Loop cancelled from outside
 
-                    if not line:  # EOF (Ctrl+D)
-                        break
-
                     line = line.strip()
                     if not line:
                         continue
@@ -294,20 +310,19 @@ async def run_interactive_session_async(app_name: str, mcp_config: Dict[str, Any
                     tool_name = parts[0]
                     tool_args_list = parts[1:]
 
-                    tool_schema = next(
-                        (t for t in tool_defs if t["name"] == tool_name), None
-                    )
+                    tool_schema = tools_by_name.get(tool_name)
                     if not tool_schema:
                         print(f"Error: Unknown tool '{tool_name}'", file=sys.stderr)
                         continue
 
                     # Use argparse to parse tool arguments
-                    parser = argparse.ArgumentParser(prog=tool_name, add_help=False)
-                    input_schema = tool_schema.get("input_schema", {})
-                    for prop_name, prop_details in input_schema.get(
-                        "properties", {}
-                    ).items():
-                        parser.add_argument(f"--{prop_name}")
+                    parser = parsers.get(tool_name)
+                    if parser is None:
+                        parser = argparse.ArgumentParser(prog=tool_name, add_help=False)
+                        input_schema = tool_schema.get("input_schema", {})
+                        for prop_name in input_schema.get("properties", {}):
+                            parser.add_argument(f"--{prop_name}")
+                        parsers[tool_name] = parser
 
                     try:
                         parsed_args, _ = parser.parse_known_args(tool_args_list)
@@ -324,9 +339,10 @@ async def run_interactive_session_async(app_name: str, mcp_config: Dict[str, Any
                                 if item.type == "text":
                                     print(item.text)
                                 else:
-                                    print(json.dumps(item, indent=2))
+                                    # Content items are pydantic models
+                                    _print_result(item.model_dump(mode="json"))
                         else:
-                            print(json.dumps(result.content, indent=2))
+                            _print_result(result.content)
 
                     except Exception as e:
                         print(f"Error calling tool '{tool_name}': {e}", file=sys.stderr)
@@ -340,6 +356,27 @@ async def run_interactive_session_async(app_name: str, mcp_config: Dict[str, Any
         print("\nExiting interactive session.")
 
 
+def _setup_line_editing(tool_names: List[str]) -> bool:
+    """Enables readline history and tool-name completion; False if unavailable."""
+    try:
+        import readline
+    except ImportError:  # e.g. Windows
+        return False
+
+    def complete(text: str, state: int):
+        if readline.get_begidx() > 0:
+            return None  # Only the first word is a tool name
+        matches = [name for name in tool_names if name.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(complete)
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+    return True
+
+
 def _get_access_token(app_name: str) -> str:
     """Gets a valid access token, refreshing if necessary."""
     if not AUTH_FILE_PATH.exists():
@@ -349,8 +386,7 @@ def _get_access_token(app_name: str) -> str:
         )
         sys.exit(1)
 
-    with open(AUTH_FILE_PATH, "r") as f:
-        all_tokens = json.load(f)
+    all_tokens = read_json(AUTH_FILE_PATH)
 
     token_data = all_tokens.get(app_name)
     if not token_data:
@@ -360,8 +396,9 @@ def _get_access_token(app_name: str) -> str:
         )
         sys.exit(1)
 
-    # Check for expiration (with a 60-second buffer)
-    if time.time() > token_data.get("expires_at", 0) - 60:
+    # Check for expiration (with a 60-90 second jittered buffer)
+    buffer = TOKEN_EXPIRY_MARGIN + random.uniform(0, TOKEN_EXPIRY_JITTER)
+    if time.time() + buffer > token_data.get("expires_at", 0):
         print("Access token expired. Refreshing...", file=sys.stderr)
         return _refresh_token(app_name, token_data["refresh_token"])
 
@@ -370,18 +407,23 @@ def _get_access_token(app_name: str) -> str:
 
 def _refresh_token(app_name: str, refresh_token: str) -> str:
     """Uses a refresh token to get a new access token."""
+    from tasak.auth import _token_session  # Avoid circular import
+
     payload = {
         "grant_type": "refresh_token",
         "client_id": ATLASSIAN_CLIENT_ID,
         "refresh_token": refresh_token,
     }
-    response = requests.post(ATLASSIAN_TOKEN_URL, data=payload)
+    response = _token_session().post(ATLASSIAN_TOKEN_URL, data=payload, timeout=30)
 
     if response.status_code == 200:
         new_token_data = response.json()
         # Atlassian refresh tokens might be single-use, so we save the new one
         if "refresh_token" not in new_token_data:
             new_token_data["refresh_token"] = refresh_token
+        new_token_data["expires_at"] = int(
+            time.time() + new_token_data.get("expires_in", 3600)
+        )
 
         from tasak.auth import _save_token  # Avoid circular import
 
@@ -398,6 +440,8 @@ def _refresh_token(app_name: str, refresh_token: str) -> str:
 
 def _clear_cache(app_name: str, app_config: Dict[str, Any]):
     # Use the real client to clear cache
+    from .mcp_real_client import MCPRealClient
+
     client = MCPRealClient(app_name, app_config)
     client.clear_cache()
 
@@ -407,11 +451,11 @@ def _load_mcp_config(path_str: str) -> Dict[str, Any]:
     if not expanded_path.exists():
         print(f"Error: MCP config file not found at {expanded_path}", file=sys.stderr)
         sys.exit(1)
-    raw_content = expanded_path.read_text()
-    substituted_content = os.path.expandvars(raw_content)
+    from .core.tool_service import load_mcp_config
+
     try:
-        return json.loads(substituted_content)
-    except json.JSONDecodeError as e:
+        return load_mcp_config(str(expanded_path))
+    except ValueError as e:
         print(f"Error decoding JSON from {expanded_path}: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -425,14 +469,10 @@ def _get_tool_definitions(
     """Fetches or loads cached tool definitions for an MCP app."""
     if cache_path and cache_path.exists() and not always_fetch:
         try:
-            with open(cache_path, "r") as f:
-                cache_data = json.load(f)
-                if (
-                    time.time() - cache_data.get("timestamp", 0)
-                    < CACHE_EXPIRATION_SECONDS
-                ):
-                    return cache_data["tools"]
-        except (json.JSONDecodeError, KeyError):
+            cache_data = read_json(cache_path)
+            if time.time() - cache_data.get("timestamp", 0) < CACHE_EXPIRATION_SECONDS:
+                return cache_data["tools"]
+        except (ValueError, KeyError):
             pass
 
     return []
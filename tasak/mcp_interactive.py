@@ -8,6 +8,8 @@ import threading
 import queue
 import time
 
+from .mcp_remote_pool import mcp_remote_command
+
 
 class MCPInteractiveClient:
     """Interactive client for communicating with MCP servers."""
@@ -20,7 +22,7 @@ class MCPInteractiveClient:
 
     def start(self):
         """Start the mcp-remote process."""
-        cmd = ["npx", "-y", "mcp-remote", self.server_url]
+        cmd = mcp_remote_command(self.server_url)
 
         print(f"Starting MCP connection to {self.server_url}...", file=sys.stderr)
 
@@ -1,11 +1,24 @@
 """Shared argument parser for MCP and MCP-remote applications."""
 
-import argparse
 import sys
 import os
 import shutil
 import textwrap
-from typing import Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import argparse
+
+# JSON-schema scalar types that need converting from the command-line string
+_TYPE_CONVERTERS = {"integer": int, "number": float}
+# Namespace attributes that belong to tasak rather than to a tool
+_SPECIAL_FLAGS = frozenset({"tool_name", "clear_cache", "auth", "interactive"})
+
+
+def _namespace(**kwargs: Any) -> "argparse.Namespace":
+    import argparse
+
+    return argparse.Namespace(**kwargs)
 
 
 def _get_binary_name() -> str:
@@ -41,8 +54,11 @@ def _get_binary_name() -> str:
 
 
 def build_mcp_parser(
-    app_name: str, tool_defs: List[Dict[str, Any]], app_type: str = "mcp"
-) -> argparse.ArgumentParser:
+    app_name: str,
+    tool_defs: List[Dict[str, Any]],
+    app_type: str = "mcp",
+    tool_arguments: bool = True,
+) -> "argparse.ArgumentParser":
     """
     Build a unified argument parser for MCP applications.
 
@@ -50,10 +66,13 @@ def build_mcp_parser(
         app_name: Name of the application
         tool_defs: List of tool definitions with schemas
         app_type: Type of app ("mcp" or "mcp-remote")
+        tool_arguments: When False, tools get name/help-only stub subparsers
 
     Returns:
         Configured ArgumentParser instance
     """
+    import argparse
+
     description = f"Interface for '{app_name}' {app_type.upper()} app."
     parser = argparse.ArgumentParser(prog=f"tasak {app_name}", description=description)
 
@@ -82,6 +101,8 @@ def build_mcp_parser(
         tool_parser = subparsers.add_parser(
             tool_name, help=tool_desc, description=tool_desc
         )
+        if not tool_arguments:
+            continue
 
         # Add parameters based on tool schema
         schema = tool.get("input_schema", {})
@@ -115,13 +136,92 @@ def build_mcp_parser(
     return parser
 
 
+def _coerce_remote_args(
+    tool_schema: Optional[Dict[str, Any]], tool_args: Dict[str, Any], app_type: str
+):
+    """Convert argument values to their schema types for MCP-remote tools."""
+    if tool_schema and app_type == "mcp-remote":
+        # MCP-remote might need additional type conversion
+        for arg_name, arg_value in tool_args.items():
+            if arg_value is None:
+                continue
+            param_schema = (
+                tool_schema.get("input_schema", {}).get("properties", {}).get(arg_name)
+            )
+            if param_schema and not isinstance(arg_value, bool):
+                param_type = param_schema.get("type")
+                try:
+                    if param_type == "integer" and not isinstance(arg_value, int):
+                        tool_args[arg_name] = int(arg_value)
+                    elif param_type == "number" and not isinstance(arg_value, float):
+                        tool_args[arg_name] = float(arg_value)
+                    elif param_type == "boolean" and not isinstance(arg_value, bool):
+                        tool_args[arg_name] = bool(arg_value)
+                except (ValueError, TypeError):
+                    print(
+                        f"Warning: Could not convert argument '{arg_name}' to type '{param_type}'",
+                        file=sys.stderr,
+                    )
+
+
+def _parse_tool_args(tool: Dict[str, Any], argv: List[str]) -> Optional[Dict[str, Any]]:
+    """Parse one tool's ``--key value`` / ``--key=value`` / boolean flags.
+
+    Produces the same mapping as the tool's argparse subparser (dashes in
+    keys become underscores, absent booleans are False, absent values None).
+    Returns None for anything else (help, unknown or incomplete options,
+    bad values, missing required ones) so the caller can defer to argparse.
+    """
+    schema = tool.get("input_schema", {})
+    properties = schema.get("properties", {})
+    result: Dict[str, Any] = {}
+    for prop_name, prop_details in properties.items():
+        is_bool = prop_details.get("type", "string") == "boolean"
+        result[prop_name.replace("-", "_")] = False if is_bool else None
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if not arg.startswith("--") or arg == "--help":
+            return None
+        key, has_value, value = arg[2:].partition("=")
+        prop_details = properties.get(key)
+        if prop_details is None:
+            return None
+        prop_type = prop_details.get("type", "string")
+        if prop_type == "boolean":
+            if has_value:
+                return None
+            result[key.replace("-", "_")] = True
+            i += 1
+            continue
+        if not has_value:
+            if i + 1 >= len(argv) or argv[i + 1].startswith("-"):
+                return None
+            value = argv[i + 1]
+            i += 1
+        i += 1
+        converter = _TYPE_CONVERTERS.get(prop_type)
+        if converter:
+            try:
+                value = converter(value)
+            except ValueError:
+                return None
+        result[key.replace("-", "_")] = value
+
+    for prop_name in schema.get("required", []):
+        if result.get(prop_name.replace("-", "_")) is None:
+            return None
+    return result
+
+
 def parse_mcp_args(
     app_name: str,
     tool_defs: List[Dict[str, Any]],
     app_args: List[str],
     app_type: str = "mcp",
     mode: str = "dynamic",
-) -> Tuple[str, Dict[str, Any], argparse.Namespace]:
+) -> Tuple[str, Dict[str, Any], "argparse.Namespace"]:
     """
     Parse arguments for MCP applications with proper validation.
 
@@ -161,7 +261,7 @@ def parse_mcp_args(
                 i += 1
 
         # Return minimal namespace for proxy mode
-        namespace = argparse.Namespace(tool_name=tool_name)
+        namespace = _namespace(tool_name=tool_name)
         return tool_name, tool_args, namespace
 
     # If we have no tool definitions, fall back to a permissive proxy-style parse.
@@ -170,11 +270,11 @@ def parse_mcp_args(
         # Proxy-like behavior: first positional is tool name; parse --key value pairs
         if not app_args:
             # Nothing to do; return minimal namespace
-            return None, {}, argparse.Namespace(tool_name=None)
+            return None, {}, _namespace(tool_name=None)
 
         # If asking for help, we don't know tools; return minimal to let caller print generic help
         if len(app_args) == 1 and app_args[0] in ("--help", "-h"):
-            return None, {}, argparse.Namespace(tool_name=None)
+            return None, {}, _namespace(tool_name=None)
 
         # Otherwise parse flexibly
         if not app_args[0].startswith("-"):
@@ -193,10 +293,54 @@ def parse_mcp_args(
                         i += 1
                 else:
                     i += 1
-            return tool_name, tool_args, argparse.Namespace(tool_name=tool_name)
+            return tool_name, tool_args, _namespace(tool_name=tool_name)
+
+    tools_by_name = {t["name"]: t for t in tool_defs}
 
-    # Build parser for dynamic/curated modes when tools are known
-    parser = build_mcp_parser(app_name, tool_defs, app_type)
+    # Common case: "<tool> --key value ..." is parsed without argparse. Anything
+    # unusual (help, errors, top-level flags) goes through argparse below so
+    # messages and exit codes stay exactly the same.
+    if (
+        app_args
+        and app_args[0] in tools_by_name
+        and os.environ.get("TASAK_PARSER") != "argparse"
+    ):
+        tool_args = _parse_tool_args(tools_by_name[app_args[0]], app_args[1:])
+        if tool_args is not None:
+            # As with argparse, a tool option whose dest matches a top-level
+            # flag (e.g. --interactive) overwrites that flag's value
+            parsed_args = _namespace(
+                **{
+                    "clear_cache": False,
+                    "interactive": False,
+                    "tool_name": app_args[0],
+                    **tool_args,
+                }
+            )
+            if (
+                parsed_args.clear_cache
+                or getattr(parsed_args, "auth", False)
+                or parsed_args.interactive
+            ):
+                return None, {}, parsed_args
+            tool_name = parsed_args.tool_name
+            if tool_name:
+                tool_args = {
+                    k: v
+                    for k, v in tool_args.items()
+                    if v is not None and k not in _SPECIAL_FLAGS
+                }
+                _coerce_remote_args(tools_by_name.get(tool_name), tool_args, app_type)
+                return tool_name, tool_args, parsed_args
+
+    # Build parser for dynamic/curated modes when tools are known. Only the
+    # requested tool gets its full argument set; listing, --help and unknown
+    # names need just the tool names, so the others stay unbuilt or stubs.
+    requested = next((a for a in app_args if not a.startswith("-")), None)
+    if requested in tools_by_name:
+        parser = build_mcp_parser(app_name, [tools_by_name[requested]], app_type)
+    else:
+        parser = build_mcp_parser(app_name, tool_defs, app_type, tool_arguments=False)
 
     # Parse arguments
     try:
@@ -228,39 +372,21 @@ def parse_mcp_args(
 
     tool_name = parsed_args.tool_name
 
-    # Extract tool arguments, filtering out special flags
-    SPECIAL_FLAGS = {"tool_name", "clear_cache", "auth", "interactive"}
-    tool_args = {
-        k: v
-        for k, v in vars(parsed_args).items()
-        if k not in SPECIAL_FLAGS and v is not None
-    }
-
-    # Convert types based on schema (for args that weren't already converted)
-    tool_schema = next((t for t in tool_defs if t["name"] == tool_name), None)
-    if tool_schema and app_type == "mcp-remote":
-        # MCP-remote might need additional type conversion
-        for arg_name, arg_value in tool_args.items():
-            if arg_value is None:
-                continue
-            param_schema = (
-                tool_schema.get("input_schema", {}).get("properties", {}).get(arg_name)
-            )
-            if param_schema and not isinstance(arg_value, bool):
-                param_type = param_schema.get("type")
-                try:
-                    if param_type == "integer" and not isinstance(arg_value, int):
-                        tool_args[arg_name] = int(arg_value)
-                    elif param_type == "number" and not isinstance(arg_value, float):
-                        tool_args[arg_name] = float(arg_value)
-                    elif param_type == "boolean" and not isinstance(arg_value, bool):
-                        tool_args[arg_name] = bool(arg_value)
-                except (ValueError, TypeError):
-                    print(
-                        f"Warning: Could not convert argument '{arg_name}' to type '{param_type}'",
-                        file=sys.stderr,
-                    )
-
+    # Read back just the tool's own options; special flags are not arguments
+    tool_schema = tools_by_name.get(tool_name)
+    properties = ((tool_schema or {}).get("input_schema", {}) or {}).get(
+        "properties", {}
+    )
+    tool_args = {}
+    for prop_name in properties:
+        dest = prop_name.replace("-", "_")
+        if dest in _SPECIAL_FLAGS:
+            continue
+        value = getattr(parsed_args, dest, None)
+        if value is not None:
+            tool_args[dest] = value
+
+    _coerce_remote_args(tool_schema, tool_args, app_type)
     return tool_name, tool_args, parsed_args
 
 
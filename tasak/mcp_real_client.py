@@ -12,9 +12,8 @@ from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client, StdioServerParameters
 import logging
 from .core.tool_service import ToolService
+from .json_io import read_json, write_json
 
-# Setup logging
-logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
 CACHE_EXPIRATION_SECONDS = 15 * 60  # 15 minutes
@@ -87,8 +86,12 @@ class MCPRealClient:
                     f"🔍 Debug: Cache hit for {self.app_name} at {self.cache_path}",
                     file=sys.stderr,
                 )
-            with open(self.cache_path, "r") as f:
-                return json.load(f)
+            try:
+                return read_json(self.cache_path)
+            except (ValueError, OSError) as e:
+                # Drop a corrupt cache so it is rebuilt below
+                print(f"Ignoring unreadable tool cache: {e}", file=sys.stderr)
+                self.cache_path.unlink(missing_ok=True)
 
         if debug:
             print(
@@ -100,8 +103,7 @@ class MCPRealClient:
         )
         tools = asyncio.run(self._svc.list_tools_async(self.app_name, self.app_config))
         if tools:
-            with open(self.cache_path, "w") as f:
-                json.dump(tools, f, indent=2)
+            write_json(self.cache_path, tools, indent=True)
             print(
                 f"Successfully cached tool definitions to {self.cache_path}",
                 file=sys.stderr,
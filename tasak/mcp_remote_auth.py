@@ -3,6 +3,8 @@
 import subprocess
 import sys
 
+from .mcp_remote_pool import mcp_remote_command
+
 
 def authenticate_with_mcp_remote():
     """
@@ -13,11 +15,7 @@ def authenticate_with_mcp_remote():
     print("This will install and run the Atlassian MCP proxy temporarily.")
 
     # Run mcp-remote with npx (auto-installs if needed)
-    cmd = [
-        "npx",
-        "-y",
-        "mcp-remote",
-        "https://mcp.atlassian.com/v1/sse",
+    cmd = mcp_remote_command("https://mcp.atlassian.com/v1/sse") + [
         "--auth-only",  # Just authenticate, don't start full proxy
     ]
 
@@ -28,6 +26,8 @@ def authenticate_with_mcp_remote():
             capture_output=True,
             text=True,
             timeout=120,  # 2 minutes timeout
+            stdin=subprocess.DEVNULL,
+            close_fds=True,
         )
 
         if result.returncode == 0:
@@ -1,17 +1,38 @@
 """MCP Remote client that communicates through mcp-remote proxy with process pooling."""
 
 import asyncio
+import atexit
+import os
+import re
 import sys
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import logging
 
-from .mcp_remote_pool import MCPRemotePool
+from .mcp_remote_pool import MCPRemotePool, _new_event_loop
 
-# Setup logging
-logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# Error messages that mean the mcp-remote OAuth token is missing or expired
+_AUTH_ERROR_RE = re.compile(r"\b401\b|unauthorized", re.IGNORECASE)
+
+# Event loop reused by the sync wrappers instead of one asyncio.run() per call
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _run(coro):
+    """Run a coroutine to completion on the module's reusable event loop."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = _new_event_loop()
+    return _loop.run_until_complete(coro)
+
+
+@atexit.register
+def _close_loop():
+    if _loop is not None and not _loop.is_closed():
+        _loop.close()
+
 
 class MCPRemoteClient:
     """Client for MCP Remote servers using process pool for performance."""
@@ -22,19 +43,72 @@ class MCPRemoteClient:
         self.meta = app_config.get("meta", {})
         self.server_url = self.meta.get("server_url")
         self.pool = MCPRemotePool()  # Singleton pool
+        self._daemon = None
+        self._daemon_checked = False
 
         if not self.server_url:
             raise ValueError(f"No server_url specified for {app_name}")
 
+    def _daemon_client(self):
+        """Return a DaemonClient when the tasak daemon can serve this app.
+
+        The daemon keeps the mcp-remote proxy alive between CLI invocations,
+        so only the first call pays for starting Node and connecting.
+        """
+        if not self._daemon_checked:
+            self._daemon_checked = True
+            if os.environ.get("TASAK_DEBUG") == "1" or os.environ.get(
+                "PYTEST_CURRENT_TEST"
+            ):
+                return None
+            from .daemon.client import DaemonClient
+
+            daemon = DaemonClient(
+                self.app_name,
+                {
+                    "_mcp_config": {
+                        "transport": "mcp-remote",
+                        "server_url": self.server_url,
+                    }
+                },
+            )
+            if daemon.is_daemon_available():
+                self._daemon = daemon
+        return self._daemon
+
     def get_tool_definitions(self) -> List[Dict[str, Any]]:
-        """Get tool definitions through the pooled proxy."""
-        # Run async function in sync context
-        return asyncio.run(self._fetch_tools_async())
+        """Get tool definitions through the daemon or the pooled proxy."""
+        daemon = self._daemon_client()
+        if daemon is not None:
+            tools = daemon.get_tool_definitions()
+            if tools is not None:
+                return tools
+        return _run(self._fetch_tools_async())
 
     def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
-        """Call a tool through the pooled proxy."""
-        # Run async function in sync context
-        return asyncio.run(self._call_tool_async(tool_name, arguments))
+        """Call a tool through the daemon or the pooled proxy."""
+        daemon = self._daemon_client()
+        if daemon is not None:
+            from .daemon.client import DaemonError, DaemonUnavailable
+
+            try:
+                return daemon.request_tool_call(tool_name, arguments)
+            except DaemonUnavailable as e:
+                # The call never reached the daemon, so retrying can't run the
+                # tool twice; use the pooled proxy from now on
+                logger.warning("%s; using mcp-remote directly", e)
+                self._daemon = None
+            except DaemonError as e:
+                # Timeouts and tool failures may already have run the tool
+                # (the daemon retries internally), so report instead of retrying
+                print(e, file=sys.stderr)
+                if _AUTH_ERROR_RE.search(str(e)):
+                    print(
+                        f"Authentication required. Run: tasak admin auth {self.app_name}",
+                        file=sys.stderr,
+                    )
+                sys.exit(1)
+        return _run(self._call_tool_async(tool_name, arguments))
 
     async def _fetch_tools_async(self) -> List[Dict[str, Any]]:
         """Async function to fetch tools using pooled connection."""
@@ -46,12 +120,12 @@ class MCPRemoteClient:
                 "PYTEST_CURRENT_TEST"
             ):
                 tools = await self.pool.list_tools(self.app_name, self.server_url)
-                logger.info(f"Fetched {len(tools)} tools for {self.app_name}")
+                logger.info("Fetched %s tools for %s", len(tools), self.app_name)
                 return tools
 
             # Fallback path: obtain session and call directly
             session = await self.pool.get_session(self.app_name, self.server_url)
-            logger.debug(f"Fetching tools for {self.app_name}")
+            logger.debug("Fetching tools for %s", self.app_name)
             tools_result = await session.list_tools()
             tools = []
             for tool in tools_result.tools:
@@ -62,13 +136,13 @@ class MCPRemoteClient:
                         "input_schema": tool.inputSchema,
                     }
                 )
-            logger.info(f"Fetched {len(tools)} tools for {self.app_name}")
+            logger.info("Fetched %s tools for %s", len(tools), self.app_name)
             return tools
 
         except Exception as e:
             print(f"Error fetching tools through mcp-remote: {e}", file=sys.stderr)
             # Check if it's an auth issue
-            if "401" in str(e) or "unauthorized" in str(e).lower():
+            if _AUTH_ERROR_RE.search(str(e)):
                 print(
                     f"Authentication required. Run: tasak admin auth {self.app_name}",
                     file=sys.stderr,
@@ -90,7 +164,7 @@ class MCPRemoteClient:
 
             # Fallback: get session and call directly
             session = await self.pool.get_session(self.app_name, self.server_url)
-            logger.debug(f"Calling tool {tool_name} for {self.app_name}")
+            logger.debug("Calling tool %s for %s", tool_name, self.app_name)
             result = await session.call_tool(tool_name, arguments)
 
             # Extract the result with proper validation
@@ -121,7 +195,7 @@ class MCPRemoteClient:
             )
 
             # Check if it's an authentication error
-            if "401" in error_msg or "unauthorized" in error_msg.lower():
+            if _AUTH_ERROR_RE.search(error_msg):
                 print(
                     f"Authentication required. Run: tasak admin auth {self.app_name}",
                     file=sys.stderr,
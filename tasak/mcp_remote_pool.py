@@ -10,24 +10,52 @@ import logging
 import threading
 import time
 import os
+import shutil
 import sys
 import atexit as _atexit_mod
 from concurrent.futures import Future as _CFuture
 from dataclasses import dataclass
-from typing import Dict, Any, List, Optional, TextIO
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, TextIO
 
-from mcp import ClientSession
-from mcp.client.stdio import StdioServerParameters
+# The mcp SDK is imported when the first proxy process is started
+if TYPE_CHECKING:
+    from mcp import ClientSession
 
 logger = logging.getLogger(__name__)
 
 
+# Absolute path of npx, so spawns skip the PATH walk (and find npx.cmd on Windows)
+_npx_path: Optional[str] = None
+
+
+def _npx() -> str:
+    """Return npx resolved on PATH, re-resolving if the cached path went away."""
+    global _npx_path
+    if _npx_path is None or not os.access(_npx_path, os.X_OK):
+        _npx_path = shutil.which("npx")
+    return _npx_path or "npx"
+
+
+def mcp_remote_command(server_url: str) -> List[str]:
+    """Return the command line that starts the mcp-remote proxy for server_url."""
+    return [_npx(), "-y", "mcp-remote", server_url]
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, backed by uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:  # optional speedup: pip install tasak[fast]
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
 @dataclass
 class PooledProcess:
     """Represents a pooled MCP remote process."""
 
     process: asyncio.subprocess.Process
-    session: ClientSession
+    session: "ClientSession"
     created_at: float
     last_used: float
     app_name: str
@@ -89,7 +117,7 @@ class MCPRemotePool:
         self._initialized = True
 
         # Dedicated asyncio loop thread to own all stdio contexts
-        self._loop = asyncio.new_event_loop()
+        self._loop = _new_event_loop()
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
 
@@ -104,7 +132,7 @@ class MCPRemotePool:
                 except asyncio.CancelledError:
                     break
                 except Exception as e:
-                    logger.error(f"Error in cleanup task: {e}")
+                    logger.error("Error in cleanup task: %s", e)
 
         self._cleanup_task = self._loop.create_task(_periodic())
         self._loop.run_forever()
@@ -120,17 +148,19 @@ class MCPRemotePool:
             for app_name, process in self._pool.items():
                 if process.idle_time > self.IDLE_TIMEOUT:
                     logger.info(
-                        f"Removing idle process for {app_name} (idle: {process.idle_time:.1f}s)"
+                        "Removing idle process for %s (idle: %.1fs)",
+                        app_name,
+                        process.idle_time,
                     )
                     to_remove.append(app_name)
                 elif not process.is_alive:
-                    logger.warning(f"Removing dead process for {app_name}")
+                    logger.warning("Removing dead process for %s", app_name)
                     to_remove.append(app_name)
 
             for app_name in to_remove:
                 await self._terminate_process(app_name)
 
-    async def get_session(self, app_name: str, server_url: str) -> ClientSession:
+    async def get_session(self, app_name: str, server_url: str) -> "ClientSession":
         """
         Get or create a session for the given app.
         Reuses existing process if available.
@@ -141,33 +171,35 @@ class MCPRemotePool:
 
     async def _get_or_create_session(
         self, app_name: str, server_url: str
-    ) -> ClientSession:
+    ) -> "ClientSession":
         async with self._pool_lock:
             if app_name in self._pool:
                 process = self._pool[app_name]
                 if process.is_alive and process.server_url == server_url:
                     process.last_used = time.time()
-                    logger.debug(f"Reusing existing process for {app_name}")
+                    logger.debug("Reusing existing process for %s", app_name)
                     return process.session
-                logger.info(f"Removing stale process for {app_name}")
+                logger.info("Removing stale process for %s", app_name)
                 await self._terminate_process(app_name)
-            logger.info(f"Creating new process for {app_name}")
+            logger.info("Creating new process for %s", app_name)
             return await self._create_process(app_name, server_url)
 
-    async def _create_process(self, app_name: str, server_url: str) -> ClientSession:
+    async def _create_process(self, app_name: str, server_url: str) -> "ClientSession":
         """Create a new MCP remote process and session."""
         # Check pool size
         if len(self._pool) >= self.MAX_POOL_SIZE:
             # Remove oldest idle process
             oldest = min(self._pool.values(), key=lambda p: p.last_used)
-            logger.info(f"Pool full, removing oldest process: {oldest.app_name}")
+            logger.info("Pool full, removing oldest process: %s", oldest.app_name)
             await self._terminate_process(oldest.app_name)
 
         # Start mcp-remote proxy process using stdio_client
-        from mcp.client.stdio import stdio_client
+        from mcp import ClientSession
+        from mcp.client.stdio import StdioServerParameters, stdio_client
 
+        command = mcp_remote_command(server_url)
         server_params = StdioServerParameters(
-            command="npx", args=["-y", "mcp-remote", server_url], env=None
+            command=command[0], args=command[1:], env=None
         )
 
         # Silence noisy mcp-remote stderr unless in TASAK_DEBUG/TASAK_VERBOSE
@@ -206,13 +238,16 @@ class MCPRemotePool:
 
         self._pool[app_name] = pooled
         logger.info(
-            f"Created new process for {app_name} (pool size: {len(self._pool)})"
+            "Created new process for %s (pool size: %s)", app_name, len(self._pool)
         )
 
         return session
 
-    # New: safe helpers that execute on the dedicated loop
-    async def list_tools(self, app_name: str, server_url: str) -> List[Dict[str, Any]]:
+    # Safe helpers that execute on the dedicated loop. They return the
+    # wrapped future directly, so awaiting them adds no extra coroutine frame.
+    def list_tools(
+        self, app_name: str, server_url: str
+    ) -> "asyncio.Future[List[Dict[str, Any]]]":
         async def _inner() -> List[Dict[str, Any]]:
             session = await self._get_or_create_session(app_name, server_url)
             resp = await session.list_tools()
@@ -227,12 +262,11 @@ class MCPRemotePool:
                 )
             return tools
 
-        fut = self._submit(_inner())
-        return await asyncio.wrap_future(fut)
+        return asyncio.wrap_future(self._submit(_inner()))
 
-    async def call_tool(
+    def call_tool(
         self, app_name: str, server_url: str, tool_name: str, arguments: Dict[str, Any]
-    ) -> Any:
+    ) -> "asyncio.Future[Any]":
         async def _inner():
             session = await self._get_or_create_session(app_name, server_url)
             result = await session.call_tool(tool_name, arguments)
@@ -244,8 +278,7 @@ class MCPRemotePool:
                     return content.data
             return result
 
-        fut = self._submit(_inner())
-        return await asyncio.wrap_future(fut)
+        return asyncio.wrap_future(self._submit(_inner()))
 
     async def _terminate_process(self, app_name: str):
         """Terminate a pooled process."""
@@ -261,14 +294,14 @@ class MCPRemotePool:
             elif hasattr(process_info.session, "close"):
                 await process_info.session.close()
         except Exception as e:
-            logger.debug(f"Error closing session for {app_name}: {e}")
+            logger.debug("Error closing session for %s: %s", app_name, e)
 
         # Close stdio context if we have one
         if process_info.stdio_context is not None:
             try:
                 await process_info.stdio_context.__aexit__(None, None, None)
             except Exception as e:
-                logger.debug(f"Error closing stdio context for {app_name}: {e}")
+                logger.debug("Error closing stdio context for %s: %s", app_name, e)
 
         # Close errlog sink if we opened one
         if process_info.errlog_handle is not None:
@@ -285,13 +318,13 @@ class MCPRemotePool:
                 await asyncio.wait_for(process_info.process.wait(), timeout=2.0)
             except asyncio.TimeoutError:
                 # Force kill if it doesn't terminate
-                logger.warning(f"Force killing process for {app_name}")
+                logger.warning("Force killing process for %s", app_name)
                 process_info.process.kill()
                 await process_info.process.wait()
 
         # Remove from pool
         del self._pool[app_name]
-        logger.debug(f"Terminated process for {app_name}")
+        logger.debug("Terminated process for %s", app_name)
 
     async def shutdown(self):
         """Shutdown all pooled processes."""
@@ -8,15 +8,36 @@ This module exposes a stable interface used by tests:
 - _clear_cache
 """
 
-import sys
-import json
+import os
+import signal
 import subprocess
-from typing import Any, Dict, List, Optional
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from .json_io import print_json
 from .schema_manager import SchemaManager
-from .mcp_parser import show_tool_help, show_simplified_app_help
+from .mcp_parser import _TYPE_CONVERTERS, show_tool_help, show_simplified_app_help
+
+if TYPE_CHECKING:
+    from .mcp_remote_client import MCPRemoteClient
+
+
+def __getattr__(name: str):
+    # MCPRemoteClient pulls in asyncio and the proxy pool; import it on first
+    # use so --help/--auth/--clear-cache don't pay for it. Once resolved it is
+    # a plain module global, which keeps it patchable in tests.
+    if name == "MCPRemoteClient":
+        from .mcp_remote_client import MCPRemoteClient
+
+        globals()[name] = MCPRemoteClient
+        return MCPRemoteClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-# Expose MCPRemoteClient at module scope to support test patching
-from .mcp_remote_client import MCPRemoteClient
+def _new_client(app_name: str, app_config: Dict[str, Any]) -> "MCPRemoteClient":
+    """Create an MCPRemoteClient, honouring a patched module attribute."""
+    client_cls = globals().get("MCPRemoteClient") or __getattr__("MCPRemoteClient")
+    return client_cls(app_name, app_config)
 
 
 def run_mcp_remote_app(app_name: str, app_config: Dict[str, Any], app_args: List[str]):
@@ -69,8 +90,20 @@ def run_mcp_remote_app(app_name: str, app_config: Dict[str, Any], app_args: List
         _run_interactive_mode(server_url)
         return
 
+    # One client for the schema fetch and the tool call, so the daemon
+    # availability check and config parsing happen once per invocation. It is
+    # created on first use: a cached schema plus help or a validation error
+    # never needs it (nor the proxy pool it starts).
+    client = None
+
+    def get_client() -> "MCPRemoteClient":
+        nonlocal client
+        if client is None:
+            client = _new_client(app_name, app_config)
+        return client
+
     # Always resolve tool definitions for help/validation below (with 1-day TTL)
-    tool_defs = _get_tool_defs_for_help(app_name, app_config)
+    tool_defs = _get_tool_defs_for_help(app_name, app_config, get_client)
 
     # If no arguments provided, follow global CLI rule:
     # - If the app can run without additional arguments (exactly one zero-arg tool), run it
@@ -97,13 +130,9 @@ def run_mcp_remote_app(app_name: str, app_config: Dict[str, Any], app_args: List
         if len(tool_defs) == 1 and len(zero_arg_tools) == 1:
             # Single tool with no required params → run it
             only_tool = zero_arg_tools[0]["name"]
-            client = MCPRemoteClient(app_name, app_config)
             try:
-                result = client.call_tool(only_tool, {})
-                if isinstance(result, (dict, list)):
-                    print(json.dumps(result))
-                else:
-                    print(result)
+                result = get_client().call_tool(only_tool, {})
+                _print_result(result)
             except Exception as e:
                 print(f"Error executing tool: {e}", file=sys.stderr)
                 sys.exit(1)
@@ -131,33 +160,32 @@ def run_mcp_remote_app(app_name: str, app_config: Dict[str, Any], app_args: List
         return
     if not args_tokens and not required:
         # Immediate call with no params
-        client = MCPRemoteClient(app_name, app_config)
         try:
-            result = client.call_tool(tool_name, {})
-            if isinstance(result, (dict, list)):
-                print(json.dumps(result))
-            else:
-                print(result)
+            result = get_client().call_tool(tool_name, {})
+            _print_result(result)
         except Exception as e:
             print(f"Error executing tool: {e}", file=sys.stderr)
             sys.exit(1)
         return
 
     # Build argument dict and collect unexpected positionals
+    properties = (tool_schema.get("input_schema", {}) or {}).get("properties") or {}
     parsed_args: Dict[str, Any] = {}
     unexpected: List[str] = []
     i = 0
     while i < len(args_tokens):
         tok = args_tokens[i]
         if tok.startswith("--"):
-            key = tok[2:]
-            # Boolean flag if next is another -- or end
-            if i + 1 >= len(args_tokens) or args_tokens[i + 1].startswith("--"):
-                parsed_args[key] = True
+            key, has_value, value = tok[2:].partition("=")
+            i += 1
+            if not has_value:
+                # Boolean flag if next is another -- or end
+                if i >= len(args_tokens) or args_tokens[i].startswith("--"):
+                    parsed_args[key] = True
+                    continue
+                value = args_tokens[i]
                 i += 1
-            else:
-                parsed_args[key] = args_tokens[i + 1]
-                i += 2
+            parsed_args[key] = _convert_value(value, properties.get(key))
         else:
             unexpected.append(tok)
             i += 1
@@ -175,26 +203,49 @@ def run_mcp_remote_app(app_name: str, app_config: Dict[str, Any], app_args: List
         )
         print("Hint: Use --key value format for tool parameters", file=sys.stderr)
 
-    # Execute tool using module-level MCPRemoteClient (allows test patching)
-    client = MCPRemoteClient(app_name, app_config)
     try:
-        result = client.call_tool(tool_name, parsed_args)
-        if isinstance(result, (dict, list)):
-            print(json.dumps(result))
-        else:
-            print(result)
+        result = get_client().call_tool(tool_name, parsed_args)
+        _print_result(result)
     except Exception as e:
         print(f"Error executing tool: {e}", file=sys.stderr)
         sys.exit(1)
 
 
+def _print_result(result: Any):
+    """Writes a tool result: compact JSON for dicts/lists, text as-is."""
+    if isinstance(result, (dict, list)):
+        print_json(result)
+        return
+    text = result if isinstance(result, str) else str(result)
+    # Large text results go out in one write, without print()'s extra copies
+    sys.stdout.write(text)
+    if not text.endswith("\n"):
+        sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
+def _convert_value(value: str, prop_schema: Optional[Dict[str, Any]]) -> Any:
+    """Convert a command-line value to the property's numeric type, if any."""
+    converter = _TYPE_CONVERTERS.get((prop_schema or {}).get("type"))
+    if converter:
+        try:
+            return converter(value)
+        except ValueError:
+            pass  # Let the server report the type mismatch
+    return value
+
+
 def _get_tool_defs_for_help(
-    app_name: str, app_config: Dict[str, Any]
+    app_name: str,
+    app_config: Dict[str, Any],
+    get_client: Optional[Callable[[], "MCPRemoteClient"]] = None,
 ) -> Optional[List[Dict[str, Any]]]:
     """Return tool definitions, refreshing cache if older than 1 day.
 
     - Prefer cached schema if age < 1 day
     - Otherwise, fetch via MCPRemoteClient quietly; fallback to cache on failure
+
+    get_client, if given, supplies the client lazily so the caller can reuse it.
     """
     schema_manager = SchemaManager()
     schema_data = schema_manager.load_schema(app_name)
@@ -204,7 +255,10 @@ def _get_tool_defs_for_help(
 
     # Cache is missing or stale (>= 1 day) — fetch quietly
     try:
-        client = MCPRemoteClient(app_name, app_config)
+        if get_client is not None:
+            client = get_client()
+        else:
+            client = _new_client(app_name, app_config)
         tools = client.get_tool_definitions() or []
         if tools:
             schema_manager.save_schema(app_name, tools)
@@ -229,16 +283,21 @@ def _clear_cache(app_name: str):
 
 def _run_auth_flow(server_url: str):
     """Run the OAuth flow via mcp-remote to acquire tokens."""
+    from .mcp_remote_pool import mcp_remote_command
+
     try:
-        subprocess_result = subprocess.run(
-            ["npx", "-y", "mcp-remote", server_url], timeout=120
+        # The OAuth flow never reads stdin; don't hand the terminal to node.
+        proc = subprocess.Popen(
+            mcp_remote_command(server_url),
+            stdin=subprocess.DEVNULL,
+            close_fds=True,
         )
         # Informational messages
         print(
             "Starting authentication flow — a browser window will open to complete OAuth.",
             file=sys.stderr,
         )
-        if subprocess_result.returncode == 0:
+        if _wait_forwarding_sigint(proc, timeout=120) == 0:
             print("Authentication successful via mcp-remote.", file=sys.stderr)
         else:
             print("Authentication may have failed or was cancelled.", file=sys.stderr)
@@ -252,6 +311,38 @@ def _run_auth_flow(server_url: str):
         print(f"Error during authentication: {e}", file=sys.stderr)
 
 
+def _wait_forwarding_sigint(proc: subprocess.Popen, timeout: float) -> int:
+    """Wait for proc, passing Ctrl-C on to it instead of abandoning it.
+
+    Node then shuts down and frees its OAuth callback port by itself, rather
+    than being killed after subprocess.run's grace period. Raises
+    KeyboardInterrupt once the child has exited if Ctrl-C was pressed.
+    """
+    interrupted = False
+
+    def _forward(signum, frame):
+        nonlocal interrupted
+        interrupted = True
+        proc.send_signal(signum)
+
+    # Windows consoles already deliver Ctrl-C to every attached process
+    forward = os.name != "nt" and threading.current_thread() is threading.main_thread()
+    if forward:
+        previous = signal.signal(signal.SIGINT, _forward)
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        if forward:
+            signal.signal(signal.SIGINT, previous)
+    if interrupted:
+        raise KeyboardInterrupt
+    return returncode
+
+
 def _run_interactive_mode(server_url: str):
     """
     Runs interactive mode for an MCP remote server.
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import ast
 import os
-import subprocess
 import sys
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
@@ -173,6 +172,8 @@ def integrate_plugins_into_config(config: Dict[str, Any]) -> Dict[str, Any]:
     updated = dict(config)
     apps_cfg = updated.setdefault("apps_config", {})
     enabled_apps: list[str] = list(apps_cfg.get("enabled_apps", []) or [])
+    # Set mirror of enabled_apps for O(1) membership while keeping list order
+    enabled_set = set(enabled_apps)
 
     settings = _resolve_plugin_settings(updated)
     plugins = discover_python_plugins(updated)
@@ -199,8 +200,9 @@ def integrate_plugins_into_config(config: Dict[str, Any]) -> Dict[str, Any]:
             updated[name]["python_executable"] = settings["python_executable"]
 
         # Auto-enable
-        if settings["auto_enable_all"] and name not in enabled_apps:
+        if settings["auto_enable_all"] and name not in enabled_set:
             enabled_apps.append(name)
+            enabled_set.add(name)
 
     # Persist enabled_apps updates
     apps_cfg["enabled_apps"] = enabled_apps
@@ -230,36 +232,10 @@ def run_python_plugin(app_name: str, app_config: Dict[str, Any], app_args: list[
     )
 
     command = [python_exec, plugin_path, *app_args]
-    _execute_command(command)
-
-
-def _execute_command(command: list[str]):
-    """Executes a command and streams its output (mirrors app_runner)."""
-    print(f"Running command: {' '.join(command)}", file=sys.stderr)
-    try:
-        process = subprocess.Popen(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True,
-        )
-
-        assert process.stdout is not None
-        for line in process.stdout:
-            print(line, end="")
+    # Same process handling as cmd apps, so fixes there apply to plugins too
+    from .app_runner import _can_exec, _exec_command, _execute_command
 
-        process.wait()
-        if process.returncode != 0:
-            print(f"\nCommand exited with code {process.returncode}", file=sys.stderr)
-            sys.exit(process.returncode)
-    except FileNotFoundError:
-        print(f"Error: Command not found: {command[0]}", file=sys.stderr)
-        sys.exit(1)
-    except KeyboardInterrupt:
-        print("\nOperation cancelled by user.", file=sys.stderr)
-        sys.exit(130)
-    except Exception as e:  # noqa: BLE001
-        print(f"An error occurred: {e}", file=sys.stderr)
-        sys.exit(1)
+    if _can_exec():
+        _exec_command(command)
+        return
+    _execute_command(command)
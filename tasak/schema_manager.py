@@ -1,10 +1,22 @@
 """Schema management for TASAK applications."""
 
-import json
+import functools
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .json_io import loads, write_json
+
+
+@functools.lru_cache(maxsize=128)
+def _read_schema_bytes(path: str, mtime_ns: int, size: int) -> bytes:
+    """Read a schema file; keyed by mtime/size so edits invalidate the entry.
+
+    The raw bytes are cached rather than the parsed dict: parsing them again
+    gives every caller its own copy and is far cheaper than a deepcopy.
+    """
+    return Path(path).read_bytes()
+
 
 class SchemaManager:
     """Manages schemas for MCP applications."""
@@ -32,8 +44,7 @@ class SchemaManager:
                     "input_schema": tool.get("input_schema", {}),
                 }
 
-        with open(schema_file, "w") as f:
-            json.dump(schema_data, f, indent=2)
+        write_json(schema_file, schema_data, indent=True)
 
         return schema_file
 
@@ -45,26 +56,31 @@ class SchemaManager:
             return None
 
         try:
-            with open(schema_file, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            st = schema_file.stat()
+            return loads(
+                _read_schema_bytes(str(schema_file), st.st_mtime_ns, st.st_size)
+            )
+        except (ValueError, OSError):
             return None
 
-    def get_schema_age_days(self, app_name: str) -> Optional[int]:
-        """Get age of schema in days."""
-        schema_file = self.schema_dir / f"{app_name}.json"
+    def get_schema_age_days(
+        self, app_name: str, schema_data: Optional[Dict[str, Any]] = None
+    ) -> Optional[int]:
+        """Get age of schema in days.
 
-        if not schema_file.exists():
+        Pass the result of a previous load_schema() to skip reading it again.
+        """
+        if schema_data is None:
+            schema_data = self.load_schema(app_name)
+        if not schema_data:
             return None
 
         try:
-            with open(schema_file, "r") as f:
-                schema_data = json.load(f)
-                last_updated = schema_data.get("last_updated")
-                if last_updated:
-                    update_time = datetime.fromisoformat(last_updated)
-                    age = datetime.now() - update_time
-                    return age.days
+            last_updated = schema_data.get("last_updated")
+            if last_updated:
+                update_time = datetime.fromisoformat(last_updated)
+                age = datetime.now() - update_time
+                return age.days
         except Exception:
             pass
 
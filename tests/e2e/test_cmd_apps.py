@@ -10,17 +10,12 @@ from pathlib import Path
 # Get the test directory
 TEST_DIR = Path(__file__).parent
 CONFIG_FILE = TEST_DIR / "tasak_test_config.yaml"
+REPO_ROOT = TEST_DIR.parents[1]
 
 
 class TestCmdApps:
     """Test cmd type applications."""
 
-    @classmethod
-    def setup_class(cls):
-        """Set up test environment."""
-        # Ensure we're in the right directory
-        os.chdir(Path(__file__).parent.parent.parent)
-
     def run_tasak(self, *args, env=None):
         """Helper to run tasak with test config."""
         test_env = os.environ.copy()
@@ -40,7 +35,9 @@ class TestCmdApps:
             str(venv_python) if venv_python.exists() else sys.executable
         )
         cmd = [python_exe, "-m", "tasak.main"] + list(args)
-        result = subprocess.run(cmd, capture_output=True, text=True, env=test_env)
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, env=test_env, cwd=REPO_ROOT
+        )
         return result
 
     def test_cmd_curated_basic(self):
@@ -112,11 +109,6 @@ class TestCmdApps:
 class TestCmdProxyVsCurated:
     """Test differences between proxy and curated modes."""
 
-    @classmethod
-    def setup_class(cls):
-        """Set up test environment."""
-        os.chdir(Path(__file__).parent.parent.parent)
-
     def run_tasak(self, *args):
         """Helper to run tasak with test config."""
         test_env = os.environ.copy()
@@ -132,7 +124,9 @@ class TestCmdProxyVsCurated:
             str(venv_python) if venv_python.exists() else sys.executable
         )
         cmd = [python_exe, "-m", "tasak.main"] + list(args)
-        result = subprocess.run(cmd, capture_output=True, text=True, env=test_env)
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, env=test_env, cwd=REPO_ROOT
+        )
         return result
 
     def test_proxy_preserves_exact_args(self):
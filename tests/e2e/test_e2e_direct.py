@@ -1,155 +1,125 @@
 """Direct E2E tests using tasak API instead of subprocess."""
 
-import os
-import sys
+import copy
 import json
-import tempfile
 from pathlib import Path
-from unittest.mock import patch
-import yaml
-
 
-# Add tasak to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import pytest
+import yaml
 
 import tasak.main
 import tasak.config
 import tasak.app_runner
 
 
-class TestDirectCmdApps:
-    """Test cmd apps directly using the API."""
-
-    def setup_method(self):
-        """Setup test config for each test."""
-        self.test_config = {
-            "apps_config": {
-                "enabled_apps": ["test-hello", "test-hello-proxy"],
-            },
-            "test-hello": {
-                "type": "curated",
-                "name": "Test Hello App",
-                "commands": [
+HELLO_CMD = f"python {Path(__file__).parent / 'mini-apps' / 'hello_cmd.py'}"
+
+TEST_CONFIG = {
+    "apps_config": {
+        "enabled_apps": ["test-hello", "test-hello-proxy"],
+    },
+    "test-hello": {
+        "type": "curated",
+        "name": "Test Hello App",
+        "commands": [
+            {
+                "name": "greet",
+                "backend": {"type": "cmd", "command": HELLO_CMD},
+                "params": [
+                    {
+                        "name": "--name",
+                        "type": "str",
+                        "default": "World",
+                        "help": "Name to greet",
+                    },
                     {
-                        "name": "greet",
-                        "backend": {
-                            "type": "cmd",
-                            "command": f"python {Path(__file__).parent / 'mini-apps' / 'hello_cmd.py'}",
-                        },
-                        "params": [
-                            {
-                                "name": "--name",
-                                "type": "str",
-                                "default": "World",
-                                "help": "Name to greet",
-                            },
-                            {
-                                "name": "--repeat",
-                                "type": "int",
-                                "default": 1,
-                                "help": "Number of times",
-                            },
-                            {
-                                "name": "--json",
-                                "type": "bool",
-                                "action": "store_true",
-                                "help": "Output as JSON",
-                            },
-                        ],
-                    }
+                        "name": "--repeat",
+                        "type": "int",
+                        "default": 1,
+                        "help": "Number of times",
+                    },
+                    {
+                        "name": "--json",
+                        "type": "bool",
+                        "action": "store_true",
+                        "help": "Output as JSON",
+                    },
                 ],
-            },
-            "test-hello-proxy": {
-                "type": "cmd",
-                "command": f"python {Path(__file__).parent / 'mini-apps' / 'hello_cmd.py'}",
-            },
-        }
+            }
+        ],
+    },
+    "test-hello-proxy": {"type": "cmd", "command": HELLO_CMD},
+}
 
-    @patch("sys.argv", ["tasak", "test-hello", "greet"])
-    @patch("tasak.main.load_and_merge_configs")
-    def test_run_cmd_curated_basic(self, mock_config, capsys):
-        """Test running a curated cmd app."""
-        mock_config.return_value = self.test_config
 
-        try:
-            tasak.main.main()
-        except SystemExit as e:
-            assert e.code == 0
+def _is_json_greeting(captured):
+    data = json.loads(captured.out)
+    return data["greeting"] == "Hello, Charlie!" and data["count"] == 1
+
+
+def _main_exit_code():
+    """Run tasak.main.main(); return its exit code (0 when it just returns)."""
+    try:
+        tasak.main.main()
+    except SystemExit as e:
+        return 0 if e.code is None else e.code
+    return 0
 
-        captured = capsys.readouterr()
-        assert "Hello, World!" in captured.out
-
-    def test_run_cmd_curated_with_args(self, capsys):
-        """Test running curated cmd with arguments."""
-        with patch("tasak.main.load_and_merge_configs", return_value=self.test_config):
-            with patch(
-                "sys.argv",
-                ["tasak", "test-hello", "greet", "--name", "Alice", "--repeat", "2"],
-            ):
-                try:
-                    tasak.main.main()
-                except SystemExit as e:
-                    assert e.code == 0
-
-                captured = capsys.readouterr()
-                assert captured.out.count("Hello, Alice!") == 2
-
-    def test_run_cmd_proxy(self, capsys):
-        """Test running proxy mode cmd."""
-        with patch("tasak.main.load_and_merge_configs", return_value=self.test_config):
-            with patch("sys.argv", ["tasak", "test-hello-proxy", "--name", "Bob"]):
-                try:
-                    tasak.main.main()
-                except SystemExit as e:
-                    assert e.code == 0
-
-                captured = capsys.readouterr()
-                assert "Hello, Bob!" in captured.out
-
-    def test_list_apps(self, capsys):
-        """Test listing available apps."""
-        with patch("tasak.main.load_and_merge_configs", return_value=self.test_config):
-            with patch("sys.argv", ["tasak"]):
-                try:
-                    tasak.main.main()
-                except SystemExit as e:
-                    assert e.code == 0
-
-                captured = capsys.readouterr()
-                assert "test-hello" in captured.out
-                assert "test-hello-proxy" in captured.out
-
-    def test_app_not_found(self, capsys):
-        """Test running non-existent app."""
-        with patch("tasak.main.load_and_merge_configs", return_value=self.test_config):
-            with patch("sys.argv", ["tasak", "nonexistent"]):
-                try:
-                    tasak.main.main()
-                except SystemExit as e:
-                    assert e.code == 1
-
-                captured = capsys.readouterr()
-                assert (
-                    "not found" in captured.err.lower()
-                    or "not exist" in captured.err.lower()
-                )
-
-    def test_cmd_with_json_output(self, capsys):
-        """Test cmd with JSON output."""
-        with patch("tasak.main.load_and_merge_configs", return_value=self.test_config):
-            with patch(
-                "sys.argv",
-                ["tasak", "test-hello", "greet", "--json", "--name", "Charlie"],
-            ):
-                try:
-                    tasak.main.main()
-                except SystemExit as e:
-                    assert e.code == 0
-
-                captured = capsys.readouterr()
-                data = json.loads(captured.out)
-                assert data["greeting"] == "Hello, Charlie!"
-                assert data["count"] == 1
+
+class TestDirectCmdApps:
+    """Test cmd apps directly using the API."""
+
+    @pytest.mark.parametrize(
+        "argv,expected_code,check",
+        [
+            pytest.param(
+                ["test-hello", "greet"],
+                0,
+                lambda c: "Hello, World!" in c.out,
+                id="curated_basic",
+            ),
+            pytest.param(
+                ["test-hello", "greet", "--name", "Alice", "--repeat", "2"],
+                0,
+                lambda c: c.out.count("Hello, Alice!") == 2,
+                id="curated_with_args",
+            ),
+            pytest.param(
+                ["test-hello-proxy", "--name", "Bob"],
+                0,
+                lambda c: "Hello, Bob!" in c.out,
+                id="proxy",
+            ),
+            pytest.param(
+                [],
+                0,
+                lambda c: "test-hello" in c.out and "test-hello-proxy" in c.out,
+                id="list_apps",
+            ),
+            pytest.param(
+                ["nonexistent"],
+                1,
+                lambda c: "not found" in c.err.lower() or "not exist" in c.err.lower(),
+                id="app_not_found",
+            ),
+            pytest.param(
+                ["test-hello", "greet", "--json", "--name", "Charlie"],
+                0,
+                _is_json_greeting,
+                id="json_output",
+            ),
+        ],
+    )
+    def test_run(self, argv, expected_code, check, monkeypatch, capfd):
+        """Run tasak.main.main() in-process against the shared test config."""
+        monkeypatch.setattr(
+            "tasak.main.load_and_merge_configs", lambda: copy.deepcopy(TEST_CONFIG)
+        )
+        monkeypatch.setattr("sys.argv", ["tasak", *argv])
+
+        assert _main_exit_code() == expected_code
+
+        assert check(capfd.readouterr())
 
 
 """
@@ -160,81 +130,65 @@ environment-sensitive direct test for stability.
 """
 
 
+@pytest.mark.user_config
 class TestRealApps:
     """Test with real existing apps from user's config."""
 
-    def test_list_real_apps(self, capsys):
+    def test_list_real_apps(self, capsys, monkeypatch):
         """Test listing real configured apps."""
         # This uses the actual user config
-        with patch("sys.argv", ["tasak"]):
-            try:
-                tasak.main.main()
-            except SystemExit as e:
-                assert e.code == 0
-
-            captured = capsys.readouterr()
-            # Should list at least some apps (header present)
-            assert (
-                "Available apps:" in captured.out
-                or "Available applications:" in captured.out
-            )
-            # Check for some known apps from user's config
-            assert "auth" in captured.out or "atlassian" in captured.out
-
-    def test_auth_help(self, capsys):
+        monkeypatch.setattr("sys.argv", ["tasak"])
+        assert _main_exit_code() == 0
+
+        captured = capsys.readouterr()
+        # Should list at least some apps (header present)
+        assert (
+            "Available apps:" in captured.out
+            or "Available applications:" in captured.out
+        )
+        # Check for some known apps from user's config
+        assert "auth" in captured.out or "atlassian" in captured.out
+
+    def test_auth_help(self, capsys, monkeypatch):
         """Test help for auth app."""
-        with patch("sys.argv", ["tasak", "auth", "--help"]):
-            try:
-                tasak.main.main()
-            except SystemExit as e:
-                # Help exits with 0
-                assert e.code == 0
+        monkeypatch.setattr("sys.argv", ["tasak", "auth", "--help"])
+        # Help exits with 0
+        assert _main_exit_code() == 0
 
-            captured = capsys.readouterr()
-            assert "help" in captured.out.lower() or "usage" in captured.out.lower()
+        captured = capsys.readouterr()
+        assert "help" in captured.out.lower() or "usage" in captured.out.lower()
 
 
 class TestConfigMerging:
     """Test configuration merging logic."""
 
-    def test_config_merge_order(self):
+    def test_config_merge_order(self, tmp_path, monkeypatch):
         """Test that configs are merged in correct order."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
+        # Keep the user's global config and cache out of the picture
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.delenv("TASAK_CONFIG", raising=False)
+        project = tmp_path / "project"
 
-            # Create a test config structure
-            (tmppath / ".tasak").mkdir()
+        # Create a test config structure
+        (project / ".tasak").mkdir(parents=True)
 
-            config1 = {
-                "apps": {
-                    "app1": {"type": "cmd", "command": "echo", "value": "from_parent"}
-                }
-            }
+        config1 = {
+            "apps": {"app1": {"type": "cmd", "command": "echo", "value": "from_parent"}}
+        }
 
-            config2 = {
-                "apps": {
-                    "app1": {"type": "cmd", "command": "echo", "value": "from_child"},
-                    "app2": {"type": "cmd", "command": "ls"},
-                }
+        config2 = {
+            "apps": {
+                "app1": {"type": "cmd", "command": "echo", "value": "from_child"},
+                "app2": {"type": "cmd", "command": "ls"},
             }
+        }
 
-            with open(tmppath / "tasak.yaml", "w") as f:
-                yaml.dump(config1, f)
-
-            with open(tmppath / ".tasak" / "tasak.yaml", "w") as f:
-                yaml.dump(config2, f)
-
-            # Change to test directory
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(tmppath)
-
-                # Load configs
-                merged = tasak.config.load_and_merge_configs()
+        (project / "tasak.yaml").write_text(yaml.dump(config1))
+        (project / ".tasak" / "tasak.yaml").write_text(yaml.dump(config2))
 
-                # Later configs should override earlier ones
-                assert merged["apps"]["app1"]["value"] == "from_child"
-                assert "app2" in merged["apps"]
+        # Load configs starting from the project dir, without chdir
+        merged = tasak.config.load_and_merge_configs(start_dir=project)
 
-            finally:
-                os.chdir(original_cwd)
+        # Later configs should override earlier ones
+        assert merged["apps"]["app1"]["value"] == "from_child"
+        assert "app2" in merged["apps"]
@@ -2,93 +2,89 @@
 
 import json
 import os
+import selectors
 import sys
 import subprocess
 import time
 from pathlib import Path
-import tempfile
-import shutil
+
+import pytest
 
 
 # Get the test directory
 TEST_DIR = Path(__file__).parent
 CONFIG_FILE = TEST_DIR / "tasak_test_config.yaml"
-
-
-class TestMCPApps:
-    """Test MCP type applications."""
-
-    def setup_method(self):
-        """Create a dummy auth file for MCP tests."""
-        self.temp_home = tempfile.mkdtemp()
-        self.original_home = os.environ.get("HOME")
-        os.environ["HOME"] = self.temp_home
-
-        tasak_dir = Path(self.temp_home) / ".tasak"
-        tasak_dir.mkdir()
-
-        auth_file = tasak_dir / "auth.json"
-        with open(auth_file, "w") as f:
-            json.dump(
-                {
-                    "test-mcp": {
-                        "access_token": "dummy_token",
-                        "expires_at": time.time() + 3600,
-                    }
-                },
-                f,
-            )
-
-    def teardown_method(self):
-        """Clean up the dummy auth file."""
-        if self.original_home is None:
-            del os.environ["HOME"]
-        else:
-            os.environ["HOME"] = self.original_home
-        shutil.rmtree(self.temp_home)
-
-    @classmethod
-    def setup_class(cls):
-        """Set up test environment."""
-        os.chdir(Path(__file__).parent.parent.parent)
-
-    def run_tasak(self, *args, input_text=None, timeout=10):
-        """Helper to run tasak with test config."""
-        test_env = os.environ.copy()
-        test_env["TASAK_CONFIG"] = str(CONFIG_FILE)
+REPO_ROOT = TEST_DIR.parents[1]
+
+# tasak silently falls back to the normal config search when TASAK_CONFIG
+# points nowhere, so fail at collection instead of in every child.
+assert CONFIG_FILE.is_file(), f"missing e2e config: {CONFIG_FILE}"
+
+# JSON tool-call payloads passed as a single CLI argument
+_TOOL_CALL_DIVIDE_ZERO = json.dumps(
+    {"tool": "divide", "arguments": {"numerator": 10, "denominator": 0}}
+)
+_TOOL_CALL_NONEXISTENT = json.dumps({"tool": "nonexistent", "arguments": {}})
+_TOOL_CALL_ECHO_INTEGRATION = json.dumps(
+    {"tool": "echo", "arguments": {"message": "Integration test"}}
+)
+
+
+@pytest.fixture(scope="class", autouse=True)
+def mcp_home(tmp_path_factory):
+    """Set up the environment tasak children inherit, once per test class.
+
+    HOME points at a temp dir, keeping the tool-definition cache away from the
+    real ~/.tasak while letting later tests in the class reuse it instead of
+    starting the MCP server twice. test-mcp sets requires_auth: false, so no
+    auth.json is needed. Children inherit os.environ directly, so no
+    per-call copy of the environment is made.
+    """
+    home = tmp_path_factory.mktemp("home")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(home))
+        mp.setenv("TASAK_CONFIG", str(CONFIG_FILE))
         # Bypass daemon for deterministic local stdio server in tests
-        test_env["TASAK_DEBUG"] = "1"
+        mp.setenv("TASAK_DEBUG", "1")
         # Ensure subprocesses resolve 'python' to project venv first
-        repo_root = Path(__file__).resolve().parents[2]
-        venv_bin = repo_root / ".venv" / "bin"
+        venv_bin = REPO_ROOT / ".venv" / "bin"
         if venv_bin.exists():
-            test_env["PATH"] = f"{venv_bin}:{test_env.get('PATH','')}"
+            mp.setenv("PATH", str(venv_bin), prepend=os.pathsep)
+        yield home
+
 
-        repo_root = Path(__file__).resolve().parents[2]
-        venv_python = repo_root / ".venv" / "bin" / "python"
-        python_exe = os.environ.get("PYTEST_TASAK_PY") or (
-            str(venv_python) if venv_python.exists() else sys.executable
+def _tasak_cmd(*args) -> list[str]:
+    """Command line for a tasak child, preferring the project venv."""
+    venv_python = REPO_ROOT / ".venv" / "bin" / "python"
+    python_exe = os.environ.get("PYTEST_TASAK_PY") or (
+        str(venv_python) if venv_python.exists() else sys.executable
+    )
+    return [python_exe, "-m", "tasak.main", *args]
+
+
+def run_tasak(*args, input_text=None, timeout=10):
+    """Run tasak with the test config; None if it times out."""
+    try:
+        return subprocess.run(
+            _tasak_cmd(*args),
+            capture_output=True,
+            text=True,
+            input=input_text,
+            timeout=timeout,
+            cwd=REPO_ROOT,
         )
-        cmd = [python_exe, "-m", "tasak.main"] + list(args)
+    except subprocess.TimeoutExpired:
+        # This is expected for interactive MCP servers
+        return None
 
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                input=input_text,
-                env=test_env,
-                timeout=timeout,
-            )
-            return result
-        except subprocess.TimeoutExpired:
-            # This is expected for interactive MCP servers
-            return None
+
+class TestMCPApps:
+    """Test MCP type applications."""
 
     def test_mcp_server_tool_call(self):
         """Test calling a tool on MCP server."""
         # Use JSON input for tool call
-        result = self.run_tasak("test-mcp", "add", "--a", "5", "--b", "3")
+        result = run_tasak("test-mcp", "add", "--a", "5", "--b", "3")
         assert result is not None
         assert result.returncode == 0
 
@@ -100,21 +96,21 @@ class TestMCPApps:
 
     def test_mcp_server_multiply(self):
         """Test multiply tool on MCP server."""
-        result = self.run_tasak("test-mcp", "multiply", "--x", "4", "--y", "7")
+        result = run_tasak("test-mcp", "multiply", "--x", "4", "--y", "7")
         assert result is not None
         assert result.returncode == 0
         assert "28" in result.stdout
 
     def test_mcp_server_echo(self):
         """Test echo tool on MCP server."""
-        result = self.run_tasak("test-mcp", "echo", "--message", "Hello MCP!")
+        result = run_tasak("test-mcp", "echo", "--message", "Hello MCP!")
         assert result is not None
         assert result.returncode == 0
         assert "Echo: Hello MCP!" in result.stdout
 
     def test_mcp_server_weather(self):
         """Test weather tool on MCP server."""
-        result = self.run_tasak("test-mcp", "get_weather", "--city", "London")
+        result = run_tasak("test-mcp", "get_weather", "--city", "London")
         assert result is not None
         assert result.returncode == 0
         assert "London" in result.stdout
@@ -122,7 +118,7 @@ class TestMCPApps:
 
     def test_mcp_server_divide(self):
         """Test divide tool on MCP server."""
-        result = self.run_tasak(
+        result = run_tasak(
             "test-mcp", "divide", "--numerator", "10", "--denominator", "2"
         )
         assert result is not None
@@ -131,11 +127,7 @@ class TestMCPApps:
 
     def test_mcp_server_divide_by_zero(self):
         """Test divide by zero error handling."""
-        tool_call = json.dumps(
-            {"tool": "divide", "arguments": {"numerator": 10, "denominator": 0}}
-        )
-
-        result = self.run_tasak("test-mcp", tool_call)
+        result = run_tasak("test-mcp", _TOOL_CALL_DIVIDE_ZERO)
         assert result is not None
         # Should handle the error gracefully
         assert (
@@ -146,9 +138,7 @@ class TestMCPApps:
 
     def test_mcp_server_invalid_tool(self):
         """Test calling non-existent tool."""
-        tool_call = json.dumps({"tool": "nonexistent", "arguments": {}})
-
-        result = self.run_tasak("test-mcp", tool_call)
+        result = run_tasak("test-mcp", _TOOL_CALL_NONEXISTENT)
         assert result is not None
         # Should report tool not found
         assert (
@@ -160,7 +150,7 @@ class TestMCPApps:
     def test_mcp_server_list_tools(self):
         """Test listing available tools."""
         # Send empty input or special command to list tools
-        result = self.run_tasak("test-mcp", "--list-tools")
+        result = run_tasak("test-mcp", "--list-tools")
 
         if result and result.returncode == 0:
             output = result.stdout.lower()
@@ -169,7 +159,7 @@ class TestMCPApps:
 
     def test_mcp_server_help(self):
         """Test help for MCP server."""
-        result = self.run_tasak("test-mcp", "--help")
+        result = run_tasak("test-mcp", "--help")
 
         if result and result.returncode == 0:
             # Simplified help: should list tool names
@@ -186,168 +176,88 @@ class TestMCPApps:
 class TestMCPInteractive:
     """Test interactive MCP features."""
 
-    def setup_method(self):
-        """Create a dummy auth file for MCP tests."""
-        self.temp_home = tempfile.mkdtemp()
-        self.original_home = os.environ.get("HOME")
-        os.environ["HOME"] = self.temp_home
-
-        tasak_dir = Path(self.temp_home) / ".tasak"
-        tasak_dir.mkdir()
-
-        auth_file = tasak_dir / "auth.json"
-        with open(auth_file, "w") as f:
-            json.dump(
-                {
-                    "test-mcp": {
-                        "access_token": "dummy_token",
-                        "expires_at": time.time() + 3600,
-                    }
-                },
-                f,
-            )
-
-    def teardown_method(self):
-        """Clean up the dummy auth file."""
-        if self.original_home is None:
-            del os.environ["HOME"]
-        else:
-            os.environ["HOME"] = self.original_home
-        shutil.rmtree(self.temp_home)
-
-    @classmethod
-    def setup_class(cls):
-        """Set up test environment."""
-        os.chdir(Path(__file__).parent.parent.parent)
-
+    @pytest.mark.skipif(sys.platform == "win32", reason="select() needs POSIX pipes")
     def test_mcp_interactive_mode(self):
         """Test that MCP can run in interactive mode."""
-        test_env = os.environ.copy()
-        test_env["TASAK_CONFIG"] = str(CONFIG_FILE)
-        test_env["TASAK_DEBUG"] = "1"
-        repo_root = Path(__file__).resolve().parents[2]
-        venv_bin = repo_root / ".venv" / "bin"
-        if venv_bin.exists():
-            test_env["PATH"] = f"{venv_bin}:{test_env.get('PATH','')}"
+        # Line-buffered child output so responses arrive as they are printed
+        test_env = {**os.environ, "PYTHONUNBUFFERED": "1"}
 
-        cmd = ["python", "-m", "tasak.main", "test-mcp", "--interactive"]
+        cmd = _tasak_cmd("test-mcp", "--interactive")
 
         # Start the process
         proc = subprocess.Popen(
             cmd,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             env=test_env,
+            cwd=REPO_ROOT,
         )
 
         try:
-            # Give it time to start
-            time.sleep(1)
+            # The session reads stdin once the server is up, so the command can
+            # be sent right away; its response doubles as the readiness signal.
+            proc.stdin.write("echo --message ready\n")
+            proc.stdin.flush()
 
-            # Check if process is still running
-            assert proc.poll() is None, "Process should still be running"
+            assert _wait_for_line(proc, "Echo: ready", timeout=15)
 
-            # Send a tool call
-            if proc.stdin:
-                tool_call = json.dumps({"tool": "add", "arguments": {"a": 1, "b": 2}})
-                proc.stdin.write(tool_call + "\n")
-                proc.stdin.flush()
-
-                # Give it time to process
-                time.sleep(0.5)
-
-                # Try to read output (non-blocking would be better)
-                # This is simplified - real implementation might need async
+            proc.stdin.write("exit\n")
+            proc.stdin.flush()
+            assert proc.wait(timeout=5) == 0
 
         finally:
             # Clean up
-            proc.terminate()
-            try:
-                proc.wait(timeout=2)
-            except subprocess.TimeoutExpired:
-                proc.kill()
-                proc.wait()
+            if proc.poll() is None:
+                proc.terminate()
+                try:
+                    proc.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+
+
+def _wait_for_line(proc, expected, timeout):
+    """Read proc's stdout until a line contains expected, without fixed sleeps."""
+    deadline = time.monotonic() + timeout
+    with selectors.DefaultSelector() as sel:
+        sel.register(proc.stdout, selectors.EVENT_READ)
+        while (remaining := deadline - time.monotonic()) > 0:
+            if not sel.select(remaining):
+                break
+            line = proc.stdout.readline()
+            if not line:  # EOF: the session exited
+                return False
+            if expected in line:
+                return True
+    return False
 
 
 class TestIntegration:
     """Integration tests combining multiple features."""
 
-    def setup_method(self):
-        """Create a dummy auth file for MCP tests."""
-        self.temp_home = tempfile.mkdtemp()
-        self.original_home = os.environ.get("HOME")
-        os.environ["HOME"] = self.temp_home
-
-        tasak_dir = Path(self.temp_home) / ".tasak"
-        tasak_dir.mkdir()
-
-        auth_file = tasak_dir / "auth.json"
-        with open(auth_file, "w") as f:
-            json.dump(
-                {
-                    "test-mcp": {
-                        "access_token": "dummy_token",
-                        "expires_at": time.time() + 3600,
-                    }
-                },
-                f,
-            )
-
-    def teardown_method(self):
-        """Clean up the dummy auth file."""
-        if self.original_home is None:
-            del os.environ["HOME"]
-        else:
-            os.environ["HOME"] = self.original_home
-        shutil.rmtree(self.temp_home)
-
-    @classmethod
-    def setup_class(cls):
-        """Set up test environment."""
-        os.chdir(Path(__file__).parent.parent.parent)
-
-    def run_tasak(self, *args):
-        """Helper to run tasak with test config."""
-        test_env = os.environ.copy()
-        test_env["TASAK_CONFIG"] = str(CONFIG_FILE)
-
-        repo_root = Path(__file__).resolve().parents[2]
-        venv_python = repo_root / ".venv" / "bin" / "python"
-        python_exe = os.environ.get("PYTEST_TASAK_PY") or (
-            str(venv_python) if venv_python.exists() else sys.executable
-        )
-        cmd = [python_exe, "-m", "tasak.main"] + list(args)
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, env=test_env, timeout=10
-        )
-        return result
-
     def test_switching_between_apps(self):
         """Test running different apps in sequence."""
         # Run cmd app
-        result1 = self.run_tasak("hello", "greet", "--name", "Test")
+        result1 = run_tasak("hello", "greet", "--name", "Test")
         assert result1.returncode == 0
         assert "Hello, Test!" in result1.stdout
 
         # Run another cmd app
-        result2 = self.run_tasak("hello-proxy", "--name", "Proxy", "--json")
+        result2 = run_tasak("hello-proxy", "--name", "Proxy", "--json")
         assert result2.returncode == 0
         data = json.loads(result2.stdout)
         assert "greeting" in data
 
         # Run MCP app (if possible)
-        tool_call = json.dumps(
-            {"tool": "echo", "arguments": {"message": "Integration test"}}
-        )
-        result3 = self.run_tasak("test-mcp", tool_call)
+        result3 = run_tasak("test-mcp", _TOOL_CALL_ECHO_INTEGRATION)
         if result3:  # MCP might not work in all environments
             assert "Integration test" in result3.stdout or result3.returncode != 0
 
     def test_config_loading(self):
         """Test that our test config is loaded correctly."""
-        result = self.run_tasak()
+        result = run_tasak()
         assert result.returncode == 0
 
         # Check all our test apps are listed
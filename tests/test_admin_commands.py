@@ -1,7 +1,8 @@
 """Unit tests for admin_commands module."""
 
 import argparse
-from unittest.mock import Mock, mock_open, patch, MagicMock
+import json
+from unittest.mock import Mock, patch, MagicMock
 
 import pytest
 
@@ -15,6 +16,15 @@ from tasak.admin_commands import (
     refresh_app_schema,
     setup_admin_subparsers,
 )
+from tasak.json_io import read_json
+
+
+def _write_auth(home, data):
+    """Create ~/.tasak/auth.json under a temporary home."""
+    auth_file = home / ".tasak" / "auth.json"
+    auth_file.parent.mkdir(parents=True, exist_ok=True)
+    auth_file.write_text(json.dumps(data))
+    return auth_file
 
 
 class TestSetupAdminSubparsers:
@@ -132,15 +142,11 @@ class TestHandleAuth:
         captured = capsys.readouterr()
         assert "does not require authentication" in captured.err
 
-    @patch("tasak.admin_commands.Path.exists")
-    @patch(
-        "builtins.open",
-        new_callable=mock_open,
-        read_data='{"test_app": {"token": "test", "expires_at": 0}}',
-    )
-    def test_check_existing_auth(self, mock_file, mock_exists, capsys):
+    @patch("tasak.admin_commands.Path.home")
+    def test_check_existing_auth(self, mock_home, tmp_path, capsys):
         """Test checking existing auth."""
-        mock_exists.return_value = True
+        mock_home.return_value = tmp_path
+        _write_auth(tmp_path, {"test_app": {"token": "test", "expires_at": 0}})
         args = Mock(app="test_app", check=True, clear=False, refresh=False)
         config = {
             "test_app": {"type": "mcp-remote", "meta": {"server_url": "http://test"}}
@@ -165,15 +171,13 @@ class TestHandleAuth:
         captured = capsys.readouterr()
         assert "Not authenticated for 'test_app'" in captured.out
 
-    @patch(
-        "builtins.open",
-        new_callable=mock_open,
-        read_data='{"test_app": {"token": "test"}}',
-    )
-    @patch("tasak.admin_commands.Path.exists")
-    def test_clear_auth(self, mock_exists, mock_file, capsys):
+    @patch("tasak.admin_commands.Path.home")
+    def test_clear_auth(self, mock_home, tmp_path, capsys):
         """Test clearing authentication."""
-        mock_exists.return_value = True
+        mock_home.return_value = tmp_path
+        auth_file = _write_auth(
+            tmp_path, {"test_app": {"token": "test"}, "other": {"token": "x"}}
+        )
         args = Mock(app="test_app", check=False, clear=True, refresh=False)
         config = {
             "test_app": {"type": "mcp-remote", "meta": {"server_url": "http://test"}}
@@ -183,9 +187,15 @@ class TestHandleAuth:
 
         captured = capsys.readouterr()
         assert "Authentication data cleared for 'test_app'" in captured.out
-
-    def test_refresh_auth(self, capsys):
-        """Test refreshing authentication."""
+        assert json.loads(auth_file.read_text()) == {"other": {"token": "x"}}
+
+    @patch("tasak.auth._refresh_access_token")
+    @patch("tasak.auth._load_saved_token")
+    def test_refresh_auth(self, mock_load, mock_refresh, capsys):
+        """Test refreshing authentication regardless of token expiry."""
+        token = {"access_token": "a", "refresh_token": "r", "expires_at": 9e12}
+        mock_load.return_value = token
+        mock_refresh.return_value = {"access_token": "b"}
         args = Mock(app="test_app", check=False, clear=False, refresh=True)
         config = {
             "test_app": {"type": "mcp-remote", "meta": {"server_url": "http://test"}}
@@ -193,9 +203,23 @@ class TestHandleAuth:
 
         handle_auth(args, config)
 
+        mock_refresh.assert_called_once_with("test_app", token)
         captured = capsys.readouterr()
         assert "Refreshing authentication for 'test_app'" in captured.out
-        assert "Token refresh not yet implemented" in captured.out
+
+    @patch("tasak.auth._load_saved_token", return_value={"access_token": "a"})
+    def test_refresh_auth_without_refresh_token(self, mock_load, capsys):
+        """Refreshing without a saved refresh token fails with a hint."""
+        args = Mock(app="test_app", check=False, clear=False, refresh=True)
+        config = {
+            "test_app": {"type": "mcp-remote", "meta": {"server_url": "http://test"}}
+        }
+
+        with pytest.raises(SystemExit) as exc_info:
+            handle_auth(args, config)
+
+        assert exc_info.value.code == 1
+        assert "No refresh token saved for 'test_app'" in capsys.readouterr().err
 
     @patch("tasak.admin_commands.run_auth_app")
     def test_auth_run(self, mock_run_auth, capsys):
@@ -268,8 +292,8 @@ class TestHandleRefresh:
 class TestRefreshAppSchema:
     """Test refresh_app_schema function."""
 
-    @patch("tasak.admin_commands.SchemaManager")
-    @patch("tasak.admin_commands.MCPRealClient")
+    @patch("tasak.schema_manager.SchemaManager")
+    @patch("tasak.mcp_real_client.MCPRealClient")
     def test_refresh_mcp_app(self, mock_client_class, mock_schema_class, capsys):
         """Test refreshing MCP app schema."""
         mock_client = Mock()
@@ -286,6 +310,20 @@ class TestRefreshAppSchema:
         captured = capsys.readouterr()
         assert "Schema refreshed for 'test_app' (1 tools)" in captured.out
 
+    @patch("tasak.schema_manager.SchemaManager")
+    @patch("tasak.mcp_real_client.MCPRealClient")
+    def test_force_refresh_reuses_client(self, mock_client_class, mock_schema_class):
+        """Forced refresh clears the cache and fetches with one client."""
+        mock_client = mock_client_class.return_value
+        mock_client.get_tool_definitions.return_value = [{"name": "tool1"}]
+
+        app_config = {"type": "mcp", "meta": {"command": "test_server"}}
+        refresh_app_schema("test_app", app_config, force=True)
+
+        mock_client_class.assert_called_once_with("test_app", app_config)
+        mock_client.clear_cache.assert_called_once()
+        mock_client.get_tool_definitions.assert_called_once()
+
     def test_refresh_mcp_remote_app(self, capsys):
         """Test refreshing MCP-remote app schema."""
         # Stub MCPRemoteClient in the imported module to avoid async attributes
@@ -353,11 +391,11 @@ class TestHandleClear:
         captured = capsys.readouterr()
         assert "Cache cleared for 'test_app'" in captured.out
 
-    @patch("builtins.open", new_callable=mock_open, read_data='{"test_app": {}}')
-    @patch("tasak.admin_commands.Path.exists")
-    def test_clear_auth(self, mock_exists, mock_file, capsys):
+    @patch("tasak.admin_commands.Path.home")
+    def test_clear_auth(self, mock_home, tmp_path, capsys):
         """Test clearing auth data."""
-        mock_exists.return_value = True
+        mock_home.return_value = tmp_path
+        _write_auth(tmp_path, {"test_app": {}})
         args = Mock(app="test_app", all=False, cache=False, auth=True, schema=False)
         config = {"test_app": {"type": "mcp-remote"}}
 
@@ -366,17 +404,17 @@ class TestHandleClear:
         captured = capsys.readouterr()
         assert "Authentication cleared for 'test_app'" in captured.out
 
-    @patch("tasak.admin_commands.Path.exists")
-    def test_clear_all(self, mock_exists, capsys):
+    @patch("tasak.admin_commands.Path.home")
+    def test_clear_all(self, mock_home, tmp_path, capsys):
         """Test clearing all data."""
-        # Return True for auth file, False for cache and schema
-        mock_exists.side_effect = [False, True, False]
+        # Only the auth file exists; no cache or schema
+        mock_home.return_value = tmp_path
+        _write_auth(tmp_path, {"test_app": {}})
 
         args = Mock(app="test_app", all=True, cache=False, auth=False, schema=False)
         config = {"test_app": {"type": "mcp"}}
 
-        with patch("builtins.open", mock_open(read_data='{"test_app": {}}')):
-            handle_clear(args, config)
+        handle_clear(args, config)
 
         captured = capsys.readouterr()
         # Should report no cache/schema but clear auth
@@ -419,7 +457,7 @@ class TestHandleInfo:
         assert "Type: cmd" in captured.out
         assert "Name: Test Application" in captured.out
 
-    @patch("tasak.admin_commands.SchemaManager")
+    @patch("tasak.schema_manager.SchemaManager")
     def test_info_with_schema(self, mock_schema_class, capsys):
         """Test info with schema."""
         mock_schema = Mock()
@@ -455,11 +493,10 @@ class TestHandleList:
         captured = capsys.readouterr()
         assert "No applications configured" in captured.out
 
-    @patch("builtins.open", new_callable=mock_open, read_data="{}")
-    @patch("tasak.admin_commands.Path.exists")
-    def test_list_apps(self, mock_exists, mock_file, capsys):
+    @patch("tasak.admin_commands.Path.home")
+    def test_list_apps(self, mock_home, tmp_path, capsys):
         """Test listing configured apps."""
-        mock_exists.return_value = False
+        mock_home.return_value = tmp_path
         args = Mock(verbose=False)
         config = {
             "apps_config": {"enabled_apps": ["app1", "app2"]},
@@ -475,16 +512,14 @@ class TestHandleList:
         assert "Command App" in captured.out
         assert "app2" in captured.out
         assert "mcp" in captured.out
+        assert "[no data]" in captured.out
 
-    @patch("builtins.open", new_callable=mock_open, read_data='{"app1": {}}')
-    @patch("tasak.admin_commands.Path.exists")
-    def test_list_apps_with_auth(self, mock_exists, mock_file, capsys):
+    @patch("tasak.admin_commands.Path.home")
+    def test_list_apps_with_auth(self, mock_home, tmp_path, capsys):
         """Test listing shows auth status."""
-        mock_exists.side_effect = [
-            True,
-            False,
-            False,
-        ]  # auth exists, no cache, no schema
+        mock_home.return_value = tmp_path
+        (tmp_path / ".tasak").mkdir()
+        (tmp_path / ".tasak" / "auth.json").write_text('{"app1": {}}')
         args = Mock(verbose=False)
         config = {
             "apps_config": {"enabled_apps": ["app1"]},
@@ -496,7 +531,34 @@ class TestHandleList:
         captured = capsys.readouterr()
         assert "[auth]" in captured.out
 
-    def test_list_verbose(self, capsys):
+    @patch("tasak.admin_commands.Path.home")
+    def test_list_reads_state_once(self, mock_home, tmp_path, capsys):
+        """auth.json is parsed once and cache/schema dirs are listed once."""
+        mock_home.return_value = tmp_path
+        tasak_dir = tmp_path / ".tasak"
+        (tasak_dir / "cache").mkdir(parents=True)
+        (tasak_dir / "schemas").mkdir()
+        (tasak_dir / "auth.json").write_text('{"app2": {}}')
+        (tasak_dir / "cache" / "app1.json").write_text("{}")
+        (tasak_dir / "schemas" / "app1.json").write_text("{}")
+        args = Mock(verbose=False)
+        config = {
+            "apps_config": {"enabled_apps": ["app1", "app2", "app3"]},
+            "app1": {"type": "mcp"},
+            "app2": {"type": "mcp-remote"},
+            "app3": {"type": "cmd"},
+        }
+
+        with patch("tasak.admin_commands.read_json", wraps=read_json) as mock_load:
+            handle_list(args, config)
+        mock_load.assert_called_once()
+
+        lines = capsys.readouterr().out.splitlines()
+        assert "[cached, schema]" in next(line for line in lines if "app1" in line)
+        assert "[auth]" in next(line for line in lines if "app2" in line)
+        assert "[no data]" in next(line for line in lines if "app3" in line)
+
+    def test_list_verbose(self, tmp_path, capsys):
         """Test verbose listing."""
         args = Mock(verbose=True)
         config = {
@@ -508,7 +570,7 @@ class TestHandleList:
             },
         }
 
-        with patch("tasak.admin_commands.Path.exists", return_value=False):
+        with patch("tasak.admin_commands.Path.home", return_value=tmp_path):
             handle_list(args, config)
 
         captured = capsys.readouterr()
@@ -1,7 +1,18 @@
+import os
 import subprocess
-from unittest.mock import patch, MagicMock, call
+import sys
+import threading
 
-from tasak.app_runner import run_cmd_app, _run_proxy_mode, _execute_command
+import pytest
+from unittest.mock import patch, MagicMock
+
+from tasak.app_runner import (
+    run_cmd_app,
+    _run_proxy_mode,
+    _exec_command,
+    _execute_command,
+    _stream_output,
+)
 
 
 class TestRunCmdApp:
@@ -35,6 +46,12 @@ class TestRunCmdApp:
 class TestRunProxyMode:
     """Tests for _run_proxy_mode function."""
 
+    @pytest.fixture(autouse=True)
+    def _no_tty(self):
+        """Keep the piped path even when pytest runs attached to a terminal."""
+        with patch("tasak.app_runner._stdout_is_tty", return_value=False):
+            yield
+
     @patch("tasak.app_runner._execute_command")
     def test_proxy_mode_with_string_command(self, mock_execute):
         """Test proxy mode with command as string."""
@@ -94,16 +111,40 @@ class TestRunProxyMode:
                 mock_exit.assert_called_once_with(1)
 
 
+class TestExecCommand:
+    """Tests for the exec path used when stdout is a terminal."""
+
+    @patch("tasak.app_runner._execute_command")
+    @patch("tasak.app_runner.os.execvp")
+    @patch("tasak.app_runner._stdout_is_tty", return_value=True)
+    def test_tty_proxy_replaces_process(self, mock_tty, mock_execvp, mock_execute):
+        """On a terminal the command is exec'd instead of piped."""
+        _run_proxy_mode({"command": "git status"}, ["--short"])
+
+        mock_execvp.assert_called_once_with("git", ["git", "status", "--short"])
+        mock_execute.assert_not_called()
+
+    @patch("tasak.app_runner.os.execvp", side_effect=FileNotFoundError())
+    @patch("sys.exit")
+    @patch("sys.stderr", new_callable=MagicMock)
+    def test_exec_command_not_found(self, mock_stderr, mock_exit, mock_execvp):
+        """A missing executable reports the same error as the piped path."""
+        _exec_command(["nonexistent_command"])
+
+        assert "Command not found" in str(mock_stderr.write.call_args_list)
+        mock_exit.assert_called_once_with(1)
+
+
 class TestExecuteCommand:
     """Tests for _execute_command function."""
 
+    @patch("tasak.app_runner._stream_output")
     @patch("subprocess.Popen")
     @patch("sys.stderr", new_callable=MagicMock)
-    def test_execute_command_success(self, mock_stderr, mock_popen):
+    def test_execute_command_success(self, mock_stderr, mock_popen, mock_stream):
         """Test successful command execution."""
         # Mock process
         mock_process = MagicMock()
-        mock_process.stdout = ["Line 1\n", "Line 2\n"]
         mock_process.returncode = 0
         mock_popen.return_value = mock_process
 
@@ -113,19 +154,19 @@ class TestExecuteCommand:
             ["echo", "hello"],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True,
         )
+        mock_stream.assert_called_once_with(mock_process.stdout)
         mock_process.wait.assert_called_once()
 
+    @patch("tasak.app_runner._stream_output")
     @patch("subprocess.Popen")
     @patch("sys.exit")
     @patch("sys.stderr", new_callable=MagicMock)
-    def test_execute_command_non_zero_exit(self, mock_stderr, mock_exit, mock_popen):
+    def test_execute_command_non_zero_exit(
+        self, mock_stderr, mock_exit, mock_popen, mock_stream
+    ):
         """Test command execution with non-zero exit code."""
         mock_process = MagicMock()
-        mock_process.stdout = ["Error output\n"]
         mock_process.returncode = 2
         mock_popen.return_value = mock_process
 
@@ -145,6 +186,7 @@ class TestExecuteCommand:
         mock_stderr.write.assert_called()
         mock_exit.assert_called_once_with(1)
 
+    @patch("tasak.app_runner._stream_output")
     @patch("subprocess.Popen")
     @patch("sys.exit")
     @patch("sys.stderr", new_callable=MagicMock)
@@ -153,12 +195,11 @@ class TestExecuteCommand:
         mock_stderr,
         mock_exit,
         mock_popen,
+        mock_stream,
     ):
         """Test command execution interrupted by user."""
-        mock_process = MagicMock()
-        mock_process.stdout = MagicMock()
-        mock_process.stdout.__iter__.side_effect = KeyboardInterrupt()
-        mock_popen.return_value = mock_process
+        mock_popen.return_value = MagicMock()
+        mock_stream.side_effect = KeyboardInterrupt()
 
         _execute_command(["sleep", "10"])
 
@@ -181,33 +222,40 @@ class TestExecuteCommand:
         mock_stderr.write.assert_called()
         mock_exit.assert_called_once_with(1)
 
-    @patch("subprocess.Popen")
-    @patch("builtins.print")
-    def test_execute_command_output_streaming(self, mock_print, mock_popen):
-        """Test that command output is streamed line by line."""
-        mock_process = MagicMock()
-        mock_process.stdout = ["Line 1\n", "Line 2\n", "Line 3\n"]
-        mock_process.returncode = 0
-        mock_popen.return_value = mock_process
+    def test_execute_command_output_streaming(self, capfdbinary):
+        """Test that the child's raw output reaches stdout unchanged."""
+        _execute_command(
+            [sys.executable, "-c", "import sys; sys.stdout.write('Line 1\\nLine 2\\n')"]
+        )
+
+        captured = capfdbinary.readouterr()
+        assert captured.out == b"Line 1\nLine 2\n"
 
-        _execute_command(["cat", "file.txt"])
+    def test_stream_output_copies_all_chunks(self, capsysbinary):
+        """Output larger than one read chunk is copied in order."""
+        payload = b"x" * 70000 + b"\xff\xfe tail"
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, payload[:60000])
+        writer = os.fdopen(write_fd, "wb")
+        with os.fdopen(read_fd, "rb") as pipe:
 
-        # Check that each line was printed
-        expected_calls = [
-            call("Line 1\n", end=""),
-            call("Line 2\n", end=""),
-            call("Line 3\n", end=""),
-        ]
-        # Filter only the output print calls (not the debug message)
-        output_calls = [c for c in mock_print.call_args_list if c[1].get("end") == ""]
-        assert output_calls == expected_calls
+            def feed():
+                writer.write(payload[60000:])
+                writer.close()
 
+            t = threading.Thread(target=feed)
+            t.start()
+            _stream_output(pipe)
+            t.join()
+
+        assert capsysbinary.readouterr().out == payload
+
+    @patch("tasak.app_runner._stream_output")
     @patch("subprocess.Popen")
     @patch("sys.stderr", new_callable=MagicMock)
-    def test_execute_command_debug_message(self, mock_stderr, mock_popen):
+    def test_execute_command_debug_message(self, mock_stderr, mock_popen, mock_stream):
         """Test that debug message is printed to stderr."""
         mock_process = MagicMock()
-        mock_process.stdout = []
         mock_process.returncode = 0
         mock_popen.return_value = mock_process
 
@@ -224,12 +272,18 @@ class TestExecuteCommand:
 class TestIntegration:
     """Integration tests for the app_runner module."""
 
+    @pytest.fixture(autouse=True)
+    def _no_tty(self):
+        """Keep the piped path even when pytest runs attached to a terminal."""
+        with patch("tasak.app_runner._stdout_is_tty", return_value=False):
+            yield
+
+    @patch("tasak.app_runner._stream_output")
     @patch("subprocess.Popen")
     @patch("builtins.print")
-    def test_full_flow_success(self, mock_print, mock_popen):
+    def test_full_flow_success(self, mock_print, mock_popen, mock_stream):
         """Test complete flow from run_cmd_app to successful execution."""
         mock_process = MagicMock()
-        mock_process.stdout = ["Hello, World!\n"]
         mock_process.returncode = 0
         mock_popen.return_value = mock_process
 
@@ -241,12 +295,12 @@ class TestIntegration:
         # Check the command was split correctly
         assert mock_popen.call_args[0][0] == ["echo", "Hello,", "World!"]
 
+    @patch("tasak.app_runner._stream_output")
     @patch("subprocess.Popen")
     @patch("sys.exit")
-    def test_full_flow_failure(self, mock_exit, mock_popen):
+    def test_full_flow_failure(self, mock_exit, mock_popen, mock_stream):
         """Test complete flow from run_cmd_app to failed execution."""
         mock_process = MagicMock()
-        mock_process.stdout = ["Error!\n"]
         mock_process.returncode = 1
         mock_popen.return_value = mock_process
 
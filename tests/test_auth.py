@@ -1,77 +1,80 @@
 """Unit tests for auth module."""
 
 import json
-from pathlib import Path
-from unittest.mock import Mock, mock_open, patch
+import os
+import socket
+import stat
+import threading
+import time
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from tasak.auth import (
-    OAuthCallbackHandler,
     run_auth_app,
+    _extract_authorization_code,
+    _open_callback_socket,
+    _wait_for_authorization_code,
     _do_generic_oauth_auth,
     _do_atlassian_auth,
+    _load_valid_token,
+    _load_saved_token,
     _save_token,
+    _token_session,
 )
+from tasak.json_io import read_json
 
 
-class TestOAuthCallbackHandler:
-    """Test OAuthCallbackHandler class."""
+class TestOAuthCallback:
+    """Test the raw-socket OAuth redirect listener."""
 
-    @patch("tasak.auth.OAuthCallbackHandler.handle")
-    def test_do_get_with_code(self, mock_handle):
-        """Test handling GET request with authorization code."""
-        # Create handler without triggering automatic handle()
-        handler = OAuthCallbackHandler.__new__(OAuthCallbackHandler)
-        handler.path = "/callback?code=test_auth_code&state=test_state"
-        handler.send_response = Mock()
-        handler.send_header = Mock()
-        handler.end_headers = Mock()
-        handler.wfile = Mock()
-
-        # Import to access global variable
-        import tasak.auth
-
-        handler.do_GET()
-
-        # Check that authorization code was captured
-        assert tasak.auth.authorization_code == "test_auth_code"
-        handler.send_response.assert_called_with(200)
-        handler.wfile.write.assert_called()
-
-    @patch("tasak.auth.OAuthCallbackHandler.handle")
-    def test_do_get_without_code(self, mock_handle):
-        """Test handling GET request without authorization code."""
-        # Create handler without triggering automatic handle()
-        handler = OAuthCallbackHandler.__new__(OAuthCallbackHandler)
-        handler.path = "/callback?error=access_denied"
-        handler.send_response = Mock()
-        handler.send_header = Mock()
-        handler.end_headers = Mock()
-        handler.wfile = Mock()
-
-        handler.do_GET()
-
-        handler.send_response.assert_called_with(400)
-        handler.wfile.write.assert_called()
-
-    @patch("tasak.auth.OAuthCallbackHandler.handle")
-    def test_do_get_with_encoded_code(self, mock_handle):
-        """Test handling GET request with URL-encoded authorization code."""
-        # Create handler without triggering automatic handle()
-        handler = OAuthCallbackHandler.__new__(OAuthCallbackHandler)
-        handler.path = "/callback?code=test%2Bauth%2Bcode"
-        handler.send_response = Mock()
-        handler.send_header = Mock()
-        handler.end_headers = Mock()
-        handler.wfile = Mock()
-
-        import tasak.auth
-
-        handler.do_GET()
-
-        # Check that code was properly decoded
-        assert tasak.auth.authorization_code == "test+auth+code"
+    def test_extract_code(self):
+        """The authorization code is taken from the request line."""
+        request = (
+            b"GET /callback?code=test_auth_code&state=test_state HTTP/1.1\r\n"
+            b"Host: localhost\r\n\r\n"
+        )
+        assert _extract_authorization_code(request) == "test_auth_code"
+
+    def test_extract_code_not_first_parameter(self):
+        """Only an exact ``code`` parameter matches, wherever it appears."""
+        request = b"GET /?xcode=no&state=s&code=a+b%3Ac HTTP/1.1\r\n\r\n"
+        assert _extract_authorization_code(request) == "a b:c"
+
+    def test_extract_code_missing(self):
+        """Requests without a code yield None."""
+        request = b"GET /callback?error=access_denied HTTP/1.1\r\n\r\n"
+        assert _extract_authorization_code(request) is None
+        assert _extract_authorization_code(b"") is None
+
+    def test_extract_encoded_code(self):
+        """URL-encoded authorization codes are decoded."""
+        request = b"GET /callback?code=test%252Bauth%252Bcode HTTP/1.1\r\n\r\n"
+        assert _extract_authorization_code(request) == "test+auth+code"
+
+    def test_wait_for_code_over_socket(self):
+        """Favicon gets a 204, other code-less requests a 400; first code wins."""
+        sock = _open_callback_socket()
+        port = sock.getsockname()[1]
+        responses = []
+
+        def browser():
+            for path in ("/favicon.ico", "/?error=denied", "/?code=abc&state=s"):
+                with socket.create_connection(("127.0.0.1", port)) as c:
+                    c.sendall(f"GET {path} HTTP/1.1\r\nHost: x\r\n\r\n".encode())
+                    responses.append(c.recv(4096))
+
+        t = threading.Thread(target=browser)
+        t.start()
+        with sock:
+            code = _wait_for_authorization_code(sock)
+        t.join()
+
+        assert code == "abc"
+        assert responses[0].startswith(b"HTTP/1.1 204")
+        assert responses[1].startswith(b"HTTP/1.1 400")
+        assert responses[2].startswith(b"HTTP/1.1 200")
+        assert b"Authentication successful" in responses[2]
 
 
 class TestRunAuthApp:
@@ -116,8 +119,8 @@ class TestDoGenericOAuthAuth:
         captured = capsys.readouterr()
         assert "Failed to discover OAuth endpoints" in captured.err
 
-    @patch("tasak.auth.webbrowser.open")
-    @patch("tasak.auth.requests.post")
+    @patch("webbrowser.open")
+    @patch("requests.Session.post")
     @patch("tasak.dynamic_registration.register_oauth_client")
     @patch("tasak.oauth_discovery.discover_oauth_endpoints")
     def test_successful_oauth_flow(
@@ -143,87 +146,252 @@ class TestDoGenericOAuthAuth:
         }
         mock_post.return_value = mock_response
 
-        # Set authorization code
-        import tasak.auth
+        mock_sock = MagicMock()
+        mock_sock.getsockname.return_value = ("127.0.0.1", 8080)
 
-        tasak.auth.authorization_code = None
+        with (
+            patch("tasak.auth._open_callback_socket", return_value=mock_sock),
+            patch(
+                "tasak.auth._wait_for_authorization_code", return_value="test_code"
+            ) as mock_wait,
+            patch("tasak.auth._save_token") as mock_save,
+        ):
+            _do_generic_oauth_auth("test_app", "http://test.com", "dynamic_client")
 
-        with patch("tasak.auth.socketserver.TCPServer") as mock_server:
-            # Mock finding free port
-            mock_port_finder = Mock()
-            mock_port_finder.__enter__ = Mock(return_value=mock_port_finder)
-            mock_port_finder.__exit__ = Mock(return_value=None)
-            mock_port_finder.server_address = ("localhost", 8080)
+            mock_wait.assert_called_once_with(mock_sock)
+            mock_save.assert_called_once()
+            mock_browser.assert_called_once()
+            auth_url = mock_browser.call_args[0][0]
+            assert "redirect_uri=http://localhost:8080" in auth_url
+            assert "code=test_code" in mock_post.call_args[1]["data"]
 
-            # Mock actual server
-            mock_server_instance = Mock()
-            mock_server_instance.__enter__ = Mock(return_value=mock_server_instance)
-            mock_server_instance.__exit__ = Mock(return_value=None)
 
-            def set_auth_code():
-                tasak.auth.authorization_code = "test_code"
+class TestSaveToken:
+    """Test _save_token function."""
 
-            mock_server_instance.handle_request = Mock(side_effect=set_auth_code)
+    def test_save_token_new_file(self, tmp_path):
+        """Test saving tokens to a new file in a missing directory."""
+        auth_file = tmp_path / ".tasak" / "auth.json"
+        with patch("tasak.auth.AUTH_FILE_PATH", auth_file):
+            _save_token("test_app", {"access_token": "token123"})
 
-            # First call returns mock for port finding, second for actual server
-            mock_server.side_effect = [mock_port_finder, mock_server_instance]
+        data = json.loads(auth_file.read_text())
+        assert data["test_app"]["access_token"] == "token123"
+        assert [p.name for p in auth_file.parent.iterdir()] == ["auth.json"]
+        if os.name == "posix":
+            assert stat.S_IMODE(auth_file.stat().st_mode) == 0o600
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    def test_save_token_tightens_existing_permissions(self, tmp_path):
+        """A world-readable auth file is replaced by a 0600 one."""
+        auth_file = tmp_path / "auth.json"
+        auth_file.write_text("{}")
+        auth_file.chmod(0o644)
+        with patch("tasak.auth.AUTH_FILE_PATH", auth_file):
+            _save_token("test_app", {"access_token": "token123"})
+
+        assert stat.S_IMODE(auth_file.stat().st_mode) == 0o600
+
+    def test_save_token_existing_file(self, tmp_path):
+        """Test saving tokens to existing file."""
+        auth_file = tmp_path / "auth.json"
+        auth_file.write_text('{"existing_app": {}}')
+        with patch("tasak.auth.AUTH_FILE_PATH", auth_file):
+            _save_token("test_app", {"access_token": "token123"})
 
-            with patch("tasak.auth._save_token") as mock_save:
-                _do_generic_oauth_auth("test_app", "http://test.com", "dynamic_client")
+        data = json.loads(auth_file.read_text())
+        assert "existing_app" in data
+        assert "test_app" in data
+        # Machine-only file: written compact, without indentation
+        assert b"\n" not in auth_file.read_bytes()
+
+    def test_save_token_failed_write_keeps_existing_file(self, tmp_path):
+        """A failure before the swap leaves the old auth file intact."""
+        auth_file = tmp_path / "auth.json"
+        auth_file.write_text('{"existing_app": {}}')
+        with patch("tasak.auth.AUTH_FILE_PATH", auth_file):
+            with patch("tasak.auth.os.fsync", side_effect=OSError("disk full")):
+                with pytest.raises(OSError):
+                    _save_token("test_app", {"access_token": "token123"})
 
-                mock_save.assert_called_once()
-                mock_browser.assert_called_once()
+        assert json.loads(auth_file.read_text()) == {"existing_app": {}}
+        assert [p.name for p in tmp_path.iterdir()] == ["auth.json"]
+
+    def test_saved_tokens_are_not_reparsed(self, tmp_path):
+        """Saves reuse the tokens already read; outside edits are re-read."""
+        auth_file = tmp_path / "auth.json"
+        auth_file.write_text('{"existing_app": {}}')
+        with (
+            patch("tasak.auth.AUTH_FILE_PATH", auth_file),
+            patch("tasak.auth._auth_file_cache", None),
+            patch("tasak.auth.read_json", wraps=read_json) as mock_read,
+        ):
+            _save_token("a", {"access_token": "1"})
+            _save_token("b", {"access_token": "2"})
+            assert _load_saved_token("a")["access_token"] == "1"
+            assert mock_read.call_count == 1
+
+            auth_file.write_text('{"other": {"access_token": "x"}}')
+            assert _load_saved_token("other") == {"access_token": "x"}
+            assert mock_read.call_count == 2
+
+    def test_save_token_stamps_expires_at(self, tmp_path):
+        """An absolute expires_at is derived from expires_in on save."""
+        auth_file = tmp_path / "auth.json"
+        with patch("tasak.auth.AUTH_FILE_PATH", auth_file):
+            with patch("tasak.auth.time.time", return_value=1000):
+                _save_token("test_app", {"access_token": "t", "expires_in": 3600})
+
+        assert json.loads(auth_file.read_text())["test_app"]["expires_at"] == 4600
+
+
+class TestLoadValidToken:
+    """Test _load_valid_token function."""
+
+    def _write(self, tmp_path, token):
+        auth_file = tmp_path / "auth.json"
+        auth_file.write_text(json.dumps({"atlassian": token}))
+        return auth_file
+
+    def test_returns_unexpired_token(self, tmp_path):
+        """A token well before expiry is returned as-is."""
+        token = {"access_token": "t", "expires_at": time.time() + 3600}
+        with patch("tasak.auth.AUTH_FILE_PATH", self._write(tmp_path, token)):
+            assert _load_valid_token("atlassian") == token
+
+    def test_token_inside_margin_is_expired(self, tmp_path):
+        """A token expiring within the safety margin is not reused."""
+        token = {"access_token": "t", "expires_at": time.time() + 30}
+        with patch("tasak.auth.AUTH_FILE_PATH", self._write(tmp_path, token)):
+            assert _load_valid_token("atlassian") is None
+
+    def test_margin_includes_jitter(self, tmp_path):
+        """The refresh margin is extended by a random jitter."""
+        token = {"access_token": "t", "expires_at": time.time() + 75}
+        with patch("tasak.auth.AUTH_FILE_PATH", self._write(tmp_path, token)):
+            with patch("tasak.auth.random.uniform", return_value=0):
+                assert _load_valid_token("atlassian") == token
+            with patch("tasak.auth.random.uniform", return_value=30):
+                assert _load_valid_token("atlassian") is None
+
+    def test_legacy_token_uses_obtained_at(self, tmp_path):
+        """Tokens without expires_at fall back to obtained_at + expires_in."""
+        token = {"access_token": "t", "obtained_at": time.time(), "expires_in": 3600}
+        with patch("tasak.auth.AUTH_FILE_PATH", self._write(tmp_path, token)):
+            assert _load_valid_token("atlassian") == token
+
+    @patch("requests.Session.post")
+    def test_expired_token_is_refreshed_silently(self, mock_post, tmp_path):
+        """An expired token with a refresh token uses the refresh grant."""
+        token = {
+            "access_token": "old",
+            "refresh_token": "r1",
+            "expires_at": time.time() - 10,
+            "token_url": "https://auth.example/token",
+            "client_id": "cid",
+        }
+        auth_file = self._write(tmp_path, token)
+        mock_post.return_value = Mock(
+            status_code=200,
+            json=Mock(return_value={"access_token": "new", "expires_in": 3600}),
+        )
 
+        with patch("tasak.auth.AUTH_FILE_PATH", auth_file):
+            result = _load_valid_token("atlassian")
+
+        assert result["access_token"] == "new"
+        assert result["refresh_token"] == "r1"
+        url = mock_post.call_args[0][0]
+        payload = mock_post.call_args[1]["data"]
+        assert url == "https://auth.example/token"
+        assert payload == {
+            "grant_type": "refresh_token",
+            "client_id": "cid",
+            "refresh_token": "r1",
+        }
+        saved = json.loads(auth_file.read_text())["atlassian"]
+        assert saved["access_token"] == "new"
+        assert saved["expires_at"] > time.time()
+
+    @patch("requests.Session.post")
+    def test_rejected_refresh_falls_back_to_interactive(self, mock_post, tmp_path):
+        """A refused refresh grant returns None so the browser flow runs."""
+        token = {
+            "access_token": "old",
+            "refresh_token": "r1",
+            "expires_at": time.time() - 10,
+            "token_url": "https://auth.example/token",
+            "client_id": "cid",
+        }
+        mock_post.return_value = Mock(status_code=400)
+        with patch("tasak.auth.AUTH_FILE_PATH", self._write(tmp_path, token)):
+            assert _load_valid_token("atlassian") is None
+
+    @pytest.mark.parametrize(
+        "json_result",
+        [ValueError("Expecting value"), ["not", "a", "dict"], {"error": "nope"}],
+        ids=["html_body", "not_a_dict", "no_access_token"],
+    )
+    @patch("requests.Session.post")
+    def test_unusable_refresh_response_falls_back(
+        self, mock_post, json_result, tmp_path
+    ):
+        """A 200 without a usable token returns None and saves nothing."""
+        token = {
+            "access_token": "old",
+            "refresh_token": "r1",
+            "expires_at": time.time() - 10,
+            "token_url": "https://auth.example/token",
+            "client_id": "cid",
+        }
+        auth_file = self._write(tmp_path, token)
+        json_mock = (
+            Mock(side_effect=json_result)
+            if isinstance(json_result, Exception)
+            else Mock(return_value=json_result)
+        )
+        mock_post.return_value = Mock(status_code=200, json=json_mock)
 
-class TestSaveToken:
-    """Test _save_token function."""
+        with patch("tasak.auth.AUTH_FILE_PATH", auth_file):
+            assert _load_valid_token("atlassian") is None
 
-    @patch("builtins.open", new_callable=mock_open)
-    def test_save_token_new_file(self, mock_file):
-        """Test saving tokens to new file."""
-        with patch.object(Path, "exists", return_value=False):
-            with patch.object(Path, "mkdir") as mock_mkdir:
-                with patch("os.chmod") as mock_chmod:
-                    _save_token("test_app", {"access_token": "token123"})
+        assert json.loads(auth_file.read_text())["atlassian"]["access_token"] == "old"
 
-                    mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
-                    mock_file.assert_called()
-                    mock_chmod.assert_called_once()
+    def test_token_session_is_reused(self):
+        """Token endpoint calls share one keep-alive session."""
+        with patch("tasak.auth._token_http_session", None):
+            assert _token_session() is _token_session()
+            assert _token_session().headers["User-Agent"] == "TASAK/1.0"
 
-        # Check what was written
-        handle = mock_file()
-        written_data = "".join(call[0][0] for call in handle.write.call_args_list)
-        data = json.loads(written_data)
-        assert "test_app" in data
-        assert data["test_app"]["access_token"] == "token123"
+    def test_missing_file(self, tmp_path):
+        """No auth file means no token."""
+        with patch("tasak.auth.AUTH_FILE_PATH", tmp_path / "missing.json"):
+            assert _load_valid_token("atlassian") is None
 
-    @patch("builtins.open", new_callable=mock_open, read_data='{"existing_app": {}}')
-    def test_save_token_existing_file(self, mock_file):
-        """Test saving tokens to existing file."""
-        with patch.object(Path, "exists", return_value=True):
-            with patch("os.chmod") as mock_chmod:
-                _save_token("test_app", {"access_token": "token123"})
+    @patch("webbrowser.open")
+    @patch("tasak.auth.get_oauth_config_for_service")
+    def test_atlassian_auth_skips_flow_with_valid_token(
+        self, mock_config, mock_browser, tmp_path
+    ):
+        """A valid saved token short-circuits the interactive flow."""
+        token = {"access_token": "t", "expires_at": time.time() + 3600}
+        with patch("tasak.auth.AUTH_FILE_PATH", self._write(tmp_path, token)):
+            _do_atlassian_auth()
 
-                # Check that existing data was preserved
-                handle = mock_file()
-                written_data = "".join(
-                    call[0][0] for call in handle.write.call_args_list
-                )
-                data = json.loads(written_data)
-                assert "existing_app" in data
-                assert "test_app" in data
-                mock_chmod.assert_called_once()
+        mock_config.assert_not_called()
+        mock_browser.assert_not_called()
 
 
 class TestDoAtlassianAuth:
     """Test _do_atlassian_auth function."""
 
-    @patch("tasak.auth.webbrowser.open")
-    @patch("tasak.auth.socketserver.TCPServer")
-    @patch("tasak.auth.requests.post")
+    @patch("webbrowser.open")
+    @patch("tasak.auth._wait_for_authorization_code", return_value="atlassian_code")
+    @patch("tasak.auth._open_callback_socket")
+    @patch("requests.Session.post")
     @patch("tasak.auth.get_oauth_config_for_service")
     def test_atlassian_auth_flow(
-        self, mock_config, mock_post, mock_server, mock_browser
+        self, mock_config, mock_post, mock_open_sock, mock_wait, mock_browser
     ):
         """Test Atlassian-specific auth flow."""
         # Setup mocks
@@ -242,27 +410,42 @@ class TestDoAtlassianAuth:
         }
         mock_post.return_value = mock_response
 
-        # Mock server with context manager support
-        mock_server_instance = Mock()
-        mock_server_instance.__enter__ = Mock(return_value=mock_server_instance)
-        mock_server_instance.__exit__ = Mock(return_value=None)
-
-        # Set authorization code when handle_request is called
-        import tasak.auth
+        mock_sock = MagicMock()
+        mock_sock.getsockname.return_value = ("127.0.0.1", 5598)
+        mock_open_sock.return_value = mock_sock
 
-        def set_auth_code():
-            tasak.auth.authorization_code = "atlassian_code"
-
-        mock_server_instance.handle_request = Mock(side_effect=set_auth_code)
-        mock_server.return_value = mock_server_instance
-
-        with patch("tasak.auth._save_token") as mock_save:
+        with (
+            patch("tasak.auth._save_token") as mock_save,
+            patch("tasak.auth._load_valid_token", return_value=None),
+        ):
             _do_atlassian_auth()
 
             # Should use Atlassian-specific port
-            mock_server.assert_called_once()
-            call_args = mock_server.call_args[0]
-            assert call_args[0][1] == 5598  # Atlassian required port
+            mock_open_sock.assert_called_once_with(5598)
+            mock_wait.assert_called_once_with(mock_sock)
 
             mock_browser.assert_called_once()
             mock_save.assert_called_once()
+
+    @patch("webbrowser.open")
+    @patch("tasak.auth._wait_for_authorization_code", side_effect=KeyboardInterrupt)
+    @patch("tasak.auth.get_oauth_config_for_service")
+    def test_ctrl_c_closes_callback_socket(self, mock_config, mock_wait, mock_browser):
+        """Interrupting the wait still releases the listening port."""
+        mock_config.return_value = {
+            "auth_url": "https://auth.example/authorize",
+            "token_url": "https://auth.example/token",
+            "client_id": "cid",
+            "required_port": None,
+        }
+        sock = _open_callback_socket()
+
+        with (
+            patch("tasak.auth._open_callback_socket", return_value=sock),
+            patch("tasak.auth._load_valid_token", return_value=None),
+            patch("tasak.auth.get_saved_registration", return_value=None),
+        ):
+            with pytest.raises(KeyboardInterrupt):
+                _do_atlassian_auth()
+
+        assert sock.fileno() == -1
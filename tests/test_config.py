@@ -121,6 +121,32 @@ class TestFindLocalConfigPaths:
             assert result[0] == root_config
             assert result[1] == project_config
 
+    def test_unreadable_directory_falls_back_to_stat(self, tmp_path):
+        """Directories that cannot be listed are still probed per path."""
+        work_dir = tmp_path / "project"
+        work_dir.mkdir()
+        config_file = work_dir / "tasak.yaml"
+        config_file.write_text("test: config")
+
+        with patch("pathlib.Path.cwd", return_value=work_dir):
+            with patch("tasak.config.os.scandir", side_effect=PermissionError):
+                result = find_local_config_paths()
+        assert result == [config_file]
+
+    def test_repeated_lookup_is_memoized(self, tmp_path):
+        """A second lookup from the same cwd does not walk the filesystem."""
+        work_dir = tmp_path / "project"
+        work_dir.mkdir()
+        config_file = work_dir / "tasak.yaml"
+        config_file.write_text("test: config")
+
+        with patch("pathlib.Path.cwd", return_value=work_dir):
+            first = find_local_config_paths()
+            with patch("tasak.config._scan_dir_for_configs") as mock_scan:
+                second = find_local_config_paths()
+                mock_scan.assert_not_called()
+        assert first == second == [config_file]
+
 
 class TestLoadAndMergeConfigs:
     """Tests for load_and_merge_configs function."""
@@ -266,8 +292,12 @@ class TestLoadAndMergeConfigs:
                 # Local header should override
                 assert result["header"] == "Local Config"
 
-                # Local app1 should completely override global app1
-                assert result["app1"] == {"name": "Local App", "extra": "field"}
+                # Local app1 is deep-merged over global app1
+                assert result["app1"] == {
+                    "name": "Local App",
+                    "version": "1.0",
+                    "extra": "field",
+                }
 
                 # app2 from global should remain
                 assert result["app2"] == {"name": "App Two"}
@@ -351,3 +381,137 @@ class TestLoadAndMergeConfigs:
             with patch("pathlib.Path.home", return_value=mock_home):
                 result = load_and_merge_configs()
                 assert result == {}
+
+
+class TestDeepMerge:
+    """Tests for the nested config merge."""
+
+    def test_nested_dicts_merge_and_scalars_replace(self):
+        """Dicts are merged key by key; lists and scalars are last-wins."""
+        from tasak.config import _deep_merge
+
+        dst = {
+            "apps_config": {"enabled_apps": ["a"], "isolate": False},
+            "app": {"meta": {"command": "old", "args": ["x"]}},
+        }
+        src = {
+            "apps_config": {"enabled_apps": ["b"]},
+            "app": {"meta": {"command": "new"}},
+            "extra": {"k": 1},
+        }
+        result = _deep_merge(dst, src)
+
+        assert result is dst
+        assert result == {
+            "apps_config": {"enabled_apps": ["b"], "isolate": False},
+            "app": {"meta": {"command": "new", "args": ["x"]}},
+            "extra": {"k": 1},
+        }
+
+    def test_aliased_mappings_stay_independent(self):
+        """An override of one YAML alias doesn't leak into the others."""
+        from tasak.config import _deep_merge
+
+        global_config = yaml.safe_load("shared: &s {timeout: 5}\napp1: *s\napp2: *s\n")
+        merged = {}
+        _deep_merge(merged, global_config)
+        _deep_merge(merged, {"app1": {"timeout": 10}})
+
+        assert merged == {
+            "shared": {"timeout": 5},
+            "app1": {"timeout": 10},
+            "app2": {"timeout": 5},
+        }
+        assert global_config["shared"] == {"timeout": 5}
+
+
+class TestYamlLoader:
+    """Tests for the YAML loader selection."""
+
+    def test_prefers_libyaml_loader(self):
+        """The C-backed loader is used whenever PyYAML ships with libyaml."""
+        from tasak.config import _yaml_safe_loader
+
+        if getattr(yaml, "CSafeLoader", None) is None:
+            pytest.skip("PyYAML built without libyaml")
+        assert _yaml_safe_loader() is yaml.CSafeLoader
+
+    def test_load_yaml_parses_safely(self):
+        """_load_yaml parses plain YAML and rejects arbitrary python tags."""
+        from tasak.config import _load_yaml
+
+        assert _load_yaml("a: 1\nb: [x, y]\n") == {"a": 1, "b": ["x", "y"]}
+        with pytest.raises(yaml.YAMLError):
+            _load_yaml("!!python/object/apply:os.system ['true']")
+
+    def test_read_config_file_parses_bytes(self, tmp_path):
+        """Config files are read as bytes and parsed from memory."""
+        from tasak.config import _read_config_file
+
+        config_file = tmp_path / "tasak.yaml"
+        config_file.write_text("header: Zażółć\napps_config:\n  enabled_apps: [a]\n")
+        assert _read_config_file(config_file) == {
+            "header": "Zażółć",
+            "apps_config": {"enabled_apps": ["a"]},
+        }
+
+
+class TestConfigCache:
+    """Tests for the on-disk merged-config cache."""
+
+    def test_cache_hit_skips_yaml_parsing(self, tmp_path):
+        """A second load with unchanged files is served from the pickle cache."""
+        work_dir = tmp_path / "project"
+        work_dir.mkdir()
+        mock_home = tmp_path / "home"
+        mock_home.mkdir()
+        (work_dir / "tasak.yaml").write_text(yaml.dump({"header": "Local"}))
+
+        with patch("pathlib.Path.cwd", return_value=work_dir):
+            with patch("pathlib.Path.home", return_value=mock_home):
+                first = load_and_merge_configs()
+                with patch("tasak.config._load_yaml") as mock_load:
+                    second = load_and_merge_configs()
+                    mock_load.assert_not_called()
+
+        assert first == second == {"header": "Local"}
+        assert list((mock_home / ".tasak" / "cache").glob("config.*.pkl"))
+
+    def test_cache_invalidated_when_file_changes(self, tmp_path):
+        """Modifying a config file changes the signature and forces a re-parse."""
+        import os
+
+        work_dir = tmp_path / "project"
+        work_dir.mkdir()
+        mock_home = tmp_path / "home"
+        mock_home.mkdir()
+        config_file = work_dir / "tasak.yaml"
+        config_file.write_text(yaml.dump({"header": "Before"}))
+
+        with patch("pathlib.Path.cwd", return_value=work_dir):
+            with patch("pathlib.Path.home", return_value=mock_home):
+                assert load_and_merge_configs() == {"header": "Before"}
+
+                config_file.write_text(yaml.dump({"header": "After!"}))
+                st = config_file.stat()
+                os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+                assert load_and_merge_configs() == {"header": "After!"}
+
+        # The rewrite replaced the cache entry rather than adding another
+        assert len(list((mock_home / ".tasak" / "cache").glob("config.*.pkl"))) == 1
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        """An unreadable cache file falls back to parsing YAML."""
+        work_dir = tmp_path / "project"
+        work_dir.mkdir()
+        mock_home = tmp_path / "home"
+        mock_home.mkdir()
+        (work_dir / "tasak.yaml").write_text(yaml.dump({"header": "Local"}))
+
+        with patch("pathlib.Path.cwd", return_value=work_dir):
+            with patch("pathlib.Path.home", return_value=mock_home):
+                load_and_merge_configs()
+                for cache_file in (mock_home / ".tasak" / "cache").glob("*.pkl"):
+                    cache_file.write_bytes(b"not a pickle")
+                assert load_and_merge_configs() == {"header": "Local"}
@@ -324,6 +324,34 @@ class TestParameterHandling(unittest.TestCase):
             ["ls", "--path", "/home"], capture_output=True, text=True
         )
 
+    @patch("subprocess.run")
+    def test_params_config_not_mutated(self, mock_run):
+        mock_run.return_value = Mock(returncode=0)
+
+        params = [
+            {"name": "count", "type": "int", "required": False},
+            {"name": "--verbose", "action": "store_true", "type": "bool"},
+        ]
+        snapshot = [dict(p) for p in params]
+        config = {
+            "commands": [
+                {
+                    "name": "run",
+                    "backend": {"type": "cmd", "command": ["echo"]},
+                    "params": params,
+                }
+            ]
+        }
+        app = CuratedApp("test", config)
+
+        # Running twice must parse the same way and leave the config intact
+        for _ in range(2):
+            app.run(["run", "3", "--verbose"])
+            mock_run.assert_called_with(
+                ["echo", "--count", "3", "--verbose"], capture_output=True, text=True
+            )
+        self.assertEqual(params, snapshot)
+
 
 class TestHelpDisplay(unittest.TestCase):
     """Test help message generation."""
@@ -0,0 +1,115 @@
+"""Unit tests for json_io module."""
+
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+
+from tasak import json_io
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request):
+    """Run each test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        if json_io.orjson is None:
+            pytest.skip("orjson not installed")
+        yield
+    else:
+        with patch("tasak.json_io.orjson", None):
+            yield
+
+
+class TestJsonIO:
+    """Tests for the JSON read/write helpers."""
+
+    def test_round_trip(self, backend, tmp_path):
+        """Data written with write_json reads back unchanged."""
+        data = {"app": {"token": "t", "expires_at": 1.5, "scopes": ["a", "ż"]}}
+        path = tmp_path / "auth.json"
+
+        json_io.write_json(path, data, indent=True)
+
+        assert json_io.read_json(path) == data
+        assert b'\n  "app"' in path.read_bytes()
+
+    def test_compact_dumps_and_loads_str(self, backend):
+        """dumps returns compact bytes and loads accepts str."""
+        assert json_io.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+        assert json_io.loads('{"a": null}') == {"a": None}
+
+    def test_read_large_file(self, backend, tmp_path):
+        """Files above the mmap threshold parse the same as small ones."""
+        data = {"tools": [{"name": f"tool{i}", "doc": "x" * 50} for i in range(50)]}
+        path = tmp_path / "schema.json"
+        json_io.write_json(path, data)
+
+        with patch("tasak.json_io._MMAP_MIN_SIZE", 1024):
+            assert path.stat().st_size > 1024
+            assert json_io.read_json(path) == data
+
+    def test_print_json_keeps_output_order(self, backend, capsys):
+        """Bytes written by print_json stay in order with text output."""
+        print("before")
+        json_io.print_json({"a": [1, "ż"]})
+        print("after")
+
+        assert capsys.readouterr().out == 'before\n{"a":[1,"ż"]}\nafter\n'
+
+    def test_print_json_text_stream(self, backend):
+        """Streams without a binary buffer get decoded text."""
+        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+            json_io.print_json({"a": 1}, indent=True)
+
+        assert mock_stdout.getvalue() == '{\n  "a": 1\n}\n'
+
+    def test_write_json_replaces_atomically(self, backend, tmp_path):
+        """Rewrites keep the file mode and leave no temp files behind."""
+        path = tmp_path / "auth.json"
+        json_io.write_json(path, {"a": 1})
+        path.chmod(0o600)
+
+        json_io.write_json(path, {"a": 2})
+
+        assert json_io.read_json(path) == {"a": 2}
+        assert path.stat().st_mode & 0o777 == 0o600
+        assert [p.name for p in tmp_path.iterdir()] == ["auth.json"]
+
+    def test_failed_write_keeps_old_file(self, backend, tmp_path):
+        """A failure mid-write leaves the previous contents in place."""
+        path = tmp_path / "schema.json"
+        json_io.write_json(path, {"a": 1})
+
+        with patch("tasak.json_io.os.fsync", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                json_io.write_json(path, {"a": 2})
+
+        assert json_io.read_json(path) == {"a": 1}
+        assert [p.name for p in tmp_path.iterdir()] == ["schema.json"]
+
+    def test_writers_use_distinct_temp_files(self, backend, tmp_path):
+        """Each write gets its own temp file, so concurrent writers can't clash."""
+        path = tmp_path / "auth.json"
+        sources = []
+        real_replace = json_io.os.replace
+
+        def record_replace(src, dst):
+            sources.append(src)
+            real_replace(src, dst)
+
+        with patch("tasak.json_io.os.replace", side_effect=record_replace):
+            json_io.write_json(path, {"a": 1})
+            json_io.write_json(path, {"a": 2})
+
+        assert len(set(sources)) == 2
+
+    def test_explicit_mode(self, backend, tmp_path):
+        """An explicit mode overrides the existing file's permissions."""
+        path = tmp_path / "auth.json"
+        json_io.write_json(path, {"a": 1})
+        path.chmod(0o644)
+
+        st = json_io.write_json(path, {"a": 2}, mode=0o600)
+
+        assert path.stat().st_mode & 0o777 == 0o600
+        assert st.st_size == path.stat().st_size
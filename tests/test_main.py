@@ -1,6 +1,8 @@
 from unittest.mock import patch, MagicMock
 
-from tasak.main import main, _list_available_apps, _cleanup_pool
+import pytest
+
+from tasak.main import main, _list_available_apps, _cleanup_pool, _parse_main_args
 
 
 class TestCleanupPool:
@@ -46,34 +48,25 @@ class TestCleanupPool:
 class TestListAvailableApps:
     """Tests for _list_available_apps function."""
 
-    @patch("builtins.print")
-    def test_list_no_apps(self, mock_print):
+    def test_list_no_apps(self, capsys):
         """Test listing when no apps are configured."""
         config = {}
 
         _list_available_apps(config)
 
-        calls = mock_print.call_args_list
-        # Either shows "Available applications:" or "No applications configured"
-        assert any(
-            "Available applications:" in str(c)
-            or "No applications configured" in str(c)
-            for c in calls
-        )
-        assert any("No applications configured" in str(c) for c in calls)
+        out = capsys.readouterr().out
+        assert "Available apps:" in out
+        assert "No applications configured" in out
 
-    @patch("builtins.print")
-    def test_list_empty_enabled_apps(self, mock_print):
+    def test_list_empty_enabled_apps(self, capsys):
         """Test listing when enabled_apps is empty."""
         config = {"apps_config": {"enabled_apps": []}}
 
         _list_available_apps(config)
 
-        calls = mock_print.call_args_list
-        assert any("No applications configured" in str(c) for c in calls)
+        assert "No applications configured" in capsys.readouterr().out
 
-    @patch("builtins.print")
-    def test_list_single_app(self, mock_print):
+    def test_list_single_app(self, capsys):
         """Test listing a single app."""
         config = {
             "apps_config": {"enabled_apps": ["myapp"]},
@@ -82,14 +75,13 @@ class TestListAvailableApps:
 
         _list_available_apps(config)
 
-        calls = mock_print.call_args_list
+        lines = capsys.readouterr().out.splitlines()
         assert any(
-            "myapp" in str(c) and "cmd" in str(c) and "My Application" in str(c)
-            for c in calls
+            "myapp" in line and "(cmd)" in line and "My Application" in line
+            for line in lines
         )
 
-    @patch("builtins.print")
-    def test_list_multiple_apps_sorted(self, mock_print):
+    def test_list_multiple_apps_sorted(self, capsys):
         """Test listing multiple apps in sorted order."""
         config = {
             "apps_config": {"enabled_apps": ["zebra", "alpha", "beta"]},
@@ -100,26 +92,52 @@ class TestListAvailableApps:
 
         _list_available_apps(config)
 
-        # Get the order of app names in print calls
-        app_calls = [
-            str(c)
-            for c in mock_print.call_args_list
-            if "alpha" in str(c) or "beta" in str(c) or "zebra" in str(c)
+        app_lines = [
+            line
+            for line in capsys.readouterr().out.splitlines()
+            if line.endswith(" App")
         ]
         # Should be alphabetically sorted
-        assert "alpha" in app_calls[0]
-        assert "beta" in app_calls[1]
-        assert "zebra" in app_calls[2]
+        assert "alpha" in app_lines[0]
+        assert "beta" in app_lines[1]
+        assert "zebra" in app_lines[2]
 
-    @patch("builtins.print")
-    def test_list_app_missing_config(self, mock_print):
+    def test_list_app_missing_config(self, capsys):
         """Test listing when app config is missing."""
         config = {"apps_config": {"enabled_apps": ["missing_app"]}}
 
         _list_available_apps(config)
 
-        calls = mock_print.call_args_list
-        assert any("missing_app" in str(c) and "N/A" in str(c) for c in calls)
+        lines = capsys.readouterr().out.splitlines()
+        assert any("missing_app" in line and "N/A" in line for line in lines)
+
+    def test_list_simple(self, capsys):
+        """Simple mode prints one sorted name per line for completions."""
+        config = {"apps_config": {"enabled_apps": ["b", "a"]}}
+
+        _list_available_apps(config, simple=True)
+
+        assert capsys.readouterr().out == "  a\n  b\n"
+
+
+class TestParseMainArgs:
+    """Tests for the argparse-free argv split."""
+
+    @pytest.mark.parametrize(
+        "argv, expected",
+        [
+            ([], (None, set(), [])),
+            (["myapp", "a", "--x", "1"], ("myapp", set(), ["a", "--x", "1"])),
+            (["--debug", "myapp", "-h"], ("myapp", {"debug", "help"}, [])),
+            (["-l"], (None, {"list_apps"}, [])),
+            (["--foo", "myapp", "x"], ("myapp", set(), ["--foo", "x"])),
+            (["myapp", "--", "--help"], ("myapp", set(), ["--help"])),
+            (["--", "myapp", "-l"], ("myapp", set(), ["-l"])),
+        ],
+    )
+    def test_matches_previous_argparse_split(self, argv, expected):
+        """Flags are collected anywhere and the rest is forwarded in order."""
+        assert _parse_main_args(argv) == expected
 
 
 class TestMainFunction:
@@ -149,10 +167,12 @@ class TestMainFunction:
         with patch("argparse.ArgumentParser.print_help") as mock_help:
             main()
             mock_help.assert_called_once()
+        # Top-level help never needs the app registry
+        mock_load_config.assert_not_called()
 
     @patch("tasak.main.atexit.register")
     @patch("tasak.main.load_and_merge_configs")
-    @patch("tasak.main.run_cmd_app")
+    @patch("tasak.app_runner.run_cmd_app")
     @patch("sys.argv", ["tasak", "myapp", "arg1", "arg2"])
     def test_main_run_cmd_app(self, mock_run_cmd, mock_load_config, mock_atexit):
         """Test main running a cmd type app."""
@@ -169,7 +189,7 @@ class TestMainFunction:
 
     @patch("tasak.main.atexit.register")
     @patch("tasak.main.load_and_merge_configs")
-    @patch("tasak.main.run_curated_app")
+    @patch("tasak.curated_app.run_curated_app")
     @patch("sys.argv", ["tasak", "curapp"])
     def test_main_run_curated_app(
         self, mock_run_curated, mock_load_config, mock_atexit
@@ -188,7 +208,7 @@ class TestMainFunction:
 
     @patch("tasak.main.atexit.register")
     @patch("tasak.main.load_and_merge_configs")
-    @patch("tasak.main.run_mcp_app")
+    @patch("tasak.mcp_client.run_mcp_app")
     @patch("sys.argv", ["tasak", "mcpapp", "--flag"])
     def test_main_run_mcp_app(self, mock_run_mcp, mock_load_config, mock_atexit):
         """Test main running an mcp type app."""
@@ -205,7 +225,7 @@ class TestMainFunction:
 
     @patch("tasak.main.atexit.register")
     @patch("tasak.main.load_and_merge_configs")
-    @patch("tasak.main.run_mcp_remote_app")
+    @patch("tasak.mcp_remote_runner.run_mcp_remote_app")
     @patch("sys.argv", ["tasak", "remoteapp"])
     def test_main_run_mcp_remote_app(
         self, mock_run_remote, mock_load_config, mock_atexit
@@ -287,7 +307,7 @@ class TestMainFunction:
 
     @patch("tasak.main.atexit.register")
     @patch("tasak.main.load_and_merge_configs")
-    @patch("tasak.main.run_cmd_app")
+    @patch("tasak.app_runner.run_cmd_app")
     @patch("sys.argv", ["tasak", "myapp", "--help"])
     def test_main_app_help_passed_through(
         self, mock_run_cmd, mock_load_config, mock_atexit
@@ -308,7 +328,7 @@ class TestAdminCommands:
 
     @patch("tasak.main.atexit.register")
     @patch("tasak.main.load_and_merge_configs")
-    @patch("tasak.main.handle_admin_command")
+    @patch("tasak.admin_commands.handle_admin_command")
     @patch("sys.argv", ["tasak", "admin", "--help"])
     def test_main_admin_command(self, mock_handle, mock_load_config, mock_atexit):
         """Test main with admin command."""
@@ -327,8 +347,8 @@ class TestAdminCommands:
 
     @patch("tasak.main.atexit.register")
     @patch("tasak.main.load_and_merge_configs")
-    @patch("tasak.main.setup_admin_subparsers")
-    @patch("tasak.main.handle_admin_command")
+    @patch("tasak.admin_commands.setup_admin_subparsers")
+    @patch("tasak.admin_commands.handle_admin_command")
     @patch("sys.argv", ["tasak", "admin"])
     def test_main_admin_no_subcommand(
         self, mock_handle, mock_setup, mock_load_config, mock_atexit
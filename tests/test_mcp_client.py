@@ -0,0 +1,29 @@
+"""Unit tests for mcp_client helpers."""
+
+from unittest.mock import patch
+
+import pytest
+
+from tasak.mcp_client import _setup_line_editing
+
+
+class TestSetupLineEditing:
+    """Tests for interactive-session line editing."""
+
+    def test_completes_tool_names(self):
+        """Tab completion offers tool names matching the typed prefix."""
+        readline = pytest.importorskip("readline")
+        with (
+            patch.object(readline, "set_completer") as mock_set,
+            patch.object(readline, "parse_and_bind"),
+            patch.object(readline, "get_begidx", return_value=0),
+        ):
+            assert _setup_line_editing(["ping", "search", "send"]) is True
+            complete = mock_set.call_args[0][0]
+
+            assert [complete("se", i) for i in range(3)] == ["search", "send", None]
+
+    def test_unavailable_readline(self):
+        """Without readline the session falls back to plain stdin reads."""
+        with patch.dict("sys.modules", {"readline": None}):
+            assert _setup_line_editing(["ping"]) is False
@@ -0,0 +1,108 @@
+"""Unit tests for the shared MCP argument parser."""
+
+from unittest.mock import patch
+
+import pytest
+
+from tasak.mcp_parser import build_mcp_parser, parse_mcp_args
+
+TOOLS = [
+    {
+        "name": "search",
+        "description": "Search things",
+        "input_schema": {
+            "properties": {
+                "query": {"type": "string"},
+                "limit": {"type": "integer"},
+                "exact": {"type": "boolean"},
+            },
+            "required": ["query"],
+        },
+    },
+    {
+        "name": "ping",
+        "description": "Check the server",
+        "input_schema": {"properties": {}},
+    },
+    {
+        "name": "session",
+        "description": "Options named like tasak's own flags",
+        "input_schema": {
+            "properties": {
+                "interactive": {"type": "string"},
+                "tool_name": {"type": "string"},
+                "clear-cache": {"type": "boolean"},
+            }
+        },
+    },
+]
+
+
+class TestParseMcpArgs:
+    """Tests for parse_mcp_args in dynamic mode."""
+
+    def test_parses_requested_tool(self):
+        """Tool arguments are converted using the tool schema."""
+        tool_name, tool_args, _ = parse_mcp_args(
+            "app", TOOLS, ["search", "--query", "x", "--limit", "3", "--exact"]
+        )
+
+        assert tool_name == "search"
+        assert tool_args == {"query": "x", "limit": 3, "exact": True}
+
+    def test_only_requested_tool_is_built(self, monkeypatch):
+        """Other tools' subparsers are not constructed for a known tool."""
+        monkeypatch.setenv("TASAK_PARSER", "argparse")
+        with patch(
+            "tasak.mcp_parser.build_mcp_parser", wraps=build_mcp_parser
+        ) as mock_build:
+            parse_mcp_args("app", TOOLS, ["ping"])
+
+        assert [t["name"] for t in mock_build.call_args[0][1]] == ["ping"]
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["search", "--query", "x"],
+            ["search", "--query=a=b", "--limit", "3", "--exact"],
+            ["search", "--exact", "--query", "x", "--query", "y"],
+            ["ping"],
+            ["session", "--interactive", "x"],
+            ["session", "--tool_name", "ping"],
+            ["session", "--clear-cache"],
+        ],
+    )
+    def test_fast_path_matches_argparse(self, argv, monkeypatch):
+        """The argparse-free path returns what argparse would."""
+        with patch("tasak.mcp_parser.build_mcp_parser") as mock_build:
+            fast = parse_mcp_args("app", TOOLS, argv)
+        mock_build.assert_not_called()
+
+        monkeypatch.setenv("TASAK_PARSER", "argparse")
+        slow = parse_mcp_args("app", TOOLS, argv)
+
+        assert fast[:2] == slow[:2]
+        assert vars(fast[2]) == vars(slow[2])
+
+    def test_unusual_input_falls_back_to_argparse(self, capsys):
+        """Errors are still reported by argparse with its exit code."""
+        with pytest.raises(SystemExit) as exc_info:
+            parse_mcp_args("app", TOOLS, ["search", "--query", "x", "--limit", "z"])
+
+        assert exc_info.value.code == 2
+        assert "invalid int value" in capsys.readouterr().err
+
+    def test_missing_required_argument_exits(self, capsys):
+        """Required schema properties are still enforced."""
+        with pytest.raises(SystemExit):
+            parse_mcp_args("app", TOOLS, ["search"])
+
+        assert "--query" in capsys.readouterr().err
+
+    def test_unknown_tool_lists_choices(self, capsys):
+        """An unknown tool name fails with the list of known tools."""
+        with pytest.raises(SystemExit):
+            parse_mcp_args("app", TOOLS, ["nope"])
+
+        err = capsys.readouterr().err
+        assert "search" in err and "ping" in err
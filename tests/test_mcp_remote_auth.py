@@ -10,8 +10,9 @@ from tasak.mcp_remote_auth import authenticate_with_mcp_remote
 class TestAuthenticateWithMcpRemote:
     """Test authenticate_with_mcp_remote function."""
 
+    @patch("tasak.mcp_remote_pool._npx", return_value="/usr/bin/npx")
     @patch("tasak.mcp_remote_auth.subprocess.run")
-    def test_successful_authentication(self, mock_run, capsys):
+    def test_successful_authentication(self, mock_run, mock_npx, capsys):
         """Test successful authentication flow."""
         mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
 
@@ -25,7 +26,7 @@ class TestAuthenticateWithMcpRemote:
         # Verify subprocess was called correctly
         mock_run.assert_called_once_with(
             [
-                "npx",
+                "/usr/bin/npx",
                 "-y",
                 "mcp-remote",
                 "https://mcp.atlassian.com/v1/sse",
@@ -34,6 +35,8 @@ class TestAuthenticateWithMcpRemote:
             capture_output=True,
             text=True,
             timeout=120,
+            stdin=subprocess.DEVNULL,
+            close_fds=True,
         )
 
     @patch("tasak.mcp_remote_auth.subprocess.run")
@@ -146,3 +146,148 @@ class TestMCPRemoteClientErrorHandling:
                 client.call_tool("test_tool", {})
 
             assert "Test error" in str(exc_info.value)
+
+    def test_sync_wrappers_reuse_event_loop(self):
+        """Consecutive sync calls run on the same event loop."""
+        import asyncio
+
+        client = MCPRemoteClient(
+            "test_app", {"meta": {"server_url": "http://test.com"}}
+        )
+        loops = []
+
+        async def fake_fetch():
+            loops.append(asyncio.get_running_loop())
+            return []
+
+        with patch.object(client, "_fetch_tools_async", side_effect=fake_fetch):
+            client.get_tool_definitions()
+            client.get_tool_definitions()
+
+        assert loops[0] is loops[1]
+
+    def test_uses_daemon_when_available(self, monkeypatch):
+        """Calls go through the daemon, which keeps the proxy alive."""
+        monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
+        monkeypatch.delenv("TASAK_DEBUG", raising=False)
+        client = MCPRemoteClient(
+            "test_app", {"meta": {"server_url": "http://test.com"}}
+        )
+
+        with patch("tasak.daemon.client.DaemonClient") as mock_daemon_class:
+            daemon = mock_daemon_class.return_value
+            daemon.is_daemon_available.return_value = True
+            daemon.request_tool_call.return_value = "ok"
+
+            assert client.call_tool("test_tool", {"a": 1}) == "ok"
+            assert client.call_tool("test_tool", {"a": 2}) == "ok"
+
+        config = mock_daemon_class.call_args[0][1]["_mcp_config"]
+        assert config == {"transport": "mcp-remote", "server_url": "http://test.com"}
+        daemon.is_daemon_available.assert_called_once()
+        daemon.request_tool_call.assert_called_with("test_tool", {"a": 2})
+
+    def test_unreachable_daemon_falls_back_to_pool(self, monkeypatch):
+        """A call that never reached the daemon goes through the pooled proxy."""
+        from tasak.daemon.client import DaemonUnavailable
+
+        monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
+        monkeypatch.delenv("TASAK_DEBUG", raising=False)
+        client = MCPRemoteClient(
+            "test_app", {"meta": {"server_url": "http://test.com"}}
+        )
+
+        async def fake_call(tool_name, arguments):
+            return "from pool"
+
+        with (
+            patch("tasak.daemon.client.DaemonClient") as mock_daemon_class,
+            patch.object(client, "_call_tool_async", side_effect=fake_call),
+        ):
+            daemon = mock_daemon_class.return_value
+            daemon.is_daemon_available.return_value = True
+            daemon.request_tool_call.side_effect = DaemonUnavailable(
+                "Could not connect to daemon"
+            )
+
+            assert client.call_tool("test_tool", {}) == "from pool"
+            assert client.call_tool("test_tool", {}) == "from pool"
+
+        daemon.request_tool_call.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "message", ["Daemon request timed out", "Tool execution failed: boom"]
+    )
+    def test_daemon_failure_is_not_retried(self, message, monkeypatch, capsys):
+        """Timeouts and tool failures exit instead of running the tool again."""
+        from tasak.daemon.client import DaemonError
+
+        monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
+        monkeypatch.delenv("TASAK_DEBUG", raising=False)
+        client = MCPRemoteClient(
+            "test_app", {"meta": {"server_url": "http://test.com"}}
+        )
+
+        with (
+            patch("tasak.daemon.client.DaemonClient") as mock_daemon_class,
+            patch.object(client, "_call_tool_async") as mock_call,
+        ):
+            daemon = mock_daemon_class.return_value
+            daemon.is_daemon_available.return_value = True
+            daemon.request_tool_call.side_effect = DaemonError(message)
+
+            with pytest.raises(SystemExit) as exc_info:
+                client.call_tool("test_tool", {})
+
+        assert exc_info.value.code == 1
+        mock_call.assert_not_called()
+        err = capsys.readouterr().err
+        assert message in err
+        assert "tasak admin auth" not in err
+
+    @pytest.mark.parametrize(
+        "exc_name, unavailable",
+        [("ConnectionError", True), ("ConnectTimeout", True), ("ReadTimeout", False)],
+    )
+    def test_request_tool_call_classifies_failures(self, exc_name, unavailable):
+        """Only failures to reach the daemon count as DaemonUnavailable."""
+        import requests
+
+        from tasak.daemon.client import DaemonClient, DaemonError, DaemonUnavailable
+
+        daemon = DaemonClient("test_app", {"_mcp_config": {}})
+        exc = getattr(requests.exceptions, exc_name)()
+        with patch("tasak.daemon.client.requests.post", side_effect=exc):
+            with pytest.raises(DaemonError) as exc_info:
+                daemon.request_tool_call("test_tool", {})
+
+        assert isinstance(exc_info.value, DaemonUnavailable) is unavailable
+
+    def test_daemon_auth_error_shows_hint(self, monkeypatch, capsys):
+        """An auth failure from the daemon points at tasak admin auth."""
+        from tasak.daemon.client import DaemonError
+
+        monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
+        monkeypatch.delenv("TASAK_DEBUG", raising=False)
+        client = MCPRemoteClient(
+            "test_app", {"meta": {"server_url": "http://test.com"}}
+        )
+
+        with (
+            patch("tasak.daemon.client.DaemonClient") as mock_daemon_class,
+            patch.object(client, "_call_tool_async") as mock_call,
+        ):
+            daemon = mock_daemon_class.return_value
+            daemon.is_daemon_available.return_value = True
+            daemon.request_tool_call.side_effect = DaemonError(
+                "Tool execution failed: HTTP 401 Unauthorized"
+            )
+
+            with pytest.raises(SystemExit) as exc_info:
+                client.call_tool("test_tool", {})
+
+        assert exc_info.value.code == 1
+        mock_call.assert_not_called()
+        err = capsys.readouterr().err
+        assert "401 Unauthorized" in err
+        assert "Run: tasak admin auth test_app" in err
@@ -1,11 +1,17 @@
 """Unit tests for MCP Remote Process Pool."""
 
 import asyncio
+import sys
 import time
 import unittest
 from unittest.mock import Mock, patch, AsyncMock
 
-from tasak.mcp_remote_pool import MCPRemotePool, PooledProcess
+from tasak.mcp_remote_pool import (
+    MCPRemotePool,
+    PooledProcess,
+    _new_event_loop,
+    mcp_remote_command,
+)
 
 
 class TestPooledProcess(unittest.TestCase):
@@ -49,6 +55,53 @@ class TestPooledProcess(unittest.TestCase):
         self.assertAlmostEqual(pooled.idle_time, 5, delta=0.1)
 
 
+class TestNewEventLoop(unittest.TestCase):
+    """Test event loop creation for the pool and client."""
+
+    def test_uses_uvloop_when_installed(self):
+        """uvloop provides the loop when it can be imported."""
+        fake_uvloop = Mock()
+        with patch.dict("sys.modules", {"uvloop": fake_uvloop}):
+            loop = _new_event_loop()
+
+        self.assertIs(loop, fake_uvloop.new_event_loop.return_value)
+
+    def test_falls_back_to_asyncio(self):
+        """Without uvloop the default asyncio loop is used."""
+        with patch.dict("sys.modules", {"uvloop": None}):
+            loop = _new_event_loop()
+        try:
+            self.assertIsInstance(loop, asyncio.AbstractEventLoop)
+        finally:
+            loop.close()
+
+
+class TestNpxResolution(unittest.TestCase):
+    """Test the cached npx lookup used for proxy commands."""
+
+    def test_resolves_once(self):
+        """npx is looked up on PATH once and reused while it exists."""
+        with (
+            patch("tasak.mcp_remote_pool._npx_path", None),
+            patch("shutil.which", return_value=sys.executable) as mock_which,
+        ):
+            self.assertEqual(mcp_remote_command("u")[0], sys.executable)
+            self.assertEqual(mcp_remote_command("u")[0], sys.executable)
+
+        mock_which.assert_called_once_with("npx")
+
+    def test_falls_back_to_bare_name(self):
+        """Without npx on PATH the bare name is used and looked up again later."""
+        with (
+            patch("tasak.mcp_remote_pool._npx_path", "/gone/npx"),
+            patch("shutil.which", return_value=None) as mock_which,
+        ):
+            self.assertEqual(mcp_remote_command("u"), ["npx", "-y", "mcp-remote", "u"])
+            mcp_remote_command("u")
+
+        self.assertEqual(mock_which.call_count, 2)
+
+
 class TestMCPRemotePool:
     """Test MCPRemotePool functionality without unittest async methods."""
 
@@ -90,9 +143,7 @@ class TestMCPRemotePool:
                     return False
 
             fake_ctx = _FakeCtx()
-            with patch(
-                "tasak.mcp_remote_pool.ClientSession", return_value=mock_session
-            ), patch(
+            with patch("mcp.ClientSession", return_value=mock_session), patch(
                 "mcp.client.stdio.stdio_client", return_value=fake_ctx
             ) as mock_stdio:
                 pool = MCPRemotePool()
@@ -125,9 +176,7 @@ class TestMCPRemotePool:
                 async def __aexit__(self, exc_type, exc, tb):
                     return False
 
-            with patch(
-                "tasak.mcp_remote_pool.ClientSession", return_value=mock_session
-            ), patch(
+            with patch("mcp.ClientSession", return_value=mock_session), patch(
                 "mcp.client.stdio.stdio_client", return_value=_FakeCtx()
             ) as mock_stdio:
                 pool = MCPRemotePool()
@@ -160,9 +209,7 @@ class TestMCPRemotePool:
                 async def __aexit__(self, exc_type, exc, tb):
                     return False
 
-            with patch(
-                "tasak.mcp_remote_pool.ClientSession", return_value=AsyncMock()
-            ), patch(
+            with patch("mcp.ClientSession", return_value=AsyncMock()), patch(
                 "mcp.client.stdio.stdio_client", return_value=_FakeCtx()
             ) as mock_stdio:
                 pool = MCPRemotePool()
@@ -197,9 +244,9 @@ class TestMCPRemotePool:
                 async def __aexit__(self, exc_type, exc, tb):
                     return False
 
-            with patch(
-                "tasak.mcp_remote_pool.ClientSession", return_value=AsyncMock()
-            ), patch("mcp.client.stdio.stdio_client", return_value=_FakeCtx()):
+            with patch("mcp.ClientSession", return_value=AsyncMock()), patch(
+                "mcp.client.stdio.stdio_client", return_value=_FakeCtx()
+            ):
                 pool = MCPRemotePool()
                 pool.MAX_POOL_SIZE = 2
                 await pool.get_session("app1", "http://test1.com")
@@ -237,9 +284,9 @@ class TestMCPRemotePool:
                     return False
 
             fake_ctx = _FakeCtx()
-            with patch(
-                "tasak.mcp_remote_pool.ClientSession", return_value=AsyncMock()
-            ), patch("mcp.client.stdio.stdio_client", return_value=fake_ctx):
+            with patch("mcp.ClientSession", return_value=AsyncMock()), patch(
+                "mcp.client.stdio.stdio_client", return_value=fake_ctx
+            ):
                 pool = MCPRemotePool()
                 pool.IDLE_TIMEOUT = 0.1
                 await pool.get_session("test_app", "http://test.com")
@@ -279,9 +326,9 @@ class TestMCPRemotePool:
                     return False
 
             fake_ctx = _FakeCtx()
-            with patch(
-                "tasak.mcp_remote_pool.ClientSession", return_value=AsyncMock()
-            ), patch("mcp.client.stdio.stdio_client", return_value=fake_ctx):
+            with patch("mcp.ClientSession", return_value=AsyncMock()), patch(
+                "mcp.client.stdio.stdio_client", return_value=fake_ctx
+            ):
                 pool = MCPRemotePool()
                 await pool.get_session("app1", "http://test1.com")
                 await pool.get_session("app2", "http://test2.com")
@@ -341,7 +388,7 @@ class TestMCPRemoteClientIntegration(unittest.TestCase):
         self.assertIs(client.pool, mock_pool)
 
     @patch("tasak.mcp_remote_client.MCPRemotePool")
-    @patch("asyncio.run")
+    @patch("tasak.mcp_remote_client._run")
     def test_get_tool_definitions_uses_pool(self, mock_run, mock_pool_class):
         """Test get_tool_definitions uses pool.get_session."""
         from tasak.mcp_remote_client import MCPRemoteClient
@@ -354,14 +401,17 @@ class TestMCPRemoteClientIntegration(unittest.TestCase):
             "test_app", {"meta": {"server_url": "http://test.com"}}
         )
 
+        # Close the coroutine the mocked runner receives, as a real run would
+        mock_run.side_effect = lambda coro: coro.close()
+
         # Call get_tool_definitions
         client.get_tool_definitions()
 
-        # Verify asyncio.run was called
+        # Verify the coroutine was run on the shared loop
         mock_run.assert_called_once()
 
     @patch("tasak.mcp_remote_client.MCPRemotePool")
-    @patch("asyncio.run")
+    @patch("tasak.mcp_remote_client._run")
     def test_call_tool_uses_pool(self, mock_run, mock_pool_class):
         """Test call_tool uses pool.get_session."""
         from tasak.mcp_remote_client import MCPRemoteClient
@@ -374,10 +424,12 @@ class TestMCPRemoteClientIntegration(unittest.TestCase):
             "test_app", {"meta": {"server_url": "http://test.com"}}
         )
 
+        mock_run.side_effect = lambda coro: coro.close()
+
         # Call tool
         client.call_tool("test_tool", {"arg": "value"})
 
-        # Verify asyncio.run was called
+        # Verify the coroutine was run on the shared loop
         mock_run.assert_called_once()
 
 
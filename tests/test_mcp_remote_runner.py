@@ -1,7 +1,9 @@
 """Tests for mcp_remote_runner module."""
 
 import json
+import signal
 import subprocess
+import sys
 from unittest.mock import Mock, patch
 
 import pytest
@@ -9,6 +11,7 @@ import pytest
 from tasak.mcp_remote_runner import (
     _clear_cache,
     _print_help,
+    _print_result,
     _run_auth_flow,
     _run_interactive_mode,
     run_mcp_remote_app,
@@ -220,6 +223,73 @@ class TestRunMCPRemoteApp:
         assert output["result"] == "success"
         assert output["data"] == 123
 
+    @patch("tasak.mcp_remote_runner.MCPRemoteClient")
+    @patch("tasak.mcp_remote_runner.SchemaManager")
+    def test_fetch_and_call_share_one_client(
+        self, mock_schema_manager_class, mock_client_class
+    ):
+        """The schema fetch and the tool call reuse a single client."""
+        mock_schema_manager_class.return_value.load_schema.return_value = None
+        mock_client = mock_client_class.return_value
+        mock_client.get_tool_definitions.return_value = [{"name": "test_tool"}]
+        mock_client.call_tool.return_value = "ok"
+
+        run_mcp_remote_app(
+            "test_app",
+            {"meta": {"server_url": "https://example.com"}},
+            ["test_tool", "--q", "x"],
+        )
+
+        mock_client_class.assert_called_once()
+        mock_client.call_tool.assert_called_once_with("test_tool", {"q": "x"})
+
+    @patch("tasak.mcp_remote_runner.MCPRemoteClient")
+    @patch("tasak.mcp_remote_runner.SchemaManager")
+    def test_cached_schema_error_creates_no_client(
+        self, mock_schema_manager_class, mock_client_class, capsys
+    ):
+        """Validation against a cached schema doesn't construct a client."""
+        mock_schema_manager = mock_schema_manager_class.return_value
+        mock_schema_manager.load_schema.return_value = {"tools": {"t1": {}}}
+        mock_schema_manager.convert_to_tool_list.return_value = [{"name": "t1"}]
+
+        with pytest.raises(SystemExit):
+            run_mcp_remote_app(
+                "test_app", {"meta": {"server_url": "https://example.com"}}, ["nope"]
+            )
+
+        mock_client_class.assert_not_called()
+        assert "Unknown tool 'nope'" in capsys.readouterr().err
+
+    @patch("tasak.mcp_remote_runner.SchemaManager")
+    def test_call_tool_equals_syntax_and_types(self, mock_schema_manager_class):
+        """--key=value is accepted and numeric properties are converted."""
+        mock_schema_manager_class.return_value.load_schema.return_value = None
+        tool = {
+            "name": "search",
+            "input_schema": {
+                "properties": {
+                    "query": {"type": "string"},
+                    "limit": {"type": "integer"},
+                    "score": {"type": "number"},
+                }
+            },
+        }
+        client = Mock()
+        client.get_tool_definitions.return_value = [tool]
+        client.call_tool.return_value = "ok"
+
+        with patch("tasak.mcp_remote_runner.MCPRemoteClient", return_value=client):
+            run_mcp_remote_app(
+                "test_app",
+                {"meta": {"server_url": "https://example.com"}},
+                ["search", "--query=a=b", "--limit", "3", "--score=x", "--extra=1"],
+            )
+
+        client.call_tool.assert_called_once_with(
+            "search", {"query": "a=b", "limit": 3, "score": "x", "extra": "1"}
+        )
+
     @patch("tasak.mcp_remote_runner.SchemaManager")
     def test_call_tool_string_result(self, mock_schema_manager_class, capsys):
         """Test calling a tool that returns a string."""
@@ -246,6 +316,14 @@ class TestRunMCPRemoteApp:
         captured = capsys.readouterr()
         assert captured.out.strip() == "Simple string result"
 
+    def test_print_result_writes_text_verbatim(self, capsys):
+        """Text results are written as-is, with a single trailing newline."""
+        _print_result("line 1\nline 2\n")
+        _print_result("no newline")
+        _print_result(42)
+
+        assert capsys.readouterr().out == "line 1\nline 2\nno newline\n42\n"
+
     @patch("tasak.mcp_remote_runner.SchemaManager")
     def test_call_tool_error(self, mock_schema_manager_class, capsys):
         """Test error handling when calling a tool."""
@@ -344,46 +422,52 @@ class TestClearCache:
 class TestRunAuthFlow:
     """Test _run_auth_flow function."""
 
-    @patch("subprocess.run")
-    def test_auth_success(self, mock_run, capsys):
+    @patch("tasak.mcp_remote_pool._npx", return_value="/usr/bin/npx")
+    @patch("subprocess.Popen")
+    def test_auth_success(self, mock_popen, mock_npx, capsys):
         """Test successful authentication."""
-        mock_run.return_value = Mock(returncode=0)
+        mock_popen.return_value.wait.return_value = 0
 
         _run_auth_flow("https://example.com")
 
-        mock_run.assert_called_once_with(
-            ["npx", "-y", "mcp-remote", "https://example.com"], timeout=120
+        mock_popen.assert_called_once_with(
+            ["/usr/bin/npx", "-y", "mcp-remote", "https://example.com"],
+            stdin=subprocess.DEVNULL,
+            close_fds=True,
         )
+        mock_popen.return_value.wait.assert_called_once_with(timeout=120)
 
         captured = capsys.readouterr()
         assert "Starting authentication flow" in captured.err
         assert "browser window will open" in captured.err
         assert "Authentication successful" in captured.err
 
-    @patch("subprocess.run")
-    def test_auth_failure(self, mock_run, capsys):
+    @patch("subprocess.Popen")
+    def test_auth_failure(self, mock_popen, capsys):
         """Test failed authentication."""
-        mock_run.return_value = Mock(returncode=1)
+        mock_popen.return_value.wait.return_value = 1
 
         _run_auth_flow("https://example.com")
 
         captured = capsys.readouterr()
         assert "Authentication may have failed or was cancelled" in captured.err
 
-    @patch("subprocess.run")
-    def test_auth_timeout(self, mock_run, capsys):
-        """Test authentication timeout."""
-        mock_run.side_effect = subprocess.TimeoutExpired(["npx"], 120)
+    @patch("subprocess.Popen")
+    def test_auth_timeout(self, mock_popen, capsys):
+        """Test authentication timeout kills the helper."""
+        proc = mock_popen.return_value
+        proc.wait.side_effect = [subprocess.TimeoutExpired(["npx"], 120), None]
 
         _run_auth_flow("https://example.com")
 
+        proc.kill.assert_called_once()
         captured = capsys.readouterr()
         assert "Authentication timed out" in captured.err
 
-    @patch("subprocess.run")
-    def test_npx_not_found(self, mock_run, capsys):
+    @patch("subprocess.Popen")
+    def test_npx_not_found(self, mock_popen, capsys):
         """Test when npx is not found."""
-        mock_run.side_effect = FileNotFoundError()
+        mock_popen.side_effect = FileNotFoundError()
 
         _run_auth_flow("https://example.com")
 
@@ -391,20 +475,31 @@ class TestRunAuthFlow:
         assert "npx not found" in captured.err
         assert "install Node.js" in captured.err
 
-    @patch("subprocess.run")
-    def test_auth_keyboard_interrupt(self, mock_run, capsys):
-        """Test authentication cancelled by user."""
-        mock_run.side_effect = KeyboardInterrupt()
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX signal forwarding")
+    @patch("subprocess.Popen")
+    def test_auth_keyboard_interrupt(self, mock_popen, capsys):
+        """Ctrl-C is forwarded to the helper, which is waited for."""
+        proc = mock_popen.return_value
+
+        def _wait(timeout):
+            signal.getsignal(signal.SIGINT)(signal.SIGINT, None)
+            return -signal.SIGINT
+
+        proc.wait.side_effect = _wait
+        handler = signal.getsignal(signal.SIGINT)
 
         _run_auth_flow("https://example.com")
 
+        proc.send_signal.assert_called_once_with(signal.SIGINT)
+        proc.kill.assert_not_called()
+        assert signal.getsignal(signal.SIGINT) is handler
         captured = capsys.readouterr()
         assert "Authentication cancelled by user" in captured.err
 
-    @patch("subprocess.run")
-    def test_auth_generic_error(self, mock_run, capsys):
+    @patch("subprocess.Popen")
+    def test_auth_generic_error(self, mock_popen, capsys):
         """Test generic error during authentication."""
-        mock_run.side_effect = Exception("Generic error")
+        mock_popen.side_effect = Exception("Generic error")
 
         _run_auth_flow("https://example.com")
 
@@ -474,3 +569,18 @@ class TestPrintHelp:
         captured = capsys.readouterr()
         assert "MCP Remote app: test_app" in captured.out
         assert "Server: Not configured" in captured.out
+
+
+class TestLazyImports:
+    """The proxy client is only imported when a tool call needs it."""
+
+    def test_import_does_not_load_client(self):
+        code = (
+            "import sys, tasak.mcp_remote_runner as r; "
+            "print('tasak.mcp_remote_client' in sys.modules, "
+            "r.MCPRemoteClient.__module__)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.split() == ["False", "tasak.mcp_remote_client"]
@@ -104,3 +104,22 @@ def test_plugin_enabled_without_auto_enable(tmp_path, monkeypatch, capsys):
     tasak_main.main()
     out = capsys.readouterr().out
     assert "Hello World" in out
+
+
+def test_plugin_exec_replaces_process_on_tty(monkeypatch):
+    from tasak import python_plugins
+
+    calls = []
+    monkeypatch.setattr("tasak.app_runner._can_exec", lambda: True)
+    monkeypatch.setattr("tasak.app_runner.os.execvp", lambda *a: calls.append(a))
+    monkeypatch.setattr(
+        "tasak.app_runner._execute_command", lambda cmd: calls.append("piped")
+    )
+
+    python_plugins.run_python_plugin(
+        "myplugin",
+        {"plugin_path": "/plugins/myplugin.py", "python_executable": "py"},
+        ["--name", "Alice"],
+    )
+
+    assert calls == [("py", ["py", "/plugins/myplugin.py", "--name", "Alice"])]
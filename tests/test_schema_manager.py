@@ -1,9 +1,10 @@
 """Unit tests for schema_manager module."""
 
 import json
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
 
 
 from tasak.schema_manager import SchemaManager
@@ -19,9 +20,10 @@ class TestSchemaManager:
             mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
             assert manager.schema_dir == Path.home() / ".tasak" / "schemas"
 
-    @patch("builtins.open", new_callable=mock_open)
-    def test_save_schema(self, mock_file):
+    @patch("tasak.schema_manager.Path.home")
+    def test_save_schema(self, mock_home, tmp_path):
         """Test saving schema to disk."""
+        mock_home.return_value = tmp_path
         manager = SchemaManager()
         tools = [
             {
@@ -39,12 +41,10 @@ class TestSchemaManager:
         schema_file = manager.save_schema("test_app", tools)
 
         assert schema_file == manager.schema_dir / "test_app.json"
-        mock_file.assert_called_once()
+        assert [p.name for p in manager.schema_dir.iterdir()] == ["test_app.json"]
 
         # Check what was written
-        handle = mock_file()
-        written_data = "".join(call[0][0] for call in handle.write.call_args_list)
-        data = json.loads(written_data)
+        data = json.loads(schema_file.read_text())
 
         assert data["app"] == "test_app"
         assert "last_updated" in data
@@ -53,20 +53,19 @@ class TestSchemaManager:
         assert data["tools"]["tool1"]["description"] == "Test tool 1"
         assert "tool2" in data["tools"]
 
-    @patch("builtins.open", new_callable=mock_open)
-    def test_save_schema_with_missing_fields(self, mock_file):
+    @patch("tasak.schema_manager.Path.home")
+    def test_save_schema_with_missing_fields(self, mock_home, tmp_path):
         """Test saving schema with tools missing some fields."""
+        mock_home.return_value = tmp_path
         manager = SchemaManager()
         tools = [
             {"name": "tool1"},  # Missing description and input_schema
             {"description": "No name tool"},  # Missing name
         ]
 
-        manager.save_schema("test_app", tools)
+        schema_file = manager.save_schema("test_app", tools)
 
-        handle = mock_file()
-        written_data = "".join(call[0][0] for call in handle.write.call_args_list)
-        data = json.loads(written_data)
+        data = json.loads(schema_file.read_text())
 
         # Tool with name should be saved
         assert "tool1" in data["tools"]
@@ -76,16 +75,14 @@ class TestSchemaManager:
         # Tool without name should be skipped
         assert len(data["tools"]) == 1
 
-    @patch(
-        "builtins.open",
-        new_callable=mock_open,
-        read_data='{"app": "test_app", "tools": {}}',
-    )
-    @patch("tasak.schema_manager.Path.exists")
-    def test_load_schema_exists(self, mock_exists, mock_file):
+    @patch("tasak.schema_manager.Path.home")
+    def test_load_schema_exists(self, mock_home, tmp_path):
         """Test loading existing schema."""
-        mock_exists.return_value = True
+        mock_home.return_value = tmp_path
         manager = SchemaManager()
+        (manager.schema_dir / "test_app.json").write_text(
+            '{"app": "test_app", "tools": {}}'
+        )
 
         schema_data = manager.load_schema("test_app")
 
@@ -103,29 +100,27 @@ class TestSchemaManager:
 
         assert schema_data is None
 
-    @patch("builtins.open", new_callable=mock_open, read_data="invalid json")
-    @patch("tasak.schema_manager.Path.exists")
-    def test_load_schema_invalid_json(self, mock_exists, mock_file):
+    @patch("tasak.schema_manager.Path.home")
+    def test_load_schema_invalid_json(self, mock_home, tmp_path):
         """Test loading schema with invalid JSON."""
-        mock_exists.return_value = True
+        mock_home.return_value = tmp_path
         manager = SchemaManager()
+        (manager.schema_dir / "test_app.json").write_text("invalid json")
 
         schema_data = manager.load_schema("test_app")
 
         assert schema_data is None
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("tasak.schema_manager.Path.exists")
-    def test_get_schema_age_days(self, mock_exists, mock_file):
+    @patch("tasak.schema_manager.Path.home")
+    def test_get_schema_age_days(self, mock_home, tmp_path):
         """Test getting schema age in days."""
-        mock_exists.return_value = True
+        mock_home.return_value = tmp_path
+        manager = SchemaManager()
 
         # Create schema data with timestamp from 5 days ago
         past_time = datetime.now() - timedelta(days=5)
         schema_data = {"last_updated": past_time.isoformat()}
-        mock_file.return_value.read.return_value = json.dumps(schema_data)
-
-        manager = SchemaManager()
+        (manager.schema_dir / "test_app.json").write_text(json.dumps(schema_data))
         age = manager.get_schema_age_days("test_app")
 
         assert age == 5
@@ -140,17 +135,30 @@ class TestSchemaManager:
 
         assert age is None
 
-    @patch("builtins.open", new_callable=mock_open, read_data="{}")
-    @patch("tasak.schema_manager.Path.exists")
-    def test_get_schema_age_days_no_timestamp(self, mock_exists, mock_file):
+    @patch("tasak.schema_manager.Path.home")
+    def test_get_schema_age_days_no_timestamp(self, mock_home, tmp_path):
         """Test getting schema age when timestamp is missing."""
-        mock_exists.return_value = True
+        mock_home.return_value = tmp_path
         manager = SchemaManager()
+        (manager.schema_dir / "test_app.json").write_text("{}")
 
         age = manager.get_schema_age_days("test_app")
 
         assert age is None
 
+    def test_get_schema_age_days_from_loaded_data(self):
+        """Already-loaded schema data is used without reading the file."""
+        manager = SchemaManager()
+        past_time = datetime.now() - timedelta(days=3)
+
+        with patch.object(manager, "load_schema") as mock_load:
+            age = manager.get_schema_age_days(
+                "test_app", {"last_updated": past_time.isoformat()}
+            )
+
+        assert age == 3
+        mock_load.assert_not_called()
+
     @patch("tasak.schema_manager.Path.exists")
     def test_schema_exists(self, mock_exists):
         """Test checking if schema exists."""
@@ -242,3 +250,30 @@ class TestSchemaManager:
         assert tools[0]["name"] == "tool1"
         assert tools[0]["description"] == ""
         assert tools[0]["input_schema"] == {}
+
+    def test_load_schema_cached_until_file_changes(self, tmp_path):
+        """Repeated loads reuse the file contents until the file is rewritten."""
+        with patch("tasak.schema_manager.Path.home", return_value=tmp_path):
+            manager = SchemaManager()
+            manager.save_schema("cached_app", [{"name": "tool1"}])
+
+            first = manager.load_schema("cached_app")
+            with patch("tasak.schema_manager.Path.read_bytes") as mock_read:
+                second = manager.load_schema("cached_app")
+                assert manager.get_schema_age_days("cached_app") == 0
+                mock_read.assert_not_called()
+
+            # Each caller gets its own copy of the cached schema
+            assert second == first and second is not first
+            second["tools"]["tool1"]["description"] = "changed"
+            assert manager.load_schema("cached_app") == first
+
+            schema_file = manager.schema_dir / "cached_app.json"
+            st = schema_file.stat()
+            manager.save_schema("cached_app", [{"name": "tool1"}, {"name": "tool2"}])
+            os.utime(schema_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+            assert set(manager.load_schema("cached_app")["tools"]) == {
+                "tool1",
+                "tool2",
+            }
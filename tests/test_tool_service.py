@@ -0,0 +1,95 @@
+"""Unit tests for the cached config/token loaders in tool_service."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from tasak.core import tool_service
+from tasak.core.tool_service import ToolService, load_auth_tokens, load_mcp_config
+
+
+def _bump_mtime(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestLoadMcpConfig:
+    """Tests for load_mcp_config."""
+
+    def test_expands_env_and_caches(self, tmp_path, monkeypatch):
+        """Unchanged files are parsed once; edits are picked up."""
+        monkeypatch.setenv("TASAK_TEST_URL", "http://example/sse")
+        path = tmp_path / "mcp.json"
+        path.write_text('{"transport": "sse", "url": "${TASAK_TEST_URL}"}')
+
+        with patch("tasak.core.tool_service.loads", wraps=json.loads) as mock_loads:
+            first = load_mcp_config(str(path))
+            second = load_mcp_config(str(path))
+            assert mock_loads.call_count == 1
+
+            path.write_text('{"transport": "stdio"}')
+            _bump_mtime(path)
+            third = load_mcp_config(str(path))
+            assert mock_loads.call_count == 2
+
+        assert first == second == {"transport": "sse", "url": "http://example/sse"}
+        assert third == {"transport": "stdio"}
+
+    def test_expanded_values_are_not_reparsed(self, tmp_path, monkeypatch):
+        """Variables holding quotes or backslashes do not break the JSON."""
+        monkeypatch.setenv("TASAK_TEST_TOKEN", 'a"b\\c')
+        monkeypatch.setenv("TASAK_TEST_PORT", "8080")
+        path = tmp_path / "mcp.json"
+        path.write_text('{"env": {"TOKEN": "${TASAK_TEST_TOKEN}"}}')
+        assert load_mcp_config(str(path)) == {"env": {"TOKEN": 'a"b\\c'}}
+
+        path.write_text('{"port": ${TASAK_TEST_PORT}}')
+        _bump_mtime(path)
+        assert load_mcp_config(str(path)) == {"port": 8080}
+
+    def test_returns_independent_copies(self, tmp_path):
+        """Callers can replace top-level keys without touching the cache."""
+        path = tmp_path / "mcp.json"
+        path.write_text('{"transport": "sse", "headers": {}}')
+
+        load_mcp_config(str(path))["headers"] = {"Authorization": "x"}
+
+        assert load_mcp_config(str(path))["headers"] == {}
+
+    def test_missing_file_raises(self, tmp_path):
+        """A missing file surfaces as OSError."""
+        with pytest.raises(OSError):
+            load_mcp_config(str(tmp_path / "missing.json"))
+
+
+class TestAccessToken:
+    """Tests for token lookup through the cached auth file."""
+
+    def test_token_read_once_until_saved(self, tmp_path):
+        """auth.json is re-parsed only after it changes on disk."""
+        auth_file = tmp_path / "auth.json"
+        auth_file.write_text('{"app": {"access_token": "old"}}')
+        svc = ToolService(conn_mgr=object())
+
+        with (
+            patch.object(tool_service, "AUTH_FILE_PATH", auth_file),
+            patch(
+                "tasak.core.tool_service.read_json", wraps=tool_service.read_json
+            ) as mock_read,
+        ):
+            assert svc._get_access_token("app") == "old"
+            assert svc._get_access_token("app") == "old"
+            assert mock_read.call_count == 1
+
+            auth_file.write_text('{"app": {"access_token": "new"}}')
+            _bump_mtime(auth_file)
+            assert svc._get_access_token("app") == "new"
+            assert load_auth_tokens() == {"app": {"access_token": "new"}}
+
+    def test_missing_auth_file(self, tmp_path):
+        """Without auth.json there is no token."""
+        svc = ToolService(conn_mgr=object())
+        with patch.object(tool_service, "AUTH_FILE_PATH", tmp_path / "none.json"):
+            assert svc._get_access_token("app") is None